@@ -0,0 +1,23 @@
+-- Migration: Ordered Index for File Reconstruction
+-- Phase 5, Task 5.2
+-- Description: Serve get_file_content (WHERE source_id = ? AND file_path = ?,
+-- aggregated in chunk_index order) from one index range scan that already
+-- yields rows in chunk order, so string_agg needs no separate sort step.
+--
+-- content is not INCLUDEd: chunk text routinely exceeds the ~2.7 kB btree
+-- entry limit, and INCLUDE cannot hold expressions such as
+-- metadata->>'language', so an index-only scan is not attainable here.
+--
+-- CONCURRENTLY avoids blocking writes while the index builds, so this script
+-- must NOT be wrapped in a transaction; run each statement on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_source_file_order
+    ON knowledge_chunks(source_id, (metadata->>'file_path'), chunk_index);
+
+-- (source_id, file_path) is a prefix of the new index, which also serves the
+-- per-file deletes and list_project_files, so the old index is redundant.
+DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_source_file;
+
+-- Rollback
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_source_file ON knowledge_chunks(source_id, (metadata->>'file_path'));
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_source_file_order;
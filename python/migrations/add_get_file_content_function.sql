@@ -0,0 +1,40 @@
+-- Migration: Add get_file_content database function
+-- File: migrations/add_get_file_content_function.sql
+-- Purpose: Reassemble a file from its chunks server-side, so only the text
+-- (not every chunk's embedding and metadata) is sent to the client.
+-- first_chunk/max_chunks select a window of chunks so large files can be
+-- paged instead of built and sent in one piece.
+-- Requires reconcile_knowledge_chunks_columns.sql (content column).
+
+DROP FUNCTION IF EXISTS get_file_content(TEXT, TEXT);
+
+CREATE OR REPLACE FUNCTION get_file_content(
+    src_id TEXT,
+    fpath TEXT,
+    first_chunk INT DEFAULT 0,
+    max_chunks INT DEFAULT NULL
+)
+RETURNS TABLE(content TEXT, language TEXT, chunks_count INTEGER, total_chunks INTEGER) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        string_agg(c.content, E'\n' ORDER BY c.idx) FILTER (WHERE c.in_window),
+        MIN(c.language),
+        (COUNT(*) FILTER (WHERE c.in_window))::int,
+        COUNT(*)::int
+    FROM (
+        SELECT
+            kc.content,
+            kc.metadata->>'language' AS language,
+            kc.chunk_index AS idx,
+            kc.chunk_index >= first_chunk
+                AND (max_chunks IS NULL OR kc.chunk_index < first_chunk + max_chunks)
+                AS in_window
+        FROM knowledge_chunks kc
+        WHERE kc.source_id = src_id
+        AND kc.metadata->>'file_path' = fpath
+    ) c;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION get_file_content IS 'Reconstruct file content (optionally a window of chunks) from knowledge_chunks in chunk order';
@@ -0,0 +1,40 @@
+-- Migration: Add get_or_create_codebase_source database function
+-- File: migrations/add_get_or_create_codebase_source_function.sql
+-- Purpose: Resolve or create a project's codebase source in one atomic
+-- statement, so concurrent first syncs cannot insert duplicate sources
+--
+-- Remove any existing duplicate codebase sources before running: the unique
+-- index cannot be built while two rows share a project_id.
+
+CREATE UNIQUE INDEX IF NOT EXISTS archon_sources_project_id_idx
+ON archon_sources ((metadata->>'project_id'))
+WHERE metadata->>'source_type' = 'codebase';
+
+CREATE OR REPLACE FUNCTION get_or_create_codebase_source(pid TEXT, project_title TEXT)
+RETURNS TABLE(source_id TEXT, created BOOLEAN) AS $$
+BEGIN
+    RETURN QUERY
+    INSERT INTO archon_sources AS s (
+        source_id, source_url, source_display_name, title, summary, metadata
+    )
+    VALUES (
+        gen_random_uuid()::text,
+        'project://' || pid,
+        project_title || ' (Codebase)',
+        project_title || ' Codebase',
+        'Codebase for project ' || project_title,
+        jsonb_build_object(
+            'project_id', pid,
+            'auto_synced', true,
+            'source_type', 'codebase',
+            'created_at', to_char(NOW(), 'YYYY-MM-DD"T"HH24:MI:SS.US')
+        )
+    )
+    ON CONFLICT ((metadata->>'project_id')) WHERE metadata->>'source_type' = 'codebase'
+    -- No-op update so RETURNING also yields the existing row
+    DO UPDATE SET metadata = s.metadata
+    RETURNING s.source_id, (xmax = 0);
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION get_or_create_codebase_source IS 'Atomically return the codebase source for a project, creating it if missing';
@@ -0,0 +1,19 @@
+-- Migration: Add list_project_files database function
+-- File: migrations/add_list_project_files_function.sql
+-- Purpose: List distinct file paths in a codebase source, optionally filtered
+-- by a LIKE pattern, without sending one row per chunk to the client
+
+CREATE OR REPLACE FUNCTION list_project_files(src_id TEXT, pattern TEXT DEFAULT NULL)
+RETURNS TABLE(file_path TEXT) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT DISTINCT kc.metadata->>'file_path'
+    FROM knowledge_chunks kc
+    WHERE kc.source_id = src_id
+    AND kc.metadata->>'file_path' IS NOT NULL
+    AND (pattern IS NULL OR kc.metadata->>'file_path' LIKE pattern)
+    ORDER BY 1;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION list_project_files IS 'Distinct file paths in a codebase source, optionally matching a LIKE pattern';
@@ -0,0 +1,72 @@
+-- Migration: Add project_code_search database function
+-- File: migrations/add_project_code_search_function.sql
+-- Purpose: Run project code search (file/language/recency filters plus vector
+-- ranking) as one server-side query instead of a client-built filter chain
+-- Requires reconcile_knowledge_chunks_columns.sql (content column).
+
+CREATE OR REPLACE FUNCTION project_code_search(
+    src_id TEXT,
+    query_embedding VECTOR DEFAULT NULL,
+    file_like TEXT DEFAULT NULL,
+    lang TEXT DEFAULT NULL,
+    since TIMESTAMPTZ DEFAULT NULL,
+    match_limit INT DEFAULT 5
+)
+RETURNS TABLE(
+    id UUID,
+    file_path TEXT,
+    chunk_index INT,
+    content TEXT,
+    start_line INT,
+    end_line INT,
+    language TEXT,
+    updated_at TIMESTAMPTZ,
+    similarity FLOAT
+) AS $$
+BEGIN
+    IF query_embedding IS NULL THEN
+        -- Filter-only search: no vector to rank by, newest chunks first
+        RETURN QUERY
+        SELECT
+            kc.id,
+            kc.metadata->>'file_path',
+            kc.chunk_index,
+            kc.content,
+            (kc.metadata->>'start_line')::int,
+            (kc.metadata->>'end_line')::int,
+            kc.metadata->>'language',
+            kc.updated_at,
+            NULL::float
+        FROM knowledge_chunks kc
+        WHERE kc.source_id = src_id
+        AND (file_like IS NULL OR kc.metadata->>'file_path' LIKE file_like)
+        AND (lang IS NULL OR kc.metadata->>'language' = lang)
+        AND (since IS NULL OR kc.updated_at >= since)
+        ORDER BY kc.updated_at DESC
+        LIMIT match_limit;
+    ELSE
+        -- ORDER BY must be the bare distance expression for pgvector to use
+        -- idx_chunks_embedding_ivfflat instead of sorting every matching row
+        RETURN QUERY
+        SELECT
+            kc.id,
+            kc.metadata->>'file_path',
+            kc.chunk_index,
+            kc.content,
+            (kc.metadata->>'start_line')::int,
+            (kc.metadata->>'end_line')::int,
+            kc.metadata->>'language',
+            kc.updated_at,
+            1 - (kc.embedding <=> query_embedding)
+        FROM knowledge_chunks kc
+        WHERE kc.source_id = src_id
+        AND (file_like IS NULL OR kc.metadata->>'file_path' LIKE file_like)
+        AND (lang IS NULL OR kc.metadata->>'language' = lang)
+        AND (since IS NULL OR kc.updated_at >= since)
+        ORDER BY kc.embedding <=> query_embedding
+        LIMIT match_limit;
+    END IF;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION project_code_search IS 'Filtered, vector-ranked code search within one codebase source';
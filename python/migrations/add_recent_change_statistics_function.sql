@@ -0,0 +1,38 @@
+-- Migration: Add recent_change_statistics database function
+-- File: migrations/add_recent_change_statistics_function.sql
+-- Purpose: Summarize a codebase source's recent chunk changes server-side, so
+-- change statistics read one JSONB document instead of every changed chunk
+
+CREATE OR REPLACE FUNCTION recent_change_statistics(src_id TEXT, since TIMESTAMPTZ)
+RETURNS JSONB AS $$
+    WITH recent AS (
+        SELECT
+            kc.metadata->>'file_path' AS file_path,
+            COALESCE(kc.metadata->>'language', 'unknown') AS language,
+            kc.updated_at
+        FROM knowledge_chunks kc
+        WHERE kc.source_id = src_id
+        AND kc.updated_at >= since
+    )
+    SELECT jsonb_build_object(
+        'total_files_changed', (SELECT COUNT(DISTINCT file_path) FROM recent),
+        'total_chunks_updated', (SELECT COUNT(*) FROM recent),
+        'language_breakdown', COALESCE(
+            (SELECT jsonb_object_agg(language, n)
+             FROM (SELECT language, COUNT(*) AS n FROM recent GROUP BY language) l),
+            '{}'::jsonb
+        ),
+        -- Days in the session time zone, as the ISO timestamps PostgREST returns
+        'changes_by_date', COALESCE(
+            (SELECT jsonb_object_agg(day, n)
+             FROM (
+                 SELECT to_char(updated_at, 'YYYY-MM-DD') AS day, COUNT(*) AS n
+                 FROM recent
+                 GROUP BY 1
+             ) d),
+            '{}'::jsonb
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION recent_change_statistics IS 'Changed file and chunk totals, per-language and per-day chunk counts for a codebase source since a cutoff';
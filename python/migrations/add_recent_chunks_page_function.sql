@@ -0,0 +1,57 @@
+-- Migration: Add recent_chunks_page database function
+-- File: migrations/add_recent_chunks_page_function.sql
+-- Purpose: Page recently updated chunks in (file_path, id) order by keyset,
+-- for streaming recent changes one file at a time. Each call seeks past the
+-- last row of the previous page instead of re-reading earlier rows.
+--
+-- The index below yields rows already in (file_path, id) order, so a page is
+-- one range scan from the keyset onwards that stops after page_size matches;
+-- no page sorts the whole window. Chunks older than the window are skipped
+-- by filter during the scan.
+--
+-- CONCURRENTLY avoids blocking writes while the index builds, so this script
+-- must NOT be wrapped in a transaction; run each statement on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_source_file_id
+    ON knowledge_chunks(source_id, (metadata->>'file_path'), id);
+
+CREATE OR REPLACE FUNCTION recent_chunks_page(
+    src_id TEXT,
+    since TIMESTAMPTZ,
+    file_like TEXT DEFAULT NULL,
+    after_path TEXT DEFAULT NULL,
+    after_id UUID DEFAULT NULL,
+    page_size INTEGER DEFAULT 1000
+)
+RETURNS TABLE(id UUID, file_path TEXT, language TEXT, updated_at TIMESTAMPTZ) AS $$
+BEGIN
+    -- Separate statements so the keyset is an index condition rather than
+    -- an OR the planner can only apply as a filter
+    IF after_path IS NULL THEN
+        RETURN QUERY
+        SELECT kc.id, kc.metadata->>'file_path', kc.metadata->>'language', kc.updated_at
+        FROM knowledge_chunks kc
+        WHERE kc.source_id = src_id
+        AND kc.updated_at >= since
+        AND (file_like IS NULL OR kc.metadata->>'file_path' LIKE file_like)
+        ORDER BY kc.metadata->>'file_path', kc.id
+        LIMIT page_size;
+    ELSE
+        RETURN QUERY
+        SELECT kc.id, kc.metadata->>'file_path', kc.metadata->>'language', kc.updated_at
+        FROM knowledge_chunks kc
+        WHERE kc.source_id = src_id
+        AND (kc.metadata->>'file_path', kc.id) > (after_path, after_id)
+        AND kc.updated_at >= since
+        AND (file_like IS NULL OR kc.metadata->>'file_path' LIKE file_like)
+        ORDER BY kc.metadata->>'file_path', kc.id
+        LIMIT page_size;
+    END IF;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION recent_chunks_page IS 'One keyset page of chunks changed since a time, ordered by file path then id';
+
+-- Rollback
+-- DROP FUNCTION IF EXISTS recent_chunks_page(TEXT, TIMESTAMPTZ, TEXT, TEXT, UUID, INTEGER);
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_source_file_id;
@@ -0,0 +1,33 @@
+-- Migration: Add recent_file_changes database function
+-- File: migrations/add_recent_file_changes_function.sql
+-- Purpose: Group recently updated chunks by file server-side, returning one
+-- row per file instead of every chunk in the window. until bounds the window
+-- for date-range queries.
+
+DROP FUNCTION IF EXISTS recent_file_changes(TEXT, TIMESTAMPTZ, TEXT);
+
+CREATE OR REPLACE FUNCTION recent_file_changes(
+    src_id TEXT,
+    since TIMESTAMPTZ,
+    file_like TEXT DEFAULT NULL,
+    until TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS TABLE(file_path TEXT, language TEXT, last_updated TIMESTAMPTZ, chunk_count INTEGER) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        kc.metadata->>'file_path',
+        MAX(kc.metadata->>'language'),
+        MAX(kc.updated_at),
+        COUNT(*)::int
+    FROM knowledge_chunks kc
+    WHERE kc.source_id = src_id
+    AND kc.updated_at >= since
+    AND (until IS NULL OR kc.updated_at <= until)
+    AND (file_like IS NULL OR kc.metadata->>'file_path' LIKE file_like)
+    GROUP BY kc.metadata->>'file_path'
+    ORDER BY 3 DESC;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION recent_file_changes IS 'Per-file chunk count and latest update for chunks changed within a time window';
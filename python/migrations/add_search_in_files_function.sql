@@ -0,0 +1,34 @@
+-- Migration: Add search_in_files database function
+-- File: migrations/add_search_in_files_function.sql
+-- Purpose: Return the best per_file chunks from each requested file, ranked by
+-- vector distance (chunk order when no query embedding is given)
+
+CREATE OR REPLACE FUNCTION search_in_files(
+    src_id TEXT,
+    file_paths TEXT[],
+    query_embedding VECTOR DEFAULT NULL,
+    per_file INT DEFAULT 5
+)
+RETURNS SETOF knowledge_chunks AS $$
+BEGIN
+    RETURN QUERY
+    SELECT (ranked.kc).*
+    FROM (
+        SELECT
+            kc,
+            ROW_NUMBER() OVER (
+                PARTITION BY kc.metadata->>'file_path'
+                ORDER BY
+                    CASE WHEN query_embedding IS NULL THEN NULL
+                         ELSE kc.embedding <=> query_embedding END,
+                    kc.chunk_index
+            ) AS rn
+        FROM knowledge_chunks kc
+        WHERE kc.source_id = src_id
+        AND kc.metadata->>'file_path' = ANY(file_paths)
+    ) ranked
+    WHERE ranked.rn <= per_file;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION search_in_files IS 'Top per_file chunks from each listed file of a codebase source';
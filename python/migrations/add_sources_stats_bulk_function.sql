@@ -0,0 +1,21 @@
+-- Migration: Add sources_stats_bulk database function
+-- File: migrations/add_sources_stats_bulk_function.sql
+-- Purpose: File count, chunk count and last update for many codebase sources
+-- in one grouped query, for dashboards that show sync status per project
+
+CREATE OR REPLACE FUNCTION sources_stats_bulk(src_ids TEXT[])
+RETURNS TABLE(source_id TEXT, total_files INTEGER, total_chunks INTEGER, last_update TIMESTAMPTZ) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        kc.source_id,
+        COUNT(DISTINCT kc.metadata->>'file_path')::int,
+        COUNT(*)::int,
+        MAX(kc.created_at)
+    FROM knowledge_chunks kc
+    WHERE kc.source_id = ANY(src_ids)
+    GROUP BY kc.source_id;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION sources_stats_bulk IS 'Per-source file count, chunk count and latest chunk timestamp for a set of codebase sources';
@@ -0,0 +1,47 @@
+-- Migration: Add sync_error_stats database function
+-- Phase 5, Task 5.6
+-- Aggregate a project's sync errors server-side so error analytics read one
+-- JSONB document instead of every operation in the window.
+
+CREATE OR REPLACE FUNCTION sync_error_stats(pid UUID, num_days INT)
+RETURNS JSONB AS $$
+    WITH ops AS (
+        SELECT trigger, status, error_message
+        FROM sync_operations
+        WHERE project_id = pid
+        AND started_at >= NOW() - make_interval(days => num_days)
+    ),
+    failed AS (
+        SELECT
+            trigger,
+            -- Same truncation as the API: first 100 characters plus an ellipsis
+            CASE WHEN length(msg) > 100 THEN left(msg, 100) || '...' ELSE msg END AS message
+        FROM (
+            SELECT trigger, COALESCE(error_message, 'Unknown error') AS msg
+            FROM ops
+            WHERE status = 'error'
+        ) f
+    )
+    SELECT jsonb_build_object(
+        'total_operations', (SELECT COUNT(*) FROM ops),
+        'total_errors', (SELECT COUNT(*) FROM failed),
+        'errors_by_trigger', COALESCE(
+            (SELECT jsonb_object_agg(trigger, n)
+             FROM (SELECT trigger, COUNT(*) AS n FROM failed GROUP BY trigger) t),
+            '{}'::jsonb
+        ),
+        'common_errors', COALESCE(
+            (SELECT jsonb_agg(jsonb_build_object('message', message, 'count', n) ORDER BY n DESC)
+             FROM (
+                 SELECT message, COUNT(*) AS n
+                 FROM failed
+                 GROUP BY message
+                 ORDER BY n DESC
+                 LIMIT 5
+             ) e),
+            '[]'::jsonb
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION sync_error_stats IS 'Error totals, per-trigger counts and top 5 messages for a project''s recent sync operations';
@@ -0,0 +1,108 @@
+-- Add Daily Rollup of Sync Operations for Analytics
+-- Phase 5, Task 5.6
+-- Per-project, per-day (UTC) counters kept current by a trigger on sync_operations,
+-- so performance and growth analytics read one row per day instead of every operation.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS sync_operations_daily (
+    project_id UUID NOT NULL REFERENCES archon_projects(id) ON DELETE CASCADE,
+    date DATE NOT NULL,
+    syncs_count INT NOT NULL DEFAULT 0,
+    successful INT NOT NULL DEFAULT 0,
+    failed INT NOT NULL DEFAULT 0,
+    -- File/chunk counters and durations cover successful syncs only
+    files_processed BIGINT NOT NULL DEFAULT 0,
+    chunks_added BIGINT NOT NULL DEFAULT 0,
+    chunks_modified BIGINT NOT NULL DEFAULT 0,
+    chunks_deleted BIGINT NOT NULL DEFAULT 0,
+    total_duration_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    timed_syncs INT NOT NULL DEFAULT 0,
+    syncs_by_trigger JSONB NOT NULL DEFAULT '{}'::jsonb,
+    errors_by_trigger JSONB NOT NULL DEFAULT '{}'::jsonb,
+    PRIMARY KEY (project_id, date)
+);
+
+-- Add (delta = 1) or remove (delta = -1) one operation's contribution to its day
+CREATE OR REPLACE FUNCTION apply_sync_operation_to_daily(op sync_operations, delta INT)
+RETURNS VOID AS $$
+DECLARE
+    is_success BOOLEAN := op.status = 'success';
+    is_error BOOLEAN := op.status = 'error';
+    is_timed BOOLEAN := op.status = 'success' AND COALESCE(op.duration_seconds, 0) > 0;
+BEGIN
+    INSERT INTO sync_operations_daily AS d (
+        project_id, date, syncs_count, successful, failed,
+        files_processed, chunks_added, chunks_modified, chunks_deleted,
+        total_duration_seconds, timed_syncs, syncs_by_trigger, errors_by_trigger
+    )
+    VALUES (
+        op.project_id,
+        (op.started_at AT TIME ZONE 'UTC')::date,
+        delta,
+        CASE WHEN is_success THEN delta ELSE 0 END,
+        CASE WHEN is_error THEN delta ELSE 0 END,
+        CASE WHEN is_success THEN delta * COALESCE(op.files_processed, 0) ELSE 0 END,
+        CASE WHEN is_success THEN delta * COALESCE(op.chunks_added, 0) ELSE 0 END,
+        CASE WHEN is_success THEN delta * COALESCE(op.chunks_modified, 0) ELSE 0 END,
+        CASE WHEN is_success THEN delta * COALESCE(op.chunks_deleted, 0) ELSE 0 END,
+        CASE WHEN is_timed THEN delta * op.duration_seconds ELSE 0 END,
+        CASE WHEN is_timed THEN delta ELSE 0 END,
+        jsonb_build_object(op.trigger, delta),
+        CASE WHEN is_error THEN jsonb_build_object(op.trigger, delta) ELSE '{}'::jsonb END
+    )
+    ON CONFLICT (project_id, date) DO UPDATE SET
+        syncs_count = d.syncs_count + EXCLUDED.syncs_count,
+        successful = d.successful + EXCLUDED.successful,
+        failed = d.failed + EXCLUDED.failed,
+        files_processed = d.files_processed + EXCLUDED.files_processed,
+        chunks_added = d.chunks_added + EXCLUDED.chunks_added,
+        chunks_modified = d.chunks_modified + EXCLUDED.chunks_modified,
+        chunks_deleted = d.chunks_deleted + EXCLUDED.chunks_deleted,
+        total_duration_seconds = d.total_duration_seconds + EXCLUDED.total_duration_seconds,
+        timed_syncs = d.timed_syncs + EXCLUDED.timed_syncs,
+        syncs_by_trigger = d.syncs_by_trigger || jsonb_build_object(
+            op.trigger, COALESCE((d.syncs_by_trigger->>op.trigger)::int, 0) + delta
+        ),
+        errors_by_trigger = CASE
+            WHEN is_error THEN d.errors_by_trigger || jsonb_build_object(
+                op.trigger, COALESCE((d.errors_by_trigger->>op.trigger)::int, 0) + delta
+            )
+            ELSE d.errors_by_trigger
+        END;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_operations_daily_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_sync_operation_to_daily(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_sync_operation_to_daily(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Block writers while backfilling so no operation is counted twice or missed
+LOCK TABLE sync_operations IN SHARE MODE;
+
+TRUNCATE sync_operations_daily;
+SELECT apply_sync_operation_to_daily(o, 1) FROM sync_operations o;
+
+DROP TRIGGER IF EXISTS trg_sync_operations_daily ON sync_operations;
+CREATE TRIGGER trg_sync_operations_daily
+    AFTER INSERT OR UPDATE OR DELETE ON sync_operations
+    FOR EACH ROW EXECUTE FUNCTION sync_operations_daily_trigger();
+
+COMMENT ON TABLE sync_operations_daily IS 'Daily per-project rollup of sync_operations, maintained by trigger';
+
+COMMIT;
+
+-- Rollback
+-- DROP TRIGGER IF EXISTS trg_sync_operations_daily ON sync_operations;
+-- DROP FUNCTION IF EXISTS sync_operations_daily_trigger();
+-- DROP FUNCTION IF EXISTS apply_sync_operation_to_daily(sync_operations, INT);
+-- DROP TABLE IF EXISTS sync_operations_daily;
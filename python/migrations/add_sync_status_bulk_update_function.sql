@@ -0,0 +1,31 @@
+-- Migration: Add sync_status_bulk_update database function
+-- File: migrations/add_sync_status_bulk_update_function.sql
+-- Purpose: Record the sync status of many projects in one UPDATE, for batch
+-- syncs that would otherwise issue one update per project
+
+CREATE OR REPLACE FUNCTION sync_status_bulk_update(p JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE projects AS pr
+    SET
+        sync_status = u.status,
+        updated_at = NOW(),
+        last_sync_at = COALESCE(u.last_sync_at, pr.last_sync_at),
+        -- Same rules as update_project_sync_status: keep a new error, clear
+        -- the old one on success, otherwise leave it alone
+        last_sync_error = CASE
+            WHEN u.error IS NOT NULL AND u.error <> '' THEN u.error
+            WHEN u.status = 'synced' THEN NULL
+            ELSE pr.last_sync_error
+        END
+    FROM jsonb_to_recordset(p) AS u(id UUID, status TEXT, last_sync_at TIMESTAMP, error TEXT)
+    WHERE pr.id = u.id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+COMMENT ON FUNCTION sync_status_bulk_update IS 'Set sync_status, last_sync_at and last_sync_error for a batch of projects given as [{id, status, last_sync_at, error}]';
@@ -0,0 +1,20 @@
+-- Migration: Composite Index for Task Lookups by File
+-- Phase 5, Task 5.1
+-- Description: Serve get_tasks_for_file (WHERE project_id = ? AND file_path = ?
+-- ORDER BY created_at DESC) from a single index range scan instead of scanning
+-- every relationship in the project and filtering by path.
+--
+-- CONCURRENTLY avoids blocking writes while the index builds, so this script
+-- must NOT be wrapped in a transaction; run each statement on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_file_project_path
+    ON task_file_relationships(project_id, file_path, created_at DESC);
+
+-- project_id is the leading column of the composite index, which covers
+-- project-only lookups, so the single-column index is now redundant write cost.
+-- idx_task_file_task_id stays: get_files_for_task filters by task_id alone.
+DROP INDEX CONCURRENTLY IF EXISTS idx_task_file_project_id;
+
+-- Rollback
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_file_project_id ON task_file_relationships(project_id);
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_task_file_project_path;
@@ -0,0 +1,30 @@
+-- Migration: Reconcile knowledge_chunks columns with the sync writer
+-- Purpose: create_knowledge_chunks_table.sql named the text column chunk_text,
+-- while IncrementalSyncService inserts `content` and every reader (search,
+-- get_file_content, search_in_files) selects `content`. Rename the column so
+-- inserts and the SQL functions agree with the table. chunk_index stays a
+-- real column; the writer sets it alongside metadata->>'chunk_index'.
+-- Date: 2025-11-12
+--
+-- Run before add_get_file_content_function.sql, add_project_code_search_function.sql,
+-- add_search_in_files_function.sql and add_chunks_file_order_index.sql.
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'knowledge_chunks' AND column_name = 'chunk_text'
+    ) AND NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'knowledge_chunks' AND column_name = 'content'
+    ) THEN
+        ALTER TABLE knowledge_chunks RENAME COLUMN chunk_text TO content;
+    END IF;
+END $$;
+
+COMMIT;
+
+-- Rollback
+-- ALTER TABLE knowledge_chunks RENAME COLUMN content TO chunk_text;
@@ -6,18 +6,21 @@ Provides endpoints for managing git hooks in project repositories.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Header, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from server.services.sync.git_hook_installer import GitHookInstaller
 from server.services.sync.hook_renderer import HookRenderer
 from server.services.project_service import ProjectService
+from server.utils.etag_utils import check_etag
 
 logger = logging.getLogger(__name__)
 
 # Create router
-router = APIRouter(prefix="/projects", tags=["git-hooks"])
+router = APIRouter(prefix="/projects", tags=["git-hooks"], default_response_class=ORJSONResponse)
 
 
 # Pydantic Models
@@ -79,13 +82,15 @@ class GitHookStatusResponse(BaseModel):
 
 # Dependency Injection
 
+@lru_cache(maxsize=1)
 def get_hook_installer() -> GitHookInstaller:
-    """Dependency for GitHookInstaller."""
+    """Dependency for GitHookInstaller (shared so its validation cache persists)."""
     return GitHookInstaller()
 
 
+@lru_cache(maxsize=1)
 def get_hook_renderer() -> HookRenderer:
-    """Dependency for HookRenderer."""
+    """Dependency for HookRenderer (shared so its template cache persists)."""
     return HookRenderer()
 
 
@@ -172,7 +177,7 @@ async def install_git_hook(
             chain_existing=request.chain_existing
         )
 
-        logger.info(f"Installed git hook for project {project_id}")
+        logger.info("Installed git hook for project %s", project_id)
 
         return GitHookInstallResponse(
             success=True,
@@ -186,7 +191,7 @@ async def install_git_hook(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to install git hook: {e}")
+        logger.error("Failed to install git hook: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to install git hook: {str(e)}"
@@ -246,7 +251,7 @@ async def uninstall_git_hook(
             restore_backup=request.restore_backup
         )
 
-        logger.info(f"Uninstalled git hook for project {project_id}")
+        logger.info("Uninstalled git hook for project %s", project_id)
 
         return GitHookUninstallResponse(
             success=True,
@@ -259,7 +264,7 @@ async def uninstall_git_hook(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to uninstall git hook: {e}")
+        logger.error("Failed to uninstall git hook: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to uninstall git hook: {str(e)}"
@@ -274,19 +279,26 @@ async def uninstall_git_hook(
 )
 async def get_git_hook_status(
     project_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     installer: GitHookInstaller = Depends(get_hook_installer),
     project_service: ProjectService = Depends(get_project_service)
 ) -> GitHookStatusResponse:
     """
     Get the status of the git hook for a project.
 
+    Supports conditional polling: installed hooks carry an ETag derived from
+    the hook file's size and mtime, and a matching If-None-Match returns 304.
+
     Args:
         project_id: UUID of the project
+        response: Response used to set caching headers
+        if_none_match: ETag from a previous status response
         installer: GitHookInstaller dependency
         project_service: ProjectService dependency
 
     Returns:
-        Hook status information
+        Hook status information, or 304 Not Modified if unchanged
 
     Raises:
         HTTPException: If status check fails
@@ -318,6 +330,16 @@ async def get_git_hook_status(
             hook_name="post-commit"
         )
 
+        current_etag = result.get("etag")
+        if current_etag:
+            if check_etag(if_none_match, current_etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": current_etag, "Cache-Control": "no-cache, must-revalidate"}
+                )
+            response.headers["ETag"] = current_etag
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+
         return GitHookStatusResponse(
             installed=result.get("installed", False),
             hook_path=result.get("hook_path"),
@@ -330,7 +352,7 @@ async def get_git_hook_status(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get git hook status: {e}")
+        logger.error("Failed to get git hook status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get git hook status: {str(e)}"
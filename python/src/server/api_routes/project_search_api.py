@@ -5,16 +5,31 @@ Phase 5, Task 5.3
 FastAPI endpoints for project-scoped code search.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
 
 from src.server.config.logfire_config import get_logger
-from src.server.services.search.project_code_search import ProjectCodeSearchService
-from src.server.utils import get_supabase_client
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/projects", tags=["project-search"])
+router = APIRouter(prefix="/projects", tags=["project-search"], default_response_class=ORJSONResponse)
+
+
+@lru_cache(maxsize=1)
+def _get_search_service():
+    """
+    Get the shared ProjectCodeSearchService instance.
+
+    The service (and the Supabase/embedding stack behind it) is imported on
+    first use rather than at module load to keep worker startup fast, then
+    reused so requests don't each build a Supabase client.
+    """
+    from src.server.services.search.project_code_search import ProjectCodeSearchService
+    from src.server.utils import get_supabase_client
+
+    return ProjectCodeSearchService(get_supabase_client())
 
 
 # Pydantic models
@@ -48,6 +63,10 @@ class SearchResult(BaseModel):
     similarity: float
 
 
+# Validates/serializes a whole result list in one pass instead of per-item
+_SEARCH_RESULTS_ADAPTER = TypeAdapter(List[SearchResult])
+
+
 class RecentChange(BaseModel):
     """Response model for recent change"""
 
@@ -72,26 +91,43 @@ async def search_project_code(project_id: str, request: SearchCodeRequest):
     Raises:
         HTTPException: If search fails
     """
+    # Deferred like the service itself: importing services.search loads the RAG stack
+    from src.server.services.search.project_search_cache import project_search_cache
+
     try:
-        db = get_supabase_client()
-        service = ProjectCodeSearchService(db)
-
-        results = await service.search(
-            project_id=project_id,
-            query=request.query,
-            match_count=request.match_count,
-            file_filter=request.file_filter,
-            language_filter=request.language_filter,
-            recency_days=request.recency_days,
+        search_params = (
+            request.query,
+            request.match_count,
+            request.file_filter,
+            request.language_filter,
+            request.recency_days,
         )
 
-        return results
+        # Repeated identical searches are served from memory until the next sync
+        results = project_search_cache.get(project_id, search_params)
+        if results is None:
+            service = _get_search_service()
+
+            results = await service.search(
+                project_id=project_id,
+                query=request.query,
+                match_count=request.match_count,
+                file_filter=request.file_filter,
+                language_filter=request.language_filter,
+                recency_days=request.recency_days,
+            )
+            project_search_cache.set(project_id, search_params, results)
+
+        # Validate the batch once, then return the response directly so FastAPI
+        # skips its own pass against response_model (kept for the OpenAPI schema)
+        validated = _SEARCH_RESULTS_ADAPTER.validate_python(results)
+        return ORJSONResponse(_SEARCH_RESULTS_ADAPTER.dump_python(validated, mode="json"))
 
     except ValueError as e:
-        logger.error(f"Validation error searching code: {str(e)}")
+        logger.error("Validation error searching code: %s", e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Error searching project code: {str(e)}")
+        logger.error("Error searching project code: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to search project code: {str(e)}",
@@ -117,18 +153,17 @@ async def get_recent_changes(
         HTTPException: If query fails
     """
     try:
-        db = get_supabase_client()
-        service = ProjectCodeSearchService(db)
+        service = _get_search_service()
 
         results = await service.get_recent_changes(project_id=project_id, days=days)
 
-        return results
+        return ORJSONResponse(results)
 
     except ValueError as e:
-        logger.error(f"Validation error getting recent changes: {str(e)}")
+        logger.error("Validation error getting recent changes: %s", e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Error getting recent changes: {str(e)}")
+        logger.error("Error getting recent changes: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get recent changes: {str(e)}",
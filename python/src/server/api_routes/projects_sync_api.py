@@ -4,16 +4,86 @@ Phase 1, Task 1.3
 API endpoints for managing project sync configuration
 """
 
-from typing import Optional, List, Dict
+from typing import AsyncIterator, Optional, List, Dict, Tuple
+from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Query, Depends
+from functools import lru_cache
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
+import asyncio
 import uuid
 import logging
 
+import orjson
+
+from ..services.knowledge.codebase_source_service import CodebaseSourceService
+from ..services.projects.project_service_sync import SyncProjectService
+from ..utils import get_supabase_client
+
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+class _ProjectSyncLock:
+    """A project's sync lock and the number of triggers holding or waiting for it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+# Concurrent sync triggers for the same project (e.g. a burst of git-hook POSTs
+# during a rebase) run one at a time; a trigger whose files are already covered
+# by the in-flight sync awaits that sync's result instead of starting another.
+# Entries exist only while a sync for the project is running or waiting.
+_project_sync_locks: Dict[str, _ProjectSyncLock] = {}
+
+# project_id -> (files being synced, None for a full sync; future for its response)
+_pending_syncs: Dict[str, Tuple[Optional[frozenset], asyncio.Future]] = {}
+
+
+# ============================================================================
+# Dependencies
+# ============================================================================
+
+# Providers are cached so FastAPI resolves each dependency to one shared instance
+# per worker instead of constructing services (and Supabase clients) per request.
+
+@lru_cache(maxsize=1)
+def get_db_client():
+    """Dependency for the shared Supabase client."""
+    return get_supabase_client()
+
+
+@lru_cache(maxsize=1)
+def get_project_service() -> SyncProjectService:
+    """Dependency for the project service with sync methods."""
+    return SyncProjectService(get_db_client())
+
+
+@lru_cache(maxsize=1)
+def get_codebase_source_service() -> CodebaseSourceService:
+    """Dependency for CodebaseSourceService."""
+    return CodebaseSourceService(get_db_client())
+
+
+class SyncEmbeddingService:
+    """Adapts the embedding module functions to the embed() interface used by sync."""
+
+    async def embed(self, text: str) -> List[float]:
+        from ..services.embeddings import create_embedding
+
+        return await create_embedding(text)
+
+
+@lru_cache(maxsize=1)
+def get_embedding_service() -> SyncEmbeddingService:
+    """Dependency for the sync embedding service."""
+    return SyncEmbeddingService()
 
 
 # ============================================================================
@@ -83,12 +153,12 @@ class TriggerSyncResponse(BaseModel):
 # API Endpoints
 # ============================================================================
 
-@router.put("/projects/{project_id}/sync/config", response_model=SyncConfigResponse)
+@router.put("/projects/{project_id}/sync/config", responses={200: {"model": SyncConfigResponse}})
 async def update_project_sync_config(
     project_id: str,
     request: UpdateSyncConfigRequest,
-    project_service = Depends()  # Inject project_service dependency
-) -> Dict:
+    project_service: SyncProjectService = Depends(get_project_service)
+) -> ORJSONResponse:
     """
     Update sync configuration for a project.
 
@@ -123,9 +193,9 @@ async def update_project_sync_config(
             auto_sync_enabled=request.auto_sync_enabled
         )
 
-        logger.info(f"Sync config updated for project {project_id}")
+        logger.info("Sync config updated for project %s", project_id)
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "project_id": project_id,
             "config": {
@@ -134,22 +204,22 @@ async def update_project_sync_config(
                 "auto_sync_enabled": updated.get('auto_sync_enabled'),
                 "sync_status": updated.get('sync_status')
             }
-        }
+        })
 
     except ValueError as e:
-        logger.error(f"Invalid sync config: {e}")
+        logger.error("Invalid sync config: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to update sync config: {e}")
+        logger.error("Failed to update sync config: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/projects/{project_id}/sync/status", response_model=SyncStatusResponse)
+@router.get("/projects/{project_id}/sync/status", responses={200: {"model": SyncStatusResponse}})
 async def get_project_sync_status(
     project_id: str,
-    project_service = Depends(),
-    knowledge_service = Depends()  # For Phase 2 stats
-) -> Dict:
+    project_service: SyncProjectService = Depends(get_project_service),
+    codebase_service: CodebaseSourceService = Depends(get_codebase_source_service)
+) -> ORJSONResponse:
     """
     Get current sync status for a project.
 
@@ -171,27 +241,23 @@ async def get_project_sync_status(
     ```
     """
     try:
-        # Get project
-        project = await project_service.get_project(project_id)
-        if not project:
+        # Fetch the project and its codebase stats concurrently - the codebase
+        # source is resolved from the project ID, so stats don't wait on the project row
+        (success, payload), source_stats = await asyncio.gather(
+            asyncio.to_thread(project_service.get_project, project_id),
+            codebase_service.get_project_stats(project_id)
+        )
+        if not success:
             raise HTTPException(status_code=404, detail="Project not found")
+        project = payload["project"]
 
-        # Get codebase stats (Phase 2: Real stats from codebase source)
-        stats = {
+        stats = source_stats or {
             "total_files": 0,
             "total_chunks": 0,
             "last_sync_duration_seconds": 0
         }
 
-        # Phase 2: Get real stats from codebase source
-        if project.get('codebase_source_id'):
-            from ..services.knowledge.codebase_source_service import CodebaseSourceService
-            codebase_service = CodebaseSourceService(supabase_client)
-            stats = await codebase_service.get_source_stats(
-                project['codebase_source_id']
-            )
-
-        return {
+        return ORJSONResponse({
             "project_id": project_id,
             "sync_status": project.get('sync_status', 'never_synced'),
             "last_sync_at": project.get('last_sync_at'),
@@ -200,24 +266,100 @@ async def get_project_sync_status(
             "local_path": project.get('local_path'),
             "last_sync_error": project.get('last_sync_error'),
             "stats": stats
-        }
+        })
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get sync status: {e}")
+        logger.error("Failed to get sync status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/projects/{project_id}/sync", response_model=TriggerSyncResponse)
+@asynccontextmanager
+async def _project_sync_lock(project_id: str) -> AsyncIterator[None]:
+    """Hold a project's sync lock, dropping its entry once no trigger holds or awaits it."""
+    entry = _project_sync_locks.get(project_id)
+    if entry is None:
+        entry = _project_sync_locks[project_id] = _ProjectSyncLock()
+    entry.users += 1
+    try:
+        async with entry.lock:
+            yield
+    finally:
+        entry.users -= 1
+        if not entry.users:
+            del _project_sync_locks[project_id]
+
+
+def _sync_covers(in_flight: Optional[frozenset], requested: Optional[frozenset]) -> bool:
+    """Return True if an in-flight sync of ``in_flight`` files includes every requested file."""
+    if in_flight is None:
+        return True
+    return requested is not None and requested <= in_flight
+
+
+async def _run_project_sync(
+    project_id: str,
+    request: TriggerSyncRequest,
+    project_service: SyncProjectService,
+    supabase_client,
+    embedding_service: SyncEmbeddingService,
+    codebase_source_service: CodebaseSourceService
+) -> Dict:
+    """
+    Run an incremental sync and build the trigger response.
+
+    Returns:
+        TriggerSyncResponse-shaped dict
+    """
+    sync_job_id = uuid.uuid4().hex
+
+    # Phase 2: Perform actual sync
+    from ..services.sync.incremental_sync_service import IncrementalSyncService
+
+    sync_service = IncrementalSyncService(
+        db=supabase_client,
+        embedding_service=embedding_service,
+        project_service=project_service,
+        codebase_source_service=codebase_source_service
+    )
+
+    # Execute sync
+    stats = await sync_service.sync_project_changes(
+        project_id=project_id,
+        changed_files=request.changed_files
+    )
+
+    logger.info(
+        "Sync completed for project %s - %d files, %.2fs",
+        project_id, stats.files_processed, stats.duration_seconds
+    )
+
+    return {
+        "success": True,
+        "sync_job_id": sync_job_id,
+        "status": "completed",
+        "trigger": request.trigger,
+        "stats": {
+            "files_processed": stats.files_processed,
+            "chunks_added": stats.chunks_added,
+            "chunks_modified": stats.chunks_modified,
+            "chunks_deleted": stats.chunks_deleted,
+            "duration_seconds": round(stats.duration_seconds, 2),
+            "errors": stats.errors
+        }
+    }
+
+
+@router.post("/projects/{project_id}/sync", responses={200: {"model": TriggerSyncResponse}})
 async def trigger_project_sync(
     project_id: str,
     request: TriggerSyncRequest = TriggerSyncRequest(),
-    project_service = Depends(),
-    supabase_client = Depends(),
-    embedding_service = Depends(),
-    codebase_source_service = Depends()
-) -> Dict:
+    project_service: SyncProjectService = Depends(get_project_service),
+    supabase_client = Depends(get_db_client),
+    embedding_service: SyncEmbeddingService = Depends(get_embedding_service),
+    codebase_source_service: CodebaseSourceService = Depends(get_codebase_source_service)
+) -> ORJSONResponse:
     """
     Manually trigger synchronization for a project.
 
@@ -247,9 +389,10 @@ async def trigger_project_sync(
     """
     try:
         # Get project
-        project = await project_service.get_project(project_id)
-        if not project:
+        success, payload = await asyncio.to_thread(project_service.get_project, project_id)
+        if not success:
             raise HTTPException(status_code=404, detail="Project not found")
+        project = payload["project"]
 
         if not project.get('local_path'):
             raise HTTPException(
@@ -257,48 +400,49 @@ async def trigger_project_sync(
                 detail="Project has no local_path configured. Please set local_path first."
             )
 
-        # Phase 2: Perform actual sync
-        from ..services.sync.incremental_sync_service import IncrementalSyncService
-
-        sync_service = IncrementalSyncService(
-            db=supabase_client,
-            embedding_service=embedding_service,
-            project_service=project_service,
-            codebase_source_service=codebase_source_service
-        )
-
-        # Execute sync
-        stats = await sync_service.sync_project_changes(
-            project_id=project_id,
-            changed_files=request.changed_files
-        )
-
-        sync_job_id = str(uuid.uuid4())
-
-        logger.info(
-            f"Sync completed for project {project_id} - "
-            f"{stats.files_processed} files, {stats.duration_seconds:.2f}s"
-        )
-
-        return {
-            "success": True,
-            "sync_job_id": sync_job_id,
-            "status": "completed",
-            "trigger": request.trigger,
-            "stats": {
-                "files_processed": stats.files_processed,
-                "chunks_added": stats.chunks_added,
-                "chunks_modified": stats.chunks_modified,
-                "chunks_deleted": stats.chunks_deleted,
-                "duration_seconds": round(stats.duration_seconds, 2),
-                "errors": stats.errors
-            }
-        }
+        requested_files = frozenset(request.changed_files) if request.changed_files else None
+
+        # Piggyback on an in-flight sync that already covers the requested files
+        pending = _pending_syncs.get(project_id)
+        if pending is not None and _sync_covers(pending[0], requested_files):
+            logger.info("Joining in-flight sync for project %s", project_id)
+            return ORJSONResponse(await asyncio.shield(pending[1]))
+
+        async with _project_sync_lock(project_id):
+            future = asyncio.get_running_loop().create_future()
+            entry = (requested_files, future)
+            _pending_syncs[project_id] = entry
+            try:
+                result = await _run_project_sync(
+                    project_id,
+                    request,
+                    project_service,
+                    supabase_client,
+                    embedding_service,
+                    codebase_source_service
+                )
+            except BaseException as e:
+                # A cancelled owner must not cancel joiners: they get an
+                # ordinary error and so a 500 from their own request
+                if isinstance(e, asyncio.CancelledError):
+                    future.set_exception(RuntimeError("Sync was cancelled before it finished"))
+                else:
+                    future.set_exception(e)
+                # Mark retrieved so unjoined failures don't warn at garbage collection
+                future.exception()
+                raise
+            else:
+                future.set_result(result)
+            finally:
+                if _pending_syncs.get(project_id) is entry:
+                    del _pending_syncs[project_id]
+
+        return ORJSONResponse(result)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to trigger sync: {e}", exc_info=True)
+        logger.error("Failed to trigger sync: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -306,17 +450,21 @@ async def trigger_project_sync(
 # Health Check
 # ============================================================================
 
-@router.get("/projects/sync/health")
-async def sync_health_check() -> Dict:
+# Static payload serialized once at import; probes skip Pydantic and JSON encoding
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "Project Sync API",
+    "phase": "1",
+    "features": ["config", "status", "trigger"]
+})
+
+
+@router.get("/projects/sync/health", response_class=Response)
+async def sync_health_check() -> Response:
     """
     Health check for sync endpoints.
 
     Returns:
         Status message indicating API is operational
     """
-    return {
-        "status": "healthy",
-        "service": "Project Sync API",
-        "phase": "1",
-        "features": ["config", "status", "trigger"]
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
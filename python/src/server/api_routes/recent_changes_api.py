@@ -5,16 +5,38 @@ Phase 5, Task 5.4
 FastAPI endpoints for querying recent file changes.
 """
 
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional
+
+import orjson
 from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from src.server.config.logfire_config import get_logger
-from src.server.services.search.recent_changes_service import RecentChangesService
-from src.server.utils import get_supabase_client
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/projects", tags=["recent-changes"])
+router = APIRouter(prefix="/projects", tags=["recent-changes"], default_response_class=ORJSONResponse)
+
+
+@lru_cache(maxsize=1)
+def _get_recent_changes_service():
+    """Get the shared RecentChangesService, importing it lazily on first request."""
+    from src.server.services.search.recent_changes_service import RecentChangesService
+    from src.server.utils import get_supabase_client
+
+    return RecentChangesService(get_supabase_client())
+
+
+async def _ndjson_lines(
+    first: Optional[Dict[str, Any]], rows: AsyncIterator[Dict[str, Any]]
+) -> AsyncIterator[bytes]:
+    """Encode an already-started row iterator as newline-delimited JSON."""
+    if first is None:
+        return
+    yield orjson.dumps(first) + b"\n"
+    async for row in rows:
+        yield orjson.dumps(row) + b"\n"
 
 
 # Pydantic models
@@ -35,6 +57,9 @@ async def get_recent_changes(
     file_filter: Optional[str] = Query(
         default=None, description="Optional file pattern filter"
     ),
+    stream: bool = Query(
+        default=False, description="Stream results as NDJSON, ordered by file path"
+    ),
 ):
     """
     Get files that changed recently in a project
@@ -43,16 +68,28 @@ async def get_recent_changes(
         project_id: UUID of the project
         days: Number of days to look back (1-90)
         file_filter: Optional file pattern filter
+        stream: If True, stream one JSON object per line as files are read
 
     Returns:
-        List of recently changed files
+        List of recently changed files, or an NDJSON stream when stream=1
 
     Raises:
         HTTPException: If query fails
     """
     try:
-        db = get_supabase_client()
-        service = RecentChangesService(db)
+        service = _get_recent_changes_service()
+
+        if stream:
+            rows = service.get_recent_changes_iter(
+                project_id=project_id,
+                days=days,
+                file_filter=file_filter,
+            )
+            # Pull the first row before responding so lookup errors still map to 400/500
+            first = await anext(rows, None)
+            return StreamingResponse(
+                _ndjson_lines(first, rows), media_type="application/x-ndjson"
+            )
 
         results = await service.get_recent_changes(
             project_id=project_id,
@@ -60,13 +97,13 @@ async def get_recent_changes(
             file_filter=file_filter,
         )
 
-        return results
+        return ORJSONResponse(results)
 
     except ValueError as e:
-        logger.error(f"Validation error getting recent changes: {str(e)}")
+        logger.error("Validation error getting recent changes: %s", e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Error getting recent changes: {str(e)}")
+        logger.error("Error getting recent changes: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get recent changes: {str(e)}",
@@ -94,18 +131,17 @@ async def get_change_statistics(
         HTTPException: If query fails
     """
     try:
-        db = get_supabase_client()
-        service = RecentChangesService(db)
+        service = _get_recent_changes_service()
 
         stats = await service.get_change_statistics(project_id=project_id, days=days)
 
         return stats
 
     except ValueError as e:
-        logger.error(f"Validation error getting statistics: {str(e)}")
+        logger.error("Validation error getting statistics: %s", e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Error getting change statistics: {str(e)}")
+        logger.error("Error getting change statistics: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get change statistics: {str(e)}",
@@ -4,13 +4,133 @@ Phase 5, Task 5.6
 API endpoints for sync analytics and metrics
 """
 
-from typing import Dict
-from fastapi import APIRouter, HTTPException, Query, Depends
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+from functools import lru_cache
+from fastapi import APIRouter, HTTPException, Query, Depends, Header, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import asyncio
 import logging
 
+import orjson
+
+from ..services.analytics.sync_analytics_service import SyncAnalyticsService, sync_analytics_cache
+from ..services.db_pool import get_db_pool
+from ..utils import get_supabase_client
+from ..utils.etag_utils import check_etag, generate_etag
+
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+# ============================================================================
+# Dependencies
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def get_analytics_service() -> SyncAnalyticsService:
+    """Dependency for the shared SyncAnalyticsService."""
+    return SyncAnalyticsService(get_supabase_client(), pool=get_db_pool())
+
+
+async def _cached_metric(
+    project_id: str,
+    metric: str,
+    days: int,
+    fetch: Callable[[str, int], Awaitable[Any]]
+) -> Any:
+    """
+    Return a cached analytics result, fetching and caching it on a miss.
+
+    Empty results are not cached: the service returns them both for projects
+    without history and when a query fails, and neither should stick for the TTL.
+
+    Args:
+        project_id: Project UUID
+        metric: Analytics endpoint name used in the cache key
+        days: Lookback window in days
+        fetch: Service method taking (project_id, days)
+
+    Returns:
+        The analytics result
+    """
+    result = sync_analytics_cache.get(project_id, (metric, days))
+    if result is None:
+        result = await fetch(project_id, days)
+        if result:
+            sync_analytics_cache.set(project_id, (metric, days), result)
+    return result
+
+
+async def _cached_dashboard_metrics(
+    project_id: str,
+    days: int,
+    analytics_service: SyncAnalyticsService
+) -> Dict[str, Any]:
+    """
+    Return cached performance, errors and growth, fetching them together on a miss.
+
+    A single get_all_metrics call shares one rollup read between performance
+    and growth instead of issuing a query per metric.
+
+    Args:
+        project_id: Project UUID
+        days: Lookback window in days
+        analytics_service: Service used on a cache miss
+
+    Returns:
+        Dictionary keyed by metric name
+    """
+    metrics = {
+        metric: sync_analytics_cache.get(project_id, (metric, days))
+        for metric in ("performance", "errors", "growth")
+    }
+    if any(result is None for result in metrics.values()):
+        fetched = await analytics_service.get_all_metrics(project_id, days)
+        for metric, result in fetched.items():
+            if metrics[metric] is None:
+                metrics[metric] = result
+                if result:
+                    sync_analytics_cache.set(project_id, (metric, days), result)
+    return metrics
+
+
+def _etag_response(body: Dict, if_none_match: Optional[str]) -> Response:
+    """
+    Return body with an ETag, or 304 Not Modified if the client already has it.
+
+    Args:
+        body: Response document
+        if_none_match: ETag from the client's previous response
+
+    Returns:
+        ORJSONResponse with ETag headers, or an empty 304 response
+    """
+    etag = generate_etag(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache, must-revalidate"}
+
+    if check_etag(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(body, headers=headers)
+
+
+async def _stream_sync_history(
+    project_id: str,
+    days: int,
+    first: Optional[Dict],
+    operations: AsyncIterator[Dict]
+) -> AsyncIterator[bytes]:
+    """Encode the sync-history document incrementally, one operation at a time."""
+    yield (
+        b'{"project_id":' + orjson.dumps(project_id)
+        + b',"days":' + orjson.dumps(days)
+        + b',"operations":['
+    )
+    if first is not None:
+        yield orjson.dumps(first)
+        async for operation in operations:
+            yield b"," + orjson.dumps(operation)
+    yield b"]}"
 
 
 # ============================================================================
@@ -21,13 +141,15 @@ router = APIRouter()
 async def get_sync_history(
     project_id: str,
     days: int = Query(30, ge=1, le=365, description="Number of days to look back"),
-    analytics_service = Depends()  # Inject SyncAnalyticsService
+    stream: bool = Query(False, description="Stream operations as they are read"),
+    analytics_service: SyncAnalyticsService = Depends(get_analytics_service)
 ) -> Dict:
     """
     Get sync operation history for a project.
 
     **Query Parameters**:
     - `days`: Number of days to look back (1-365, default 30)
+    - `stream`: Stream the same document page by page instead of buffering it
 
     **Response**:
     ```json
@@ -52,7 +174,18 @@ async def get_sync_history(
     ```
     """
     try:
-        operations = await analytics_service.get_sync_history(project_id, days)
+        if stream:
+            operations_iter = analytics_service.get_sync_history_stream(project_id, days)
+            # Read the first page before responding so query errors still return a 500
+            first = await anext(operations_iter, None)
+            return StreamingResponse(
+                _stream_sync_history(project_id, days, first, operations_iter),
+                media_type="application/json"
+            )
+
+        operations = await _cached_metric(
+            project_id, "sync-history", days, analytics_service.get_sync_history
+        )
 
         return {
             "project_id": project_id,
@@ -61,7 +194,7 @@ async def get_sync_history(
         }
 
     except Exception as e:
-        logger.error(f"Failed to get sync history: {e}")
+        logger.error("Failed to get sync history: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -69,14 +202,17 @@ async def get_sync_history(
 async def get_performance_metrics(
     project_id: str,
     days: int = Query(30, ge=1, le=365, description="Number of days to analyze"),
-    analytics_service = Depends()  # Inject SyncAnalyticsService
-) -> Dict:
+    if_none_match: Optional[str] = Header(None),
+    analytics_service: SyncAnalyticsService = Depends(get_analytics_service)
+) -> Response:
     """
     Get performance metrics for a project.
 
     **Query Parameters**:
     - `days`: Number of days to analyze (1-365, default 30)
 
+    Sends an ETag; a matching `If-None-Match` gets `304 Not Modified`.
+
     **Response**:
     ```json
     {
@@ -102,16 +238,18 @@ async def get_performance_metrics(
     ```
     """
     try:
-        metrics = await analytics_service.get_performance_metrics(project_id, days)
+        metrics = await _cached_metric(
+            project_id, "performance", days, analytics_service.get_performance_metrics
+        )
 
-        return {
+        return _etag_response({
             "project_id": project_id,
             "days": days,
             "metrics": metrics
-        }
+        }, if_none_match)
 
     except Exception as e:
-        logger.error(f"Failed to get performance metrics: {e}")
+        logger.error("Failed to get performance metrics: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -119,14 +257,17 @@ async def get_performance_metrics(
 async def get_error_statistics(
     project_id: str,
     days: int = Query(30, ge=1, le=365, description="Number of days to analyze"),
-    analytics_service = Depends()  # Inject SyncAnalyticsService
-) -> Dict:
+    if_none_match: Optional[str] = Header(None),
+    analytics_service: SyncAnalyticsService = Depends(get_analytics_service)
+) -> Response:
     """
     Get error statistics for a project.
 
     **Query Parameters**:
     - `days`: Number of days to analyze (1-365, default 30)
 
+    Sends an ETag; a matching `If-None-Match` gets `304 Not Modified`.
+
     **Response**:
     ```json
     {
@@ -154,16 +295,18 @@ async def get_error_statistics(
     ```
     """
     try:
-        statistics = await analytics_service.get_error_statistics(project_id, days)
+        statistics = await _cached_metric(
+            project_id, "errors", days, analytics_service.get_error_statistics
+        )
 
-        return {
+        return _etag_response({
             "project_id": project_id,
             "days": days,
             "statistics": statistics
-        }
+        }, if_none_match)
 
     except Exception as e:
-        logger.error(f"Failed to get error statistics: {e}")
+        logger.error("Failed to get error statistics: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -171,14 +314,17 @@ async def get_error_statistics(
 async def get_growth_metrics(
     project_id: str,
     days: int = Query(30, ge=1, le=365, description="Number of days to analyze"),
-    analytics_service = Depends()  # Inject SyncAnalyticsService
-) -> Dict:
+    if_none_match: Optional[str] = Header(None),
+    analytics_service: SyncAnalyticsService = Depends(get_analytics_service)
+) -> Response:
     """
     Get growth metrics for a project.
 
     **Query Parameters**:
     - `days`: Number of days to analyze (1-365, default 30)
 
+    Sends an ETag; a matching `If-None-Match` gets `304 Not Modified`.
+
     **Response**:
     ```json
     {
@@ -202,16 +348,68 @@ async def get_growth_metrics(
     ```
     """
     try:
-        metrics = await analytics_service.get_growth_metrics(project_id, days)
+        metrics = await _cached_metric(
+            project_id, "growth", days, analytics_service.get_growth_metrics
+        )
 
-        return {
+        return _etag_response({
             "project_id": project_id,
             "days": days,
             "metrics": metrics
-        }
+        }, if_none_match)
+
+    except Exception as e:
+        logger.error("Failed to get growth metrics: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/projects/{project_id}/analytics/summary")
+async def get_analytics_summary(
+    project_id: str,
+    days: int = Query(30, ge=1, le=365, description="Number of days to analyze"),
+    if_none_match: Optional[str] = Header(None),
+    analytics_service: SyncAnalyticsService = Depends(get_analytics_service)
+) -> Response:
+    """
+    Get sync history, performance, error and growth analytics in one call.
+
+    Combines the four analytics endpoints for dashboards; each section has the
+    same shape as its standalone endpoint and shares its cache entry.
+
+    **Query Parameters**:
+    - `days`: Number of days to analyze (1-365, default 30)
+
+    Sends an ETag; a matching `If-None-Match` gets `304 Not Modified`.
+
+    **Response**:
+    ```json
+    {
+        "project_id": "uuid",
+        "days": 30,
+        "operations": [...],
+        "performance": {...},
+        "errors": {...},
+        "growth": {...}
+    }
+    ```
+    """
+    try:
+        operations, metrics = await asyncio.gather(
+            _cached_metric(project_id, "sync-history", days, analytics_service.get_sync_history),
+            _cached_dashboard_metrics(project_id, days, analytics_service)
+        )
+
+        return _etag_response({
+            "project_id": project_id,
+            "days": days,
+            "operations": operations,
+            "performance": metrics["performance"],
+            "errors": metrics["errors"],
+            "growth": metrics["growth"]
+        }, if_none_match)
 
     except Exception as e:
-        logger.error(f"Failed to get growth metrics: {e}")
+        logger.error("Failed to get analytics summary: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -230,5 +428,5 @@ async def analytics_health_check() -> Dict:
     return {
         "status": "healthy",
         "service": "Sync Analytics API",
-        "endpoints": ["sync-history", "performance", "errors", "growth"]
+        "endpoints": ["sync-history", "performance", "errors", "growth", "summary"]
     }
@@ -5,8 +5,10 @@ Phase 5, Task 5.1
 FastAPI endpoints for managing task-file relationships.
 """
 
+from functools import lru_cache
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from src.server.config.logfire_config import get_logger
@@ -14,7 +16,20 @@ from src.server.services.tasks.task_file_service import TaskFileService
 from src.server.utils import get_supabase_client
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/tasks", tags=["task-files"])
+router = APIRouter(prefix="/tasks", tags=["task-files"], default_response_class=ORJSONResponse)
+
+
+# Dependencies
+@lru_cache(maxsize=1)
+def get_db_client():
+    """Dependency for the shared Supabase client, created on first request."""
+    return get_supabase_client()
+
+
+@lru_cache(maxsize=1)
+def get_task_file_service() -> TaskFileService:
+    """Dependency for the shared TaskFileService."""
+    return TaskFileService(get_db_client())
 
 
 # Pydantic models
@@ -53,8 +68,12 @@ class FileRelationship(BaseModel):
     created_by: str
 
 
-@router.post("/{task_id}/files", response_model=FileRelationship)
-async def link_file_to_task(task_id: str, request: LinkFileRequest):
+@router.post("/{task_id}/files", responses={200: {"model": FileRelationship}})
+async def link_file_to_task(
+    task_id: str,
+    request: LinkFileRequest,
+    service: TaskFileService = Depends(get_task_file_service),
+) -> ORJSONResponse:
     """
     Link a file to a task
 
@@ -69,9 +88,6 @@ async def link_file_to_task(task_id: str, request: LinkFileRequest):
         HTTPException: If linking fails
     """
     try:
-        db = get_supabase_client()
-        service = TaskFileService(db)
-
         relationship = await service.link_task_to_file(
             task_id=task_id,
             project_id=request.project_id,
@@ -81,13 +97,13 @@ async def link_file_to_task(task_id: str, request: LinkFileRequest):
             created_by=request.created_by,
         )
 
-        return relationship
+        return ORJSONResponse(relationship)
 
     except ValueError as e:
-        logger.error(f"Validation error linking file: {str(e)}")
+        logger.error("Validation error linking file: %s", e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Error linking file to task: {str(e)}")
+        logger.error("Error linking file to task: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to link file to task: {str(e)}",
@@ -95,7 +111,11 @@ async def link_file_to_task(task_id: str, request: LinkFileRequest):
 
 
 @router.delete("/{task_id}/files", status_code=status.HTTP_204_NO_CONTENT)
-async def unlink_file_from_task(task_id: str, request: UnlinkFileRequest):
+async def unlink_file_from_task(
+    task_id: str,
+    request: UnlinkFileRequest,
+    service: TaskFileService = Depends(get_task_file_service),
+):
     """
     Unlink a file from a task
 
@@ -107,9 +127,6 @@ async def unlink_file_from_task(task_id: str, request: UnlinkFileRequest):
         HTTPException: If unlinking fails
     """
     try:
-        db = get_supabase_client()
-        service = TaskFileService(db)
-
         success = await service.unlink_task_from_file(
             task_id=task_id,
             project_id=request.project_id,
@@ -125,15 +142,18 @@ async def unlink_file_from_task(task_id: str, request: UnlinkFileRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error unlinking file from task: {str(e)}")
+        logger.error("Error unlinking file from task: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to unlink file from task: {str(e)}",
         )
 
 
-@router.get("/{task_id}/files", response_model=List[FileRelationship])
-async def get_files_for_task(task_id: str):
+@router.get("/{task_id}/files", responses={200: {"model": List[FileRelationship]}})
+async def get_files_for_task(
+    task_id: str,
+    service: TaskFileService = Depends(get_task_file_service),
+) -> ORJSONResponse:
     """
     Get all files linked to a task
 
@@ -147,14 +167,11 @@ async def get_files_for_task(task_id: str):
         HTTPException: If query fails
     """
     try:
-        db = get_supabase_client()
-        service = TaskFileService(db)
-
         files = await service.get_files_for_task(task_id)
-        return files
+        return ORJSONResponse(files)
 
     except Exception as e:
-        logger.error(f"Error getting files for task: {str(e)}")
+        logger.error("Error getting files for task: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get files for task: {str(e)}",
@@ -162,8 +179,15 @@ async def get_files_for_task(task_id: str):
 
 
 # Note: Path parameter with slashes requires special handling
-@router.get("/projects/{project_id}/files/{file_path:path}/tasks", response_model=List[FileRelationship])
-async def get_tasks_for_file(project_id: str, file_path: str):
+@router.get(
+    "/projects/{project_id}/files/{file_path:path}/tasks",
+    responses={200: {"model": List[FileRelationship]}},
+)
+async def get_tasks_for_file(
+    project_id: str,
+    file_path: str,
+    service: TaskFileService = Depends(get_task_file_service),
+) -> ORJSONResponse:
     """
     Get all tasks linked to a specific file
 
@@ -178,14 +202,11 @@ async def get_tasks_for_file(project_id: str, file_path: str):
         HTTPException: If query fails
     """
     try:
-        db = get_supabase_client()
-        service = TaskFileService(db)
-
         tasks = await service.get_tasks_for_file(project_id, file_path)
-        return tasks
+        return ORJSONResponse(tasks)
 
     except Exception as e:
-        logger.error(f"Error getting tasks for file: {str(e)}")
+        logger.error("Error getting tasks for file: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get tasks for file: {str(e)}",
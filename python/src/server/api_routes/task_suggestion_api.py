@@ -5,8 +5,11 @@ Phase 5, Task 5.5
 FastAPI endpoints for task suggestions based on file changes.
 """
 
+from functools import lru_cache
+from operator import itemgetter
 from typing import List
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from src.server.config.logfire_config import get_logger
@@ -14,7 +17,20 @@ from src.server.services.tasks.task_suggestion_service import TaskSuggestionServ
 from src.server.utils import get_supabase_client
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/projects", tags=["task-suggestions"])
+router = APIRouter(prefix="/projects", tags=["task-suggestions"], default_response_class=ORJSONResponse)
+
+
+# Dependencies
+@lru_cache(maxsize=1)
+def get_db_client():
+    """Dependency for the shared Supabase client, created on first request."""
+    return get_supabase_client()
+
+
+@lru_cache(maxsize=1)
+def get_task_suggestion_service() -> TaskSuggestionService:
+    """Dependency for the shared TaskSuggestionService."""
+    return TaskSuggestionService(get_db_client())
 
 
 # Pydantic models
@@ -43,7 +59,11 @@ class TaskUpdateSuggestion(BaseModel):
 
 
 @router.post("/{project_id}/tasks/suggestions", response_model=List[TaskUpdateSuggestion])
-async def get_task_suggestions(project_id: str, request: SuggestionsRequest):
+async def get_task_suggestions(
+    project_id: str,
+    request: SuggestionsRequest,
+    service: TaskSuggestionService = Depends(get_task_suggestion_service),
+):
     """
     Get task suggestions based on file changes
 
@@ -62,30 +82,29 @@ async def get_task_suggestions(project_id: str, request: SuggestionsRequest):
         HTTPException: If suggestion generation fails
     """
     try:
-        db = get_supabase_client()
-        service = TaskSuggestionService(db)
+        # Nothing changed (e.g. empty commit webhook): skip the service round trips
+        if not request.changed_files:
+            return []
 
-        # Get suggestions for linked tasks
-        update_suggestions = await service.suggest_task_updates(
-            project_id=project_id,
-            changed_files=request.changed_files,
-            commit_message=request.commit_message,
-        )
+        # Drop repeated paths, keeping first-seen order
+        changed_files = list(dict.fromkeys(request.changed_files))
 
-        # Get suggestions for unlinked files
-        new_task_suggestions = await service.suggest_new_tasks(
+        # Get suggestions for linked tasks and unlinked files in one pass
+        update_suggestions, new_task_suggestions = await service.suggest_all(
             project_id=project_id,
-            changed_files=request.changed_files,
+            changed_files=changed_files,
+            commit_message=request.commit_message,
         )
 
         # Combine suggestions
         all_suggestions = update_suggestions + new_task_suggestions
 
         # Sort by confidence (highest first)
-        all_suggestions.sort(key=lambda x: x["confidence"], reverse=True)
+        all_suggestions.sort(key=itemgetter("confidence"), reverse=True)
 
         logger.info(
-            f"Generated {len(all_suggestions)} task suggestions",
+            "Generated %d task suggestions",
+            len(all_suggestions),
             extra={
                 "project_id": project_id,
                 "update_suggestions": len(update_suggestions),
@@ -96,7 +115,7 @@ async def get_task_suggestions(project_id: str, request: SuggestionsRequest):
         return all_suggestions
 
     except Exception as e:
-        logger.error(f"Error generating task suggestions: {str(e)}")
+        logger.error("Error generating task suggestions: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate task suggestions: {str(e)}",
@@ -8,6 +8,7 @@ health of the background sync worker.
 import logging
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from src.server.services.sync.sync_worker import SyncWorker
@@ -15,7 +16,7 @@ from src.server.services.sync.file_watcher import FileWatcherService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/watcher", tags=["watcher"])
+router = APIRouter(prefix="/api/watcher", tags=["watcher"], default_response_class=ORJSONResponse)
 
 
 # Global worker instance (set by main application)
@@ -85,9 +86,9 @@ class ErrorResponse(BaseModel):
 
 @router.post(
     "/projects/{project_id}/start",
-    response_model=WatcherStatusResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        200: {"model": WatcherStatusResponse},
         404: {"model": ErrorResponse},
         500: {"model": ErrorResponse}
     }
@@ -96,7 +97,7 @@ async def start_watcher(
     project_id: str,
     request: StartWatcherRequest,
     worker: SyncWorker = Depends(get_worker)
-) -> WatcherStatusResponse:
+) -> ORJSONResponse:
     """
     Start file watcher for a project.
 
@@ -112,7 +113,7 @@ async def start_watcher(
         HTTPException: If watcher fails to start
     """
     try:
-        logger.info(f"Starting watcher for project {project_id}")
+        logger.info("Starting watcher for project %s", project_id)
 
         success = await worker.file_watcher.start_watching(
             project_id, request.local_path
@@ -124,21 +125,18 @@ async def start_watcher(
                 detail="Failed to start watcher"
             )
 
-        # Add to watched projects set
-        worker.watched_projects.add(project_id)
+        is_active, is_watching = worker.file_watcher.get_state(project_id)
 
-        is_watching = worker.file_watcher.is_watching(project_id)
-
-        return WatcherStatusResponse(
-            project_id=project_id,
-            is_active=True,
-            is_watching=is_watching
-        )
+        return ORJSONResponse({
+            "project_id": project_id,
+            "is_active": is_active,
+            "is_watching": is_watching
+        })
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error starting watcher for project {project_id}: {e}")
+        logger.error("Error starting watcher for project %s: %s", project_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -147,9 +145,9 @@ async def start_watcher(
 
 @router.post(
     "/projects/{project_id}/stop",
-    response_model=WatcherStatusResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        200: {"model": WatcherStatusResponse},
         404: {"model": ErrorResponse},
         500: {"model": ErrorResponse}
     }
@@ -157,7 +155,7 @@ async def start_watcher(
 async def stop_watcher(
     project_id: str,
     worker: SyncWorker = Depends(get_worker)
-) -> WatcherStatusResponse:
+) -> ORJSONResponse:
     """
     Stop file watcher for a project.
 
@@ -172,7 +170,7 @@ async def stop_watcher(
         HTTPException: If watcher fails to stop
     """
     try:
-        logger.info(f"Stopping watcher for project {project_id}")
+        logger.info("Stopping watcher for project %s", project_id)
 
         success = await worker.file_watcher.stop_watching(project_id)
 
@@ -182,21 +180,18 @@ async def stop_watcher(
                 detail="Failed to stop watcher"
             )
 
-        # Remove from watched projects set
-        worker.watched_projects.discard(project_id)
+        is_active, is_watching = worker.file_watcher.get_state(project_id)
 
-        is_watching = worker.file_watcher.is_watching(project_id)
-
-        return WatcherStatusResponse(
-            project_id=project_id,
-            is_active=False,
-            is_watching=is_watching
-        )
+        return ORJSONResponse({
+            "project_id": project_id,
+            "is_active": is_active,
+            "is_watching": is_watching
+        })
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error stopping watcher for project {project_id}: {e}")
+        logger.error("Error stopping watcher for project %s: %s", project_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -205,16 +200,16 @@ async def stop_watcher(
 
 @router.get(
     "/projects/{project_id}/status",
-    response_model=WatcherStatusResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        200: {"model": WatcherStatusResponse},
         404: {"model": ErrorResponse}
     }
 )
 async def get_watcher_status(
     project_id: str,
     worker: SyncWorker = Depends(get_worker)
-) -> WatcherStatusResponse:
+) -> ORJSONResponse:
     """
     Get watcher status for a project.
 
@@ -225,14 +220,13 @@ async def get_watcher_status(
     Returns:
         Watcher status response
     """
-    is_watching = worker.file_watcher.is_watching(project_id)
-    is_active = project_id in worker.watched_projects
+    is_active, is_watching = worker.file_watcher.get_state(project_id)
 
-    return WatcherStatusResponse(
-        project_id=project_id,
-        is_active=is_active,
-        is_watching=is_watching
-    )
+    return ORJSONResponse({
+        "project_id": project_id,
+        "is_active": is_active,
+        "is_watching": is_watching
+    })
 
 
 @router.get(
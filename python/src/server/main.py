@@ -13,6 +13,7 @@ Modules:
 
 import logging
 import os
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Response
@@ -29,17 +30,24 @@ from .api_routes.migration_api import router as migration_router
 from .api_routes.ollama_api import router as ollama_router
 from .api_routes.pages_api import router as pages_router
 from .api_routes.progress_api import router as progress_router
+from .api_routes.project_search_api import router as project_search_router
 from .api_routes.projects_api import router as projects_router
 from .api_routes.projects_sync_api import router as projects_sync_router
 from .api_routes.providers_api import router as providers_router
+from .api_routes.recent_changes_api import router as recent_changes_router
 
 # Import modular API routers
 from .api_routes.settings_api import router as settings_router
+from .api_routes.sync_analytics_api import router as sync_analytics_router
 from .api_routes.version_api import router as version_router
 
 # Import Logfire configuration
 from .config.logfire_config import api_logger, setup_logfire
+from .middleware.logging_middleware import HealthCheckLogFilterMiddleware
+from .middleware.profiling_middleware import ProfilingMiddleware
 from .services.crawler_manager import cleanup_crawler, initialize_crawler
+from .services.db_pool import close_db_pool, init_db_pool
+from .services.search.cohere_reranking_strategy import close_shared_client as close_cohere_client
 
 # Import utilities and core classes
 from .services.credential_service import initialize_credentials
@@ -104,6 +112,13 @@ async def lifespan(app: FastAPI):
 
         api_logger.info("✅ Using polling for real-time updates")
 
+        # Direct Postgres pool for hot analytics reads (optional, needs SUPABASE_DB_URL)
+        try:
+            if await init_db_pool():
+                api_logger.info("✅ Postgres connection pool initialized")
+        except Exception as e:
+            api_logger.warning(f"Could not initialize Postgres pool, using Supabase REST: {e}")
+
         # Initialize prompt service
         try:
             from .services.prompt_service import prompt_service
@@ -140,6 +155,15 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             api_logger.warning("Could not cleanup crawling context: %s", e, exc_info=True)
 
+        try:
+            await close_db_pool()
+        except Exception as e:
+            api_logger.warning("Could not close Postgres pool: %s", e, exc_info=True)
+
+        try:
+            await close_cohere_client()
+        except Exception as e:
+            api_logger.warning("Could not close Cohere client: %s", e, exc_info=True)
 
         api_logger.info("✅ Cleanup completed")
 
@@ -165,24 +189,17 @@ app.add_middleware(
 )
 
 # Add GZip compression for all responses (60-80% bandwidth reduction)
+# Code search and recent-changes payloads are mostly source text and compress 5-10x
+# Sync analytics payloads repeat the same keys per operation and shrink to ~10-20%
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
 # Add middleware to skip logging for health checks
-@app.middleware("http")
-async def skip_health_check_logs(request, call_next):
-    # Skip logging for health check endpoints
-    if request.url.path in ["/health", "/api/health"]:
-        # Temporarily suppress the log
-        import logging
-
-        logger = logging.getLogger("uvicorn.access")
-        old_level = logger.level
-        logger.setLevel(logging.ERROR)
-        response = await call_next(request)
-        logger.setLevel(old_level)
-        return response
-    return await call_next(request)
+app.add_middleware(HealthCheckLogFilterMiddleware)
+
+# Opt-in request profiling: append ?profile=1 to any request for a pyinstrument report
+if os.getenv("ARCHON_PROFILING_ENABLED", "false").lower() == "true":
+    app.add_middleware(ProfilingMiddleware)
 
 
 # Include API routers
@@ -194,6 +211,9 @@ app.include_router(pages_router)
 app.include_router(ollama_router)
 app.include_router(projects_router)
 app.include_router(projects_sync_router)  # Project sync API routes
+app.include_router(project_search_router, prefix="/api")  # Project code search
+app.include_router(recent_changes_router, prefix="/api")  # Recent file changes and change statistics
+app.include_router(sync_analytics_router, prefix="/api")  # Sync analytics dashboards
 app.include_router(progress_router)
 app.include_router(agent_chat_router)
 app.include_router(agent_work_orders_router)  # Proxy to independent agent work orders service
@@ -365,6 +385,8 @@ def main():
         port=int(server_port),
         reload=True,
         log_level="info",
+        # uvloop is not available on Windows; fall back to the stdlib loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
     )
 
 
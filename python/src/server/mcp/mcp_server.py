@@ -5,16 +5,47 @@ Phase 5, Task 5.2
 Implements JSON-RPC 2.0 server for Model Context Protocol (MCP) tools.
 """
 
-import json
 from typing import Any, Dict, List, Optional
+
+import fastjsonschema
+import orjson
 from pydantic import BaseModel, ValidationError
 
 from src.server.config.logfire_config import get_logger
-from src.server.mcp.project_sync_tools import MCP_TOOLS, TOOL_HANDLERS
+from src.server.mcp.project_sync_tools import MCP_TOOLS, TOOL_HANDLERS, TOOL_INPUT_MODELS
 
 logger = get_logger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for values it can't encode natively (e.g. Pydantic models)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _is_valid_request(request_dict: Any) -> bool:
+    """Check the JSON-RPC 2.0 request shape without building a model"""
+    return (
+        isinstance(request_dict, dict)
+        and request_dict.get("jsonrpc") == "2.0"
+        and isinstance(request_dict.get("method"), str)
+        and isinstance(request_dict.get("params"), (dict, type(None)))
+        and isinstance(request_dict.get("id"), (str, int, type(None)))
+    )
+
+
+def _describe_invalid_request(request_dict: Any) -> str:
+    """Explain why a request failed _is_valid_request"""
+    if isinstance(request_dict, dict) and request_dict.get("jsonrpc") != "2.0":
+        return "jsonrpc must be exactly \"2.0\""
+    try:
+        JSONRPCRequest.model_validate(request_dict, strict=True)
+    except ValidationError as e:
+        return str(e)
+    return "Invalid request"
+
+
 # JSON-RPC 2.0 Models
 class JSONRPCRequest(BaseModel):
     """JSON-RPC 2.0 request"""
@@ -63,19 +94,41 @@ class MCPServer:
     def __init__(self):
         """Initialize MCP server"""
         self.tools = {}
-        self.handlers = {}
+        # tool name -> (handler, compiled schema validator, input model)
+        self._tool_dispatch = {}
         self._register_tools()
 
+        # The tool set is fixed after registration, so tools/list is encoded once
+        self._tools_list_json = orjson.dumps(self.list_tools()).decode()
+
+        # JSON-RPC method name -> handler(request_id, params)
+        self._method_dispatch = {
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+        }
+
     def _register_tools(self):
         """Register all MCP tools"""
         for tool in MCP_TOOLS:
             tool_name = tool["name"]
             self.tools[tool_name] = tool
 
-            if tool_name in TOOL_HANDLERS:
-                self.handlers[tool_name] = TOOL_HANDLERS[tool_name]
+            if tool_name not in TOOL_HANDLERS:
+                continue
 
-        logger.info(f"Registered {len(self.tools)} MCP tools")
+            # Compile input schemas once so each call runs generated validation code
+            validator = None
+            if "inputSchema" in tool:
+                validator = fastjsonschema.compile(tool["inputSchema"])
+
+            # One lookup per call resolves everything call_tool needs
+            self._tool_dispatch[tool_name] = (
+                TOOL_HANDLERS[tool_name],
+                validator,
+                TOOL_INPUT_MODELS.get(tool_name),
+            )
+
+        logger.info("Registered %d MCP tools", len(self.tools))
 
     def list_tools(self) -> List[Dict[str, Any]]:
         """
@@ -112,25 +165,32 @@ class MCPServer:
         Raises:
             ValueError: If tool not found or invalid input
         """
-        if tool_name not in self.handlers:
+        entry = self._tool_dispatch.get(tool_name)
+        if entry is None:
             raise ValueError(f"Tool not found: {tool_name}")
 
-        handler = self.handlers[tool_name]
+        handler, validator, input_model = entry
 
         try:
             # Validate input against tool schema
-            # (In production, use jsonschema or similar for validation)
+            if validator is not None:
+                input_data = validator(input_data)
+
+            # The schema already checked the arguments, so build the handler's
+            # model without a second Pydantic validation pass
+            if input_model is not None:
+                input_data = input_model.model_construct(**input_data)
 
             # Call handler
             result = await handler(input_data)
             return result
 
-        except ValidationError as e:
-            logger.error(f"Validation error calling tool {tool_name}: {str(e)}")
+        except (ValidationError, fastjsonschema.JsonSchemaException) as e:
+            logger.error("Validation error calling tool %s: %s", tool_name, e)
             raise ValueError(f"Invalid input parameters: {str(e)}")
 
         except Exception as e:
-            logger.error(f"Error calling tool {tool_name}: {str(e)}")
+            logger.error("Error calling tool %s: %s", tool_name, e)
             raise
 
     async def handle_request(self, request_data: str) -> str:
@@ -146,8 +206,8 @@ class MCPServer:
         try:
             # Parse request
             try:
-                request_dict = json.loads(request_data)
-            except json.JSONDecodeError as e:
+                request_dict = orjson.loads(request_data)
+            except orjson.JSONDecodeError as e:
                 return self._create_error_response(
                     None,
                     ErrorCodes.PARSE_ERROR,
@@ -155,68 +215,32 @@ class MCPServer:
                     str(e),
                 )
 
-            # Validate request
-            try:
-                request = JSONRPCRequest(**request_dict)
-            except ValidationError as e:
+            # Validate request shape inline; Pydantic is only used to explain failures
+            if not _is_valid_request(request_dict):
                 return self._create_error_response(
-                    request_dict.get("id"),
+                    request_dict.get("id") if isinstance(request_dict, dict) else None,
                     ErrorCodes.INVALID_REQUEST,
                     "Invalid request",
-                    str(e),
+                    _describe_invalid_request(request_dict),
                 )
 
-            # Handle method
-            if request.method == "tools/list":
-                result = self.list_tools()
-                return self._create_success_response(request.id, result)
-
-            elif request.method == "tools/call":
-                if not request.params:
-                    return self._create_error_response(
-                        request.id,
-                        ErrorCodes.INVALID_PARAMS,
-                        "Missing parameters",
-                    )
-
-                tool_name = request.params.get("name")
-                input_data = request.params.get("arguments", {})
-
-                if not tool_name:
-                    return self._create_error_response(
-                        request.id,
-                        ErrorCodes.INVALID_PARAMS,
-                        "Missing tool name",
-                    )
-
-                try:
-                    result = await self.call_tool(tool_name, input_data)
-                    return self._create_success_response(request.id, result)
-
-                except ValueError as e:
-                    return self._create_error_response(
-                        request.id,
-                        ErrorCodes.INVALID_PARAMS,
-                        str(e),
-                    )
-
-                except Exception as e:
-                    return self._create_error_response(
-                        request.id,
-                        ErrorCodes.INTERNAL_ERROR,
-                        "Internal error",
-                        str(e),
-                    )
-
-            else:
+            method = request_dict["method"]
+            params = request_dict.get("params")
+            request_id = request_dict.get("id")
+
+            # Dispatch method
+            method_handler = self._method_dispatch.get(method)
+            if method_handler is None:
                 return self._create_error_response(
-                    request.id,
+                    request_id,
                     ErrorCodes.METHOD_NOT_FOUND,
-                    f"Method not found: {request.method}",
+                    f"Method not found: {method}",
                 )
 
+            return await method_handler(request_id, params)
+
         except Exception as e:
-            logger.error(f"Unexpected error handling request: {str(e)}")
+            logger.error("Unexpected error handling request: %s", e)
             return self._create_error_response(
                 None,
                 ErrorCodes.INTERNAL_ERROR,
@@ -224,14 +248,69 @@ class MCPServer:
                 str(e),
             )
 
+    async def _handle_tools_list(
+        self, request_id: Optional[str | int], params: Optional[Dict[str, Any]]
+    ) -> str:
+        """Handle tools/list"""
+        return self._create_tools_list_response(request_id)
+
+    async def _handle_tools_call(
+        self, request_id: Optional[str | int], params: Optional[Dict[str, Any]]
+    ) -> str:
+        """Handle tools/call"""
+        if not params:
+            return self._create_error_response(
+                request_id,
+                ErrorCodes.INVALID_PARAMS,
+                "Missing parameters",
+            )
+
+        tool_name = params.get("name")
+        input_data = params.get("arguments", {})
+
+        if not tool_name:
+            return self._create_error_response(
+                request_id,
+                ErrorCodes.INVALID_PARAMS,
+                "Missing tool name",
+            )
+
+        try:
+            result = await self.call_tool(tool_name, input_data)
+            return self._create_success_response(request_id, result)
+
+        except ValueError as e:
+            return self._create_error_response(
+                request_id,
+                ErrorCodes.INVALID_PARAMS,
+                str(e),
+            )
+
+        except Exception as e:
+            return self._create_error_response(
+                request_id,
+                ErrorCodes.INTERNAL_ERROR,
+                "Internal error",
+                str(e),
+            )
+
     def _create_success_response(self, request_id: Optional[str | int], result: Any) -> str:
         """Create JSON-RPC success response"""
-        response = JSONRPCResponse(
-            jsonrpc="2.0",
-            result=result,
-            id=request_id,
+        # Serialized directly; the envelope shape matches JSONRPCResponse
+        return orjson.dumps(
+            {"jsonrpc": "2.0", "result": result, "id": request_id},
+            default=_json_default,
+        ).decode()
+
+    def _create_tools_list_response(self, request_id: Optional[str | int]) -> str:
+        """Create the tools/list success response around the pre-encoded tool list"""
+        return (
+            '{"jsonrpc":"2.0","result":'
+            + self._tools_list_json
+            + ',"id":'
+            + orjson.dumps(request_id).decode()
+            + "}"
         )
-        return response.model_dump_json()
 
     def _create_error_response(
         self,
@@ -241,13 +320,13 @@ class MCPServer:
         data: Optional[Any] = None,
     ) -> str:
         """Create JSON-RPC error response"""
-        error = JSONRPCError(code=code, message=message, data=data)
-        response = JSONRPCResponse(
-            jsonrpc="2.0",
-            error=error.model_dump(),
-            id=request_id,
-        )
-        return response.model_dump_json()
+        error = {"code": code, "message": message}
+        if data is not None:
+            error["data"] = data
+        return orjson.dumps(
+            {"jsonrpc": "2.0", "error": error, "id": request_id},
+            default=_json_default,
+        ).decode()
 
 
 # Global MCP server instance
@@ -6,24 +6,35 @@ Model Context Protocol (MCP) tool definitions for project synchronization.
 These tools allow AI assistants to interact with Archon's project sync functionality.
 """
 
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.server.config.logfire_config import get_logger
 from src.server.services.sync.incremental_sync_service import IncrementalSyncService
+from src.server.services.db_pool import get_db_pool
 from src.server.services.knowledge.codebase_source_service import CodebaseSourceService
-from src.server.services.search.project_code_search import ProjectCodeSearchService
+from src.server.services.search.project_code_search import (
+    ProjectCodeSearchService,
+    glob_to_sql_pattern,
+)
+from src.server.services.search.project_search_cache import project_search_cache
 from src.server.utils import get_supabase_client
 
 logger = get_logger(__name__)
 
+# Direct-pool equivalents of the list_project_files / get_file_content RPCs
+LIST_PROJECT_FILES_SQL = "SELECT file_path FROM list_project_files($1, $2)"
+GET_FILE_CONTENT_SQL = "SELECT * FROM get_file_content($1, $2, $3, $4)"
+
 
 # Tool Input Schemas
 class SyncProjectCodebaseInput(BaseModel):
     """Input schema for sync_project_codebase tool"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     project_id: str = Field(..., description="UUID of the project to sync")
-    trigger: str = Field(
+    trigger: Literal["manual", "auto", "git-hook"] = Field(
         default="manual",
         description="Source of sync trigger: manual, auto, git-hook",
     )
@@ -36,6 +47,8 @@ class SyncProjectCodebaseInput(BaseModel):
 class SearchProjectCodeInput(BaseModel):
     """Input schema for search_project_code tool"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     project_id: str = Field(..., description="UUID of the project to search")
     query: str = Field(..., description="Search query (semantic search)")
     match_count: int = Field(default=5, description="Number of results to return")
@@ -48,24 +61,48 @@ class SearchProjectCodeInput(BaseModel):
 class GetProjectSyncStatusInput(BaseModel):
     """Input schema for get_project_sync_status tool"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     project_id: str = Field(..., description="UUID of the project")
 
 
+class GetProjectsSyncStatusBulkInput(BaseModel):
+    """Input schema for get_projects_sync_status_bulk tool"""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    project_ids: List[str] = Field(..., description="UUIDs of the projects")
+
+
 class ListProjectFilesInput(BaseModel):
     """Input schema for list_project_files tool"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     project_id: str = Field(..., description="UUID of the project")
     file_filter: Optional[str] = Field(
         default=None,
-        description="Optional file pattern filter",
+        description="Optional file pattern filter (e.g., '*.py')",
     )
 
 
 class GetFileContentInput(BaseModel):
     """Input schema for get_file_content tool"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     project_id: str = Field(..., description="UUID of the project")
     file_path: str = Field(..., description="Path to file relative to project root")
+    start_chunk: int = Field(
+        default=0,
+        ge=0,
+        description="Index of the first chunk to return",
+    )
+    max_chunks: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of chunks to return (default: all remaining)",
+    )
 
 
 # MCP Tool Definitions
@@ -87,12 +124,13 @@ MCP_TOOLS = [
                     "default": "manual",
                 },
                 "changed_files": {
-                    "type": "array",
+                    "type": ["array", "null"],
                     "items": {"type": "string"},
                     "description": "Optional list of specific files to sync",
                 },
             },
             "required": ["project_id"],
+            "additionalProperties": False,
         },
     },
     {
@@ -115,11 +153,12 @@ MCP_TOOLS = [
                     "description": "Number of results to return",
                 },
                 "file_filter": {
-                    "type": "string",
+                    "type": ["string", "null"],
                     "description": "Optional file pattern filter (e.g., '*.py')",
                 },
             },
             "required": ["project_id", "query"],
+            "additionalProperties": False,
         },
     },
     {
@@ -134,6 +173,23 @@ MCP_TOOLS = [
                 },
             },
             "required": ["project_id"],
+            "additionalProperties": False,
+        },
+    },
+    {
+        "name": "get_projects_sync_status_bulk",
+        "description": "Get synchronization status for several projects at once",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "UUIDs of the projects",
+                },
+            },
+            "required": ["project_ids"],
+            "additionalProperties": False,
         },
     },
     {
@@ -147,11 +203,12 @@ MCP_TOOLS = [
                     "description": "UUID of the project",
                 },
                 "file_filter": {
-                    "type": "string",
-                    "description": "Optional file pattern filter",
+                    "type": ["string", "null"],
+                    "description": "Optional file pattern filter (e.g., '*.py')",
                 },
             },
             "required": ["project_id"],
+            "additionalProperties": False,
         },
     },
     {
@@ -168,8 +225,20 @@ MCP_TOOLS = [
                     "type": "string",
                     "description": "Path to file relative to project root",
                 },
+                "start_chunk": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "default": 0,
+                    "description": "Index of the first chunk to return",
+                },
+                "max_chunks": {
+                    "type": ["integer", "null"],
+                    "minimum": 1,
+                    "description": "Maximum number of chunks to return (default: all remaining)",
+                },
             },
             "required": ["project_id", "file_path"],
+            "additionalProperties": False,
         },
     },
 ]
@@ -231,17 +300,29 @@ async def search_project_code_handler(
         Search results dict
     """
     try:
-        db = get_supabase_client()
-        search_service = ProjectCodeSearchService(db)
-
-        # Perform search
-        results = await search_service.search(
-            project_id=input_data.project_id,
-            query=input_data.query,
-            match_count=input_data.match_count,
-            file_filter=input_data.file_filter,
+        # Same key layout as the REST search route (no language/recency
+        # filters here), so both share cached results until the next sync
+        search_params = (
+            input_data.query,
+            input_data.match_count,
+            input_data.file_filter,
+            None,
+            None,
         )
 
+        results = project_search_cache.get(input_data.project_id, search_params)
+        if results is None:
+            db = get_supabase_client()
+            search_service = ProjectCodeSearchService(db)
+
+            results = await search_service.search(
+                project_id=input_data.project_id,
+                query=input_data.query,
+                match_count=input_data.match_count,
+                file_filter=input_data.file_filter,
+            )
+            project_search_cache.set(input_data.project_id, search_params, results)
+
         logger.info(
             f"MCP tool search_project_code completed",
             extra={
@@ -318,6 +399,67 @@ async def get_project_sync_status_handler(
         }
 
 
+async def get_projects_sync_status_bulk_handler(
+    input_data: GetProjectsSyncStatusBulkInput,
+) -> Dict[str, Any]:
+    """
+    Handler for get_projects_sync_status_bulk MCP tool
+
+    Resolves all sources in one query and their stats in one RPC, instead of
+    calling get_project_sync_status once per project.
+
+    Args:
+        input_data: Validated input data
+
+    Returns:
+        Sync status per project, plus the projects not synced yet
+    """
+    try:
+        db = get_supabase_client()
+        codebase_service = CodebaseSourceService(db)
+
+        sources = await codebase_service.get_by_project_ids(input_data.project_ids)
+        stats = await codebase_service.get_sources_stats(
+            [source["id"] for source in sources.values()]
+        )
+
+        statuses = []
+        for project_id, source in sources.items():
+            source_stats = stats[source["id"]]
+            statuses.append({
+                "project_id": project_id,
+                "source_id": source["id"],
+                "last_synced": source_stats["last_update"],
+                "total_files": source_stats["total_files"],
+                "total_chunks": source_stats["total_chunks"],
+                "sync_enabled": source.get("sync_enabled", False),
+            })
+
+        not_synced = [
+            project_id
+            for project_id in dict.fromkeys(input_data.project_ids)
+            if project_id not in sources
+        ]
+
+        logger.info(
+            "MCP tool get_projects_sync_status_bulk completed",
+            extra={"projects_count": len(input_data.project_ids)},
+        )
+
+        return {
+            "success": True,
+            "statuses": statuses,
+            "not_synced": not_synced,
+        }
+
+    except Exception as e:
+        logger.error("Error in get_projects_sync_status_bulk handler: %s", e)
+        return {
+            "success": False,
+            "error": str(e),
+        }
+
+
 async def list_project_files_handler(
     input_data: ListProjectFilesInput,
 ) -> Dict[str, Any]:
@@ -343,16 +485,21 @@ async def list_project_files_handler(
                 "error": "Project not synced yet",
             }
 
-        # Query distinct file paths
-        query = db.table("knowledge_chunks").select("file_path").eq("source_id", source["id"])
-
-        if input_data.file_filter:
-            query = query.like("file_path", input_data.file_filter)
-
-        response = await query.execute()
-
-        # Get unique file paths
-        file_paths = list(set([item["file_path"] for item in response.data]))
+        # Query distinct file paths (deduplicated in Postgres); the filter is a
+        # glob like the other file_filter arguments, but the SQL side uses LIKE
+        pattern = glob_to_sql_pattern(input_data.file_filter) if input_data.file_filter else None
+        pool = get_db_pool()
+        if pool is not None:
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(LIST_PROJECT_FILES_SQL, source["id"], pattern)
+        else:
+            response = db.rpc(
+                "list_project_files",
+                {"src_id": source["id"], "pattern": pattern},
+            ).execute()
+            rows = response.data
+
+        file_paths = [item["file_path"] for item in rows]
 
         logger.info(
             f"MCP tool list_project_files completed",
@@ -398,41 +545,53 @@ async def get_file_content_handler(
                 "error": "Project not synced yet",
             }
 
-        # Query file chunks
-        response = (
-            await db.table("knowledge_chunks")
-            .select("*")
-            .eq("source_id", source["id"])
-            .eq("file_path", input_data.file_path)
-            .order("chunk_index")
-            .execute()
-        )
+        # Reconstruct file content from chunks server-side; large files can be
+        # read a window of chunks at a time
+        pool = get_db_pool()
+        if pool is not None:
+            async with pool.acquire() as conn:
+                file_row = await conn.fetchrow(
+                    GET_FILE_CONTENT_SQL,
+                    source["id"],
+                    input_data.file_path,
+                    input_data.start_chunk,
+                    input_data.max_chunks,
+                )
+        else:
+            response = db.rpc(
+                "get_file_content",
+                {
+                    "src_id": source["id"],
+                    "fpath": input_data.file_path,
+                    "first_chunk": input_data.start_chunk,
+                    "max_chunks": input_data.max_chunks,
+                },
+            ).execute()
+            file_row = response.data[0] if response.data else None
 
-        if not response.data:
+        if not file_row or not file_row["total_chunks"]:
             return {
                 "success": False,
                 "error": f"File not found: {input_data.file_path}",
             }
 
-        # Reconstruct file content from chunks
-        chunks = response.data
-        content = "\n".join([chunk["content"] for chunk in chunks])
-
         logger.info(
             f"MCP tool get_file_content completed",
             extra={
                 "project_id": input_data.project_id,
                 "file_path": input_data.file_path,
-                "chunks_count": len(chunks),
+                "chunks_count": file_row["chunks_count"],
             },
         )
 
         return {
             "success": True,
             "file_path": input_data.file_path,
-            "content": content,
-            "language": chunks[0].get("language") if chunks else None,
-            "chunks_count": len(chunks),
+            "content": file_row["content"] or "",
+            "language": file_row["language"],
+            "chunks_count": file_row["chunks_count"],
+            "total_chunks": file_row["total_chunks"],
+            "has_more": input_data.start_chunk + file_row["chunks_count"] < file_row["total_chunks"],
         }
 
     except Exception as e:
@@ -443,11 +602,22 @@ async def get_file_content_handler(
         }
 
 
+# Input model per tool; call_tool builds it from the schema-validated arguments
+TOOL_INPUT_MODELS = {
+    "sync_project_codebase": SyncProjectCodebaseInput,
+    "search_project_code": SearchProjectCodeInput,
+    "get_project_sync_status": GetProjectSyncStatusInput,
+    "get_projects_sync_status_bulk": GetProjectsSyncStatusBulkInput,
+    "list_project_files": ListProjectFilesInput,
+    "get_file_content": GetFileContentInput,
+}
+
 # Tool registry mapping tool names to handlers
 TOOL_HANDLERS = {
     "sync_project_codebase": sync_project_codebase_handler,
     "search_project_code": search_project_code_handler,
     "get_project_sync_status": get_project_sync_status_handler,
+    "get_projects_sync_status_bulk": get_projects_sync_status_bulk_handler,
     "list_project_files": list_project_files_handler,
     "get_file_content": get_file_content_handler,
 }
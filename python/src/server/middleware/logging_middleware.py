@@ -5,64 +5,105 @@ Automatically logs requests and responses using logfire when available.
 Follows 2025 best practices for simple, automatic instrumentation.
 """
 
+import logging
 import time
 from collections.abc import Callable
 
 from fastapi import Request, Response
 from fastapi.routing import APIRoute
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..config.logfire_config import LOGFIRE_AVAILABLE, get_logger, is_logfire_enabled
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware that automatically logs HTTP requests and responses.
 
-    Skips health check endpoints to reduce noise.
+    Skips health check endpoints to reduce noise. Implemented as a pure ASGI
+    middleware so requests are not wrapped in the extra task and streaming
+    response conversion that BaseHTTPMiddleware adds.
     """
 
     SKIP_PATHS = {"/health", "/api/health", "/", "/docs", "/redoc", "/openapi.json"}
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.logger = get_logger("middleware")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip logging for certain paths
-        if request.url.path in self.SKIP_PATHS:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip non-HTTP traffic and noisy paths
+        if scope["type"] != "http" or scope["path"] in self.SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
         # Record start time
         start_time = time.time()
 
         # Log the request
         self.logger.info(
-            f"HTTP Request | method={request.method} | path={request.url.path} | client={request.client.host if request.client else 'unknown'}"
+            f"HTTP Request | method={method} | path={path} | client={client[0] if client else 'unknown'}"
         )
 
-        try:
-            # Process the request
-            response = await call_next(request)
-
-            # Calculate duration
-            duration = time.time() - start_time
+        status_code = 500
 
-            # Log the response
-            self.logger.info(
-                f"HTTP Response | method={request.method} | path={request.url.path} | status_code={response.status_code} | duration_ms={round(duration * 1000, 2)}"
-            )
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-            return response
+        try:
+            # Process the request
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as e:
             # Log errors
             duration = time.time() - start_time
             self.logger.error(
-                f"HTTP Error | method={request.method} | path={request.url.path} | error={str(e)} | duration_ms={round(duration * 1000, 2)}"
+                f"HTTP Error | method={method} | path={path} | error={str(e)} | duration_ms={round(duration * 1000, 2)}"
             )
             raise
 
+        # Calculate duration
+        duration = time.time() - start_time
+
+        # Log the response
+        self.logger.info(
+            f"HTTP Response | method={method} | path={path} | status_code={status_code} | duration_ms={round(duration * 1000, 2)}"
+        )
+
+
+class HealthCheckLogFilterMiddleware:
+    """
+    Middleware that silences uvicorn access logs for health check polling.
+
+    Pure ASGI so health probes avoid the BaseHTTPMiddleware per-request overhead.
+    """
+
+    HEALTH_PATHS = {"/health", "/api/health"}
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.access_logger = logging.getLogger("uvicorn.access")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.HEALTH_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Temporarily suppress the access log for this request
+        old_level = self.access_logger.level
+        self.access_logger.setLevel(logging.ERROR)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.access_logger.setLevel(old_level)
+
 
 def instrument_fastapi(app):
     """
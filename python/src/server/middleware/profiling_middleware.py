@@ -0,0 +1,54 @@
+"""
+Profiling Middleware for FastAPI
+
+Opt-in request profiling with pyinstrument. When enabled, adding ``?profile=1``
+to any request (e.g. ``POST /api/projects/{id}/search/code?profile=1``) runs the
+request under the profiler and returns the HTML report instead of the normal
+response. Intended for locating hot spots; leave disabled in production.
+"""
+
+from urllib.parse import parse_qs
+
+from starlette.responses import HTMLResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config.logfire_config import get_logger
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware that profiles requests carrying ``profile=1``."""
+
+    def __init__(self, app: ASGIApp):
+        # Imported here so pyinstrument is only required when profiling is enabled
+        from pyinstrument import Profiler
+
+        self.app = app
+        self.profiler_class = Profiler
+        self.logger = get_logger("profiling")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = self.profiler_class(async_mode="enabled")
+
+        async def discard_send(message: Message) -> None:
+            # The profile report replaces the endpoint's own response
+            pass
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard_send)
+        finally:
+            profiler.stop()
+
+        self.logger.info(f"Profiled request | method={scope['method']} | path={scope['path']}")
+
+        response = HTMLResponse(profiler.output_html())
+        await response(scope, receive, send)
+
+    @staticmethod
+    def _wants_profile(scope: Scope) -> bool:
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        return query.get("profile", ["0"])[-1] in ("1", "true")
@@ -4,19 +4,61 @@ Phase 5, Task 5.6
 Service for collecting and analyzing project sync metrics
 """
 
+import asyncio
+import copy
 import logging
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import datetime, timedelta
+from uuid import UUID
+
+import asyncpg
 from supabase import Client as SupabaseClient
 
+from src.server.utils.ttl_cache import VersionedTTLCache
+
 logger = logging.getLogger(__name__)
 
+# Per-project analytics results served by the API routes, keyed on (metric, days).
+# record_sync_operation invalidates the project, so new operations show up
+# immediately instead of after the TTL.
+sync_analytics_cache = VersionedTTLCache(maxsize=1024, ttl=60.0, copy=copy.deepcopy)
+
+# Operations fetched per round trip when streaming history
+HISTORY_PAGE_SIZE = 500
+
+DAILY_ROLLUP_SQL = """
+    SELECT * FROM sync_operations_daily
+    WHERE project_id = $1 AND date >= $2
+    ORDER BY date
+"""
+
+ERROR_STATS_SQL = "SELECT sync_error_stats($1::uuid, $2)"
+
+# Takes native datetimes; asyncpg prepares it once per connection (statement cache)
+INSERT_OPERATION_SQL = """
+    INSERT INTO sync_operations (
+        project_id, trigger, started_at, completed_at, status, files_processed,
+        chunks_added, chunks_modified, chunks_deleted, duration_seconds, error_message
+    )
+    VALUES ($1::uuid, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+    RETURNING *
+"""
+
 
 class SyncAnalyticsService:
     """Service for sync analytics and performance metrics"""
 
-    def __init__(self, db: SupabaseClient):
+    def __init__(self, db: SupabaseClient, pool: Optional[asyncpg.Pool] = None):
+        """
+        Initialize SyncAnalyticsService.
+
+        Args:
+            db: Supabase client
+            pool: Optional direct Postgres pool; when set, operation inserts and
+                rollup/error reads skip PostgREST
+        """
         self.db = db
+        self.pool = pool
 
     async def record_sync_operation(
         self,
@@ -57,28 +99,49 @@ class SyncAnalyticsService:
             if completed_at and started_at:
                 duration_seconds = (completed_at - started_at).total_seconds()
 
-            operation = {
-                'project_id': project_id,
-                'trigger': trigger,
-                'started_at': started_at.isoformat(),
-                'completed_at': completed_at.isoformat() if completed_at else None,
-                'status': status,
-                'files_processed': files_processed,
-                'chunks_added': chunks_added,
-                'chunks_modified': chunks_modified,
-                'chunks_deleted': chunks_deleted,
-                'duration_seconds': duration_seconds,
-                'error_message': error_message
-            }
+            if self.pool is not None:
+                async with self.pool.acquire() as conn:
+                    row = await conn.fetchrow(
+                        INSERT_OPERATION_SQL,
+                        project_id, trigger, started_at, completed_at, status,
+                        files_processed, chunks_added, chunks_modified, chunks_deleted,
+                        duration_seconds, error_message
+                    )
+
+                # Match PostgREST's row shape (string ids and ISO timestamps)
+                record = {
+                    key: value.isoformat() if isinstance(value, datetime)
+                    else str(value) if isinstance(value, UUID)
+                    else value
+                    for key, value in row.items()
+                }
+            else:
+                operation = {
+                    'project_id': project_id,
+                    'trigger': trigger,
+                    'started_at': started_at.isoformat(),
+                    'completed_at': completed_at.isoformat() if completed_at else None,
+                    'status': status,
+                    'files_processed': files_processed,
+                    'chunks_added': chunks_added,
+                    'chunks_modified': chunks_modified,
+                    'chunks_deleted': chunks_deleted,
+                    'duration_seconds': duration_seconds,
+                    'error_message': error_message
+                }
+
+                result = self.db.table('sync_operations').insert(operation).execute()
+                record = result.data[0] if result.data else operation
 
-            result = self.db.table('sync_operations').insert(operation).execute()
+            # Cached analytics for this project no longer include every operation
+            sync_analytics_cache.invalidate(project_id)
 
-            logger.info(f"Recorded sync operation for project {project_id}: {status}")
+            logger.info("Recorded sync operation for project %s: %s", project_id, status)
 
-            return result.data[0] if result.data else operation
+            return record
 
         except Exception as e:
-            logger.error(f"Failed to record sync operation: {e}")
+            logger.error("Failed to record sync operation: %s", e)
             raise
 
     async def get_sync_history(
@@ -109,9 +172,48 @@ class SyncAnalyticsService:
             return result.data
 
         except Exception as e:
-            logger.error(f"Failed to get sync history: {e}")
+            logger.error("Failed to get sync history: %s", e)
             return []
 
+    async def get_sync_history_stream(
+        self,
+        project_id: str,
+        days: int = 30,
+        page_size: int = HISTORY_PAGE_SIZE
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream sync operation history for a project, one page at a time.
+
+        Unlike get_sync_history, query errors propagate to the caller.
+
+        Args:
+            project_id: Project UUID
+            days: Number of days to look back
+            page_size: Operations fetched per query
+
+        Yields:
+            Sync operations sorted by started_at descending
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=days)
+
+        query = self.db.table('sync_operations') \
+            .select('*') \
+            .eq('project_id', project_id) \
+            .gte('started_at', cutoff_date.isoformat()) \
+            .order('started_at', desc=True) \
+            .order('id')
+
+        offset = 0
+        while True:
+            result = query.range(offset, offset + page_size - 1).execute()
+
+            for operation in result.data:
+                yield operation
+
+            if len(result.data) < page_size:
+                break
+            offset += page_size
+
     async def get_performance_metrics(
         self,
         project_id: str,
@@ -128,51 +230,11 @@ class SyncAnalyticsService:
             Dictionary with performance metrics
         """
         try:
-            history = await self.get_sync_history(project_id, days)
-
-            if not history:
-                return {
-                    'total_syncs': 0,
-                    'successful_syncs': 0,
-                    'failed_syncs': 0,
-                    'average_duration': 0.0,
-                    'total_files_processed': 0,
-                    'total_chunks_added': 0,
-                    'total_chunks_modified': 0,
-                    'total_chunks_deleted': 0,
-                    'success_rate': 0.0,
-                    'syncs_by_trigger': {}
-                }
-
-            successful = [op for op in history if op['status'] == 'success']
-            failed = [op for op in history if op['status'] == 'error']
-
-            durations = [op['duration_seconds'] for op in successful if op.get('duration_seconds')]
-            avg_duration = sum(durations) / len(durations) if durations else 0.0
-
-            # Group by trigger
-            syncs_by_trigger = {}
-            for op in history:
-                trigger = op['trigger']
-                syncs_by_trigger[trigger] = syncs_by_trigger.get(trigger, 0) + 1
-
-            metrics = {
-                'total_syncs': len(history),
-                'successful_syncs': len(successful),
-                'failed_syncs': len(failed),
-                'average_duration': round(avg_duration, 2),
-                'total_files_processed': sum(op.get('files_processed', 0) for op in successful),
-                'total_chunks_added': sum(op.get('chunks_added', 0) for op in successful),
-                'total_chunks_modified': sum(op.get('chunks_modified', 0) for op in successful),
-                'total_chunks_deleted': sum(op.get('chunks_deleted', 0) for op in successful),
-                'success_rate': round(len(successful) / len(history) * 100, 1) if history else 0.0,
-                'syncs_by_trigger': syncs_by_trigger
-            }
-
-            return metrics
+            daily = await self._get_daily_rollups(project_id, days)
+            return self._performance_from_rollups(daily)
 
         except Exception as e:
-            logger.error(f"Failed to get performance metrics: {e}")
+            logger.error("Failed to get performance metrics: %s", e)
             return {}
 
     async def get_error_statistics(
@@ -191,11 +253,20 @@ class SyncAnalyticsService:
             Dictionary with error statistics
         """
         try:
-            history = await self.get_sync_history(project_id, days)
-
-            failed_ops = [op for op in history if op['status'] == 'error']
-
-            if not failed_ops:
+            # Aggregated in Postgres; see migrations/add_sync_error_stats_function.sql
+            if self.pool is not None:
+                async with self.pool.acquire() as conn:
+                    summary = await conn.fetchval(ERROR_STATS_SQL, project_id, days) or {}
+            else:
+                result = self.db.rpc(
+                    'sync_error_stats',
+                    {'pid': project_id, 'num_days': days}
+                ).execute()
+                summary = result.data or {}
+
+            total_errors = summary.get('total_errors', 0)
+
+            if not total_errors:
                 return {
                     'total_errors': 0,
                     'error_rate': 0.0,
@@ -203,38 +274,17 @@ class SyncAnalyticsService:
                     'common_errors': []
                 }
 
-            # Group errors by trigger
-            errors_by_trigger = {}
-            for op in failed_ops:
-                trigger = op['trigger']
-                errors_by_trigger[trigger] = errors_by_trigger.get(trigger, 0) + 1
-
-            # Group errors by message (simplified)
-            error_messages = {}
-            for op in failed_ops:
-                msg = op.get('error_message', 'Unknown error')
-                # Truncate long messages
-                short_msg = msg[:100] + '...' if len(msg) > 100 else msg
-                error_messages[short_msg] = error_messages.get(short_msg, 0) + 1
-
-            # Sort by frequency
-            common_errors = sorted(
-                [{'message': msg, 'count': count} for msg, count in error_messages.items()],
-                key=lambda x: x['count'],
-                reverse=True
-            )[:5]  # Top 5 errors
-
             stats = {
-                'total_errors': len(failed_ops),
-                'error_rate': round(len(failed_ops) / len(history) * 100, 1) if history else 0.0,
-                'errors_by_trigger': errors_by_trigger,
-                'common_errors': common_errors
+                'total_errors': total_errors,
+                'error_rate': round(total_errors / summary['total_operations'] * 100, 1),
+                'errors_by_trigger': summary['errors_by_trigger'],
+                'common_errors': summary['common_errors']
             }
 
             return stats
 
         except Exception as e:
-            logger.error(f"Failed to get error statistics: {e}")
+            logger.error("Failed to get error statistics: %s", e)
             return {}
 
     async def get_growth_metrics(
@@ -253,52 +303,180 @@ class SyncAnalyticsService:
             Dictionary with growth metrics
         """
         try:
-            history = await self.get_sync_history(project_id, days)
+            daily = await self._get_daily_rollups(project_id, days)
+            return self._growth_from_rollups(daily)
 
-            successful = [op for op in history if op['status'] == 'success']
+        except Exception as e:
+            logger.error("Failed to get growth metrics: %s", e)
+            return {}
 
-            if not successful:
-                return {
-                    'growth_by_date': [],
-                    'cumulative_files': 0,
-                    'cumulative_chunks': 0
-                }
+    async def get_all_metrics(
+        self,
+        project_id: str,
+        days: int = 30
+    ) -> Dict:
+        """
+        Get performance, error and growth metrics together.
+
+        Performance and growth are computed from a single rollup fetch, so a
+        dashboard loading all three costs two queries instead of three, and
+        the rollup and error queries run concurrently.
+
+        Args:
+            project_id: Project UUID
+            days: Number of days to analyze
+
+        Returns:
+            Dictionary with 'performance', 'errors' and 'growth' sections; a
+            section is empty if its query failed
+        """
+        # The two reads are independent; over the pool they run on separate connections
+        daily, errors = await asyncio.gather(
+            self._get_daily_rollups(project_id, days),
+            self.get_error_statistics(project_id, days),
+            return_exceptions=True
+        )
+
+        if isinstance(daily, BaseException):
+            logger.error("Failed to get daily rollups: %s", daily)
+            performance, growth = {}, {}
+        else:
+            performance = self._performance_from_rollups(daily)
+            growth = self._growth_from_rollups(daily)
+
+        return {
+            'performance': performance,
+            'errors': errors,
+            'growth': growth
+        }
+
+    async def _get_daily_rollups(
+        self,
+        project_id: str,
+        days: int
+    ) -> List[Dict]:
+        """
+        Get per-day sync counters from the sync_operations_daily rollup.
+
+        The rollup is maintained by a trigger on sync_operations, so this reads
+        at most one row per day regardless of how many syncs ran. Days are UTC
+        calendar days, so the window includes all of the cutoff day.
+
+        Args:
+            project_id: Project UUID
+            days: Number of days to look back
+
+        Returns:
+            List of daily rollup rows sorted by date ascending
+        """
+        cutoff_date = (datetime.utcnow() - timedelta(days=days)).date()
+
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(DAILY_ROLLUP_SQL, project_id, cutoff_date)
+            # Match PostgREST's row shape (ISO date strings)
+            return [
+                {**row, 'date': row['date'].isoformat()}
+                for row in map(dict, rows)
+            ]
+
+        result = self.db.table('sync_operations_daily') \
+            .select('*') \
+            .eq('project_id', project_id) \
+            .gte('date', cutoff_date.isoformat()) \
+            .order('date') \
+            .execute()
+
+        return result.data
+
+    def _performance_from_rollups(self, daily: List[Dict]) -> Dict:
+        """
+        Compute performance metrics from daily rollup rows.
+
+        Args:
+            daily: Rows from _get_daily_rollups
+
+        Returns:
+            Dictionary with performance metrics
+        """
+        total_syncs = sum(day['syncs_count'] for day in daily)
+
+        if not total_syncs:
+            return {
+                'total_syncs': 0,
+                'successful_syncs': 0,
+                'failed_syncs': 0,
+                'average_duration': 0.0,
+                'total_files_processed': 0,
+                'total_chunks_added': 0,
+                'total_chunks_modified': 0,
+                'total_chunks_deleted': 0,
+                'success_rate': 0.0,
+                'syncs_by_trigger': {}
+            }
+
+        successful = sum(day['successful'] for day in daily)
+        timed_syncs = sum(day['timed_syncs'] for day in daily)
+        total_duration = sum(day['total_duration_seconds'] for day in daily)
+        avg_duration = total_duration / timed_syncs if timed_syncs else 0.0
+
+        # Merge per-day trigger counts
+        syncs_by_trigger = {}
+        for day in daily:
+            for trigger, count in day['syncs_by_trigger'].items():
+                syncs_by_trigger[trigger] = syncs_by_trigger.get(trigger, 0) + count
+        syncs_by_trigger = {trigger: count for trigger, count in syncs_by_trigger.items() if count}
+
+        metrics = {
+            'total_syncs': total_syncs,
+            'successful_syncs': successful,
+            'failed_syncs': sum(day['failed'] for day in daily),
+            'average_duration': round(avg_duration, 2),
+            'total_files_processed': sum(day['files_processed'] for day in daily),
+            'total_chunks_added': sum(day['chunks_added'] for day in daily),
+            'total_chunks_modified': sum(day['chunks_modified'] for day in daily),
+            'total_chunks_deleted': sum(day['chunks_deleted'] for day in daily),
+            'success_rate': round(successful / total_syncs * 100, 1),
+            'syncs_by_trigger': syncs_by_trigger
+        }
+
+        return metrics
+
+    def _growth_from_rollups(self, daily: List[Dict]) -> Dict:
+        """
+        Compute growth metrics from daily rollup rows.
 
-            # Group by date
-            growth_by_date = {}
-            for op in successful:
-                date = op['started_at'][:10]  # Extract date (YYYY-MM-DD)
-                if date not in growth_by_date:
-                    growth_by_date[date] = {
-                        'date': date,
-                        'files_processed': 0,
-                        'chunks_added': 0,
-                        'chunks_modified': 0,
-                        'chunks_deleted': 0,
-                        'syncs_count': 0
-                    }
-
-                growth_by_date[date]['files_processed'] += op.get('files_processed', 0)
-                growth_by_date[date]['chunks_added'] += op.get('chunks_added', 0)
-                growth_by_date[date]['chunks_modified'] += op.get('chunks_modified', 0)
-                growth_by_date[date]['chunks_deleted'] += op.get('chunks_deleted', 0)
-                growth_by_date[date]['syncs_count'] += 1
-
-            # Convert to list and sort by date
-            growth_list = sorted(growth_by_date.values(), key=lambda x: x['date'])
-
-            # Calculate cumulative totals
-            cumulative_files = sum(op.get('files_processed', 0) for op in successful)
-            cumulative_chunks = sum(op.get('chunks_added', 0) for op in successful)
-
-            metrics = {
-                'growth_by_date': growth_list,
-                'cumulative_files': cumulative_files,
-                'cumulative_chunks': cumulative_chunks
+        Args:
+            daily: Rows from _get_daily_rollups
+
+        Returns:
+            Dictionary with growth metrics
+        """
+        # Growth only counts successful syncs; rollup rows arrive sorted by date
+        growth_list = [
+            {
+                'date': day['date'],
+                'files_processed': day['files_processed'],
+                'chunks_added': day['chunks_added'],
+                'chunks_modified': day['chunks_modified'],
+                'chunks_deleted': day['chunks_deleted'],
+                'syncs_count': day['successful']
+            }
+            for day in daily
+            if day['successful']
+        ]
+
+        if not growth_list:
+            return {
+                'growth_by_date': [],
+                'cumulative_files': 0,
+                'cumulative_chunks': 0
             }
 
-            return metrics
+        metrics = {
+            'growth_by_date': growth_list,
+            'cumulative_files': sum(day['files_processed'] for day in growth_list),
+            'cumulative_chunks': sum(day['chunks_added'] for day in growth_list)
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to get growth metrics: {e}")
-            return {}
+        return metrics
@@ -0,0 +1,74 @@
+"""
+Direct Postgres Connection Pool
+
+Optional asyncpg pool for hot read paths (sync analytics dashboards, MCP file
+listing and content, codebase source stats) that would otherwise pay a
+PostgREST HTTP round trip per query. Enabled only when SUPABASE_DB_URL is set;
+callers fall back to the Supabase client otherwise.
+"""
+
+import os
+
+import asyncpg
+import orjson
+
+from ..config.logfire_config import get_logger
+
+logger = get_logger(__name__)
+
+_pool: asyncpg.Pool | None = None
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb columns to Python objects, matching what PostgREST returns"""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=lambda value: orjson.dumps(value).decode(),
+            decoder=orjson.loads,
+            schema="pg_catalog",
+        )
+
+
+async def init_db_pool() -> asyncpg.Pool | None:
+    """
+    Create the shared connection pool if SUPABASE_DB_URL is configured.
+
+    Returns:
+        The pool, or None when no database URL is set
+    """
+    global _pool
+
+    dsn = os.getenv("SUPABASE_DB_URL")
+    if not dsn or _pool is not None:
+        return _pool
+
+    _pool = await asyncpg.create_pool(
+        dsn=dsn,
+        min_size=int(os.getenv("SUPABASE_DB_POOL_MIN_SIZE", "5")),
+        max_size=int(os.getenv("SUPABASE_DB_POOL_MAX_SIZE", "20")),
+        # Transaction-mode poolers can't hold prepared statements across queries
+        statement_cache_size=int(os.getenv("SUPABASE_DB_STATEMENT_CACHE_SIZE", "100")),
+        init=_init_connection,
+    )
+    logger.info("Postgres connection pool created")
+    return _pool
+
+
+def get_db_pool() -> asyncpg.Pool | None:
+    """
+    Get the shared connection pool.
+
+    Returns:
+        The pool, or None if init_db_pool has not created one
+    """
+    return _pool
+
+
+async def close_db_pool() -> None:
+    """Close the shared connection pool, if any."""
+    global _pool
+
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
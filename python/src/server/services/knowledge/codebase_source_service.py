@@ -1,12 +1,19 @@
 # File: python/src/server/services/knowledge/codebase_source_service.py
 
-from typing import Dict, Optional
-from datetime import datetime
-import uuid
+from typing import Dict, List, Optional
 import logging
 
+from src.server.services.db_pool import get_db_pool
+from src.server.utils.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# project_id -> source row. Sources only appear on first sync and disappear on
+# delete, so a burst of MCP calls for one project can share a single lookup.
+_source_cache = TTLCache(maxsize=1024, ttl=30)
+
+SOURCES_STATS_SQL = "SELECT * FROM sources_stats_bulk($1::text[])"
+
 
 class CodebaseSourceService:
     """
@@ -33,78 +40,151 @@ class CodebaseSourceService:
         Returns:
             source_id: UUID of the codebase source
         """
-        source_name = f"project_codebase_{project_id}"
+        cached = _source_cache.get(project_id)
+        if cached is not None:
+            return cached['source_id']
+
+        # Single INSERT ... ON CONFLICT, so concurrent syncs share one source
+        result = self.db.rpc(
+            'get_or_create_codebase_source',
+            {'pid': project_id, 'project_title': project_title}
+        ).execute()
+
+        row = result.data[0]
+        if row['created']:
+            logger.info(f"Created codebase source {row['source_id']} for project {project_id}")
+        return row['source_id']
+
+    async def get_by_project_id(self, project_id: str) -> Optional[Dict]:
+        """
+        Get the codebase source linked to a project.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Source row (with ``id`` aliased to ``source_id``) or None if the
+            project has no codebase source yet
+        """
+        cached = _source_cache.get(project_id)
+        if cached is not None:
+            return dict(cached)
 
-        # Check if source exists
         result = self.db.table('archon_sources')\
-            .select('source_id')\
+            .select('id:source_id, source_id, title, metadata')\
             .eq('metadata->>project_id', project_id)\
+            .limit(1)\
             .execute()
 
-        if result.data and len(result.data) > 0:
-            return result.data[0]['source_id']
-
-        # Create new source
-        source_id = str(uuid.uuid4())
-        insert_result = self.db.table('archon_sources')\
-            .insert({
-                'source_id': source_id,
-                'source_url': f"project://{project_id}",
-                'source_display_name': f"{project_title} (Codebase)",
-                'title': f"{project_title} Codebase",
-                'summary': f"Codebase for project {project_title}",
-                'metadata': {
-                    'project_id': project_id,
-                    'auto_synced': True,
-                    'source_type': 'codebase',
-                    'created_at': datetime.now().isoformat()
-                }
-            })\
-            .execute()
-
-        logger.info(f"Created codebase source {source_id} for project {project_id}")
-        return source_id
+        if result.data:
+            # Misses aren't cached: another process may create the source at any time
+            _source_cache.set(project_id, result.data[0])
+            return dict(result.data[0])
+        return None
 
-    async def get_source_stats(self, source_id: str) -> Dict:
+    async def get_by_project_ids(self, project_ids: List[str]) -> Dict[str, Dict]:
         """
-        Get statistics for a codebase source.
+        Get the codebase sources linked to several projects.
+
+        Cached sources are reused; the rest are fetched in a single query.
+
+        Args:
+            project_ids: Project UUIDs
 
         Returns:
-            Dict with total_files, total_chunks, last_update
+            Mapping of project_id to source row (as from get_by_project_id);
+            projects without a codebase source are omitted
         """
-        # Count chunks
-        chunks_result = self.db.table('knowledge_chunks')\
-            .select('id', count='exact')\
-            .eq('source_id', source_id)\
-            .execute()
+        sources = {}
+        missing = []
+        for project_id in dict.fromkeys(project_ids):
+            cached = _source_cache.get(project_id)
+            if cached is not None:
+                sources[project_id] = dict(cached)
+            else:
+                missing.append(project_id)
+
+        if missing:
+            result = self.db.table('archon_sources')\
+                .select('id:source_id, source_id, title, metadata')\
+                .in_('metadata->>project_id', missing)\
+                .execute()
+
+            for row in result.data or []:
+                project_id = row['metadata']['project_id']
+                if project_id not in sources:
+                    _source_cache.set(project_id, row)
+                    sources[project_id] = dict(row)
+
+        return sources
+
+    async def get_project_stats(self, project_id: str) -> Optional[Dict]:
+        """
+        Get statistics for a project's codebase source by project ID.
 
-        total_chunks = chunks_result.count or 0
+        Resolving the source from the project ID (rather than the project row's
+        codebase_source_id) lets callers fetch stats concurrently with the project.
 
-        # Get unique file count from metadata
-        files_result = await self.db.rpc(
-            'count_unique_files',
-            {'src_id': source_id}
-        ).execute()
+        Args:
+            project_id: Project UUID
 
-        total_files = files_result.data if files_result.data else 0
+        Returns:
+            Source statistics, or None if the project has no codebase source
+        """
+        source = await self.get_by_project_id(project_id)
+        if not source:
+            return None
+        return await self.get_source_stats(source['id'])
 
-        # Get last update timestamp
-        last_update_result = await self.db.table('knowledge_chunks')\
-            .select('created_at')\
-            .eq('source_id', source_id)\
-            .order('created_at', desc=True)\
-            .limit(1)\
-            .execute()
+    async def get_source_stats(self, source_id: str) -> Dict:
+        """
+        Get statistics for a codebase source.
 
-        last_update = None
-        if last_update_result.data and len(last_update_result.data) > 0:
-            last_update = last_update_result.data[0]['created_at']
+        Returns:
+            Dict with total_files, total_chunks, last_update
+        """
+        stats = await self.get_sources_stats([source_id])
+        return stats[source_id]
 
-        return {
-            'total_files': total_files,
-            'total_chunks': total_chunks,
-            'last_update': last_update
+    async def get_sources_stats(self, source_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get statistics for several codebase sources with one grouped query.
+
+        Returns:
+            Mapping of source_id to a dict with total_files, total_chunks,
+            last_update; sources without chunks get zero counts
+        """
+        stats = {
+            source_id: {'total_files': 0, 'total_chunks': 0, 'last_update': None}
+            for source_id in source_ids
         }
+        if not source_ids:
+            return stats
+
+        pool = get_db_pool()
+        if pool is not None:
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(SOURCES_STATS_SQL, list(source_ids))
+            # Match PostgREST's row shape (ISO timestamp strings)
+            rows = [
+                {**row, 'last_update': row['last_update'] and row['last_update'].isoformat()}
+                for row in map(dict, rows)
+            ]
+        else:
+            result = self.db.rpc(
+                'sources_stats_bulk',
+                {'src_ids': list(source_ids)}
+            ).execute()
+            rows = result.data or []
+
+        for row in rows:
+            stats[row['source_id']] = {
+                'total_files': row['total_files'],
+                'total_chunks': row['total_chunks'],
+                'last_update': row['last_update']
+            }
+
+        return stats
 
     async def delete_codebase_source(self, source_id: str) -> None:
         """
@@ -114,15 +194,23 @@ class CodebaseSourceService:
             source_id: UUID of the source to delete
         """
         # Delete chunks (cascade should handle this, but explicit is safer)
-        await self.db.table('knowledge_chunks')\
+        self.db.table('knowledge_chunks')\
             .delete()\
             .eq('source_id', source_id)\
             .execute()
 
         # Delete source
-        await self.db.table('knowledge_sources')\
+        self.db.table('knowledge_sources')\
             .delete()\
             .eq('source_id', source_id)\
             .execute()
 
+        # Entries are keyed by project, and deletes are rare enough to drop them all
+        _source_cache.clear()
+
+        # Cached searches would keep serving the deleted chunks until their TTL.
+        # Deferred: importing services.search loads the RAG stack
+        from src.server.services.search.project_search_cache import project_search_cache
+        project_search_cache.clear()
+
         logger.info(f"Deleted codebase source {source_id}")
@@ -4,13 +4,76 @@ Phase 1, Task 1.2
 Adds sync configuration methods to ProjectService
 """
 
-from typing import Optional, Dict, List
-from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional, Dict, List, Tuple
+from datetime import datetime, timezone
+import asyncio
 import os
 import logging
+import time
+
+from src.server.services.projects.project_service import ProjectService
+from src.server.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# System directories a project may not be linked to
+FORBIDDEN_PATH_PREFIXES = (
+    '/etc', '/usr', '/bin', '/sbin', '/sys', '/proc',
+    'C:\\Windows', 'C:\\Program Files', '/var/lib', '/root',
+    '/System', '/Library/System'
+)
+
+# Compared against normcase()d paths, so Windows matches regardless of case
+_FORBIDDEN_NORMCASED = tuple(os.path.normcase(prefix) for prefix in FORBIDDEN_PATH_PREFIXES)
+
+# resolved path -> (exists, readable, is_dir); short TTL so filesystem changes
+# are still noticed when a path is re-validated
+_path_probe_cache = TTLCache(maxsize=512, ttl=5)
+
+# local_path -> project row for every project with a local path. File-watcher
+# events resolve against this map instead of the database; it is rebuilt when
+# this process changes a local_path, and at most PROJECT_ROOTS_TTL seconds
+# after another worker does.
+PROJECT_ROOTS_TTL = 30.0
+_project_roots: Optional[Dict[str, Dict]] = None
+_project_roots_loaded_at = 0.0
+
+
+def _invalidate_project_roots() -> None:
+    """Force the next get_project_by_path call to reload project roots"""
+    global _project_roots
+    _project_roots = None
+
+
+def _probe_path(resolved: str) -> Tuple[bool, bool, bool]:
+    """Return (exists, readable, is_dir) for a path, reusing recent results"""
+    probe = _path_probe_cache.get(resolved)
+    if probe is None:
+        probe = (
+            os.path.exists(resolved),
+            os.access(resolved, os.R_OK),
+            os.path.isdir(resolved),
+        )
+        _path_probe_cache.set(resolved, probe)
+    return probe
+
+
+def _path_prefixes(file_path: str) -> List[str]:
+    """
+    List every directory a file path lives under, with and without a trailing
+    separator, so a project can be matched on local_path equality.
+    """
+    prefixes = []
+    path = file_path
+    while True:
+        prefixes.append(path)
+        if not path.endswith(os.sep):
+            prefixes.append(path + os.sep)
+        parent = os.path.dirname(path)
+        if parent == path:
+            return prefixes
+        path = parent
+
 
 class ProjectServiceSyncMixin:
     """
@@ -25,7 +88,8 @@ class ProjectServiceSyncMixin:
         project_id: str,
         local_path: Optional[str] = None,
         sync_mode: Optional[str] = None,
-        auto_sync_enabled: Optional[bool] = None
+        auto_sync_enabled: Optional[bool] = None,
+        now_iso: Optional[str] = None
     ) -> Dict:
         """
         Update sync configuration for a project.
@@ -35,6 +99,8 @@ class ProjectServiceSyncMixin:
             local_path: Absolute path to project directory
             sync_mode: 'manual', 'realtime', 'periodic', or 'git-hook'
             auto_sync_enabled: Enable/disable automatic sync
+            now_iso: UTC ISO timestamp for updated_at, shared across a batch of
+                updates; the current time if omitted
 
         Returns:
             Updated project data
@@ -55,18 +121,23 @@ class ProjectServiceSyncMixin:
         if auto_sync_enabled is not None:
             update_data['auto_sync_enabled'] = auto_sync_enabled
 
-        update_data['updated_at'] = datetime.now().isoformat()
+        update_data['updated_at'] = now_iso or datetime.now(timezone.utc).isoformat()
 
         # Update database
-        result = await self.db.table('projects')\
-            .update(update_data)\
-            .eq('id', project_id)\
-            .execute()
+        result = await asyncio.to_thread(
+            self.db.table('projects')
+            .update(update_data)
+            .eq('id', project_id)
+            .execute
+        )
 
         if not result.data:
             raise ValueError(f"Project not found: {project_id}")
 
-        logger.info(f"Updated sync config for project {project_id}: {update_data}")
+        if local_path is not None:
+            _invalidate_project_roots()
+
+        logger.info("Updated sync config for project %s: %s", project_id, update_data)
         return result.data[0]
 
     def _validate_local_path(self, path: str) -> None:
@@ -80,29 +151,24 @@ class ProjectServiceSyncMixin:
         resolved = os.path.abspath(os.path.expanduser(path))
 
         # Deny system directories (security)
-        forbidden_prefixes = [
-            '/etc', '/usr', '/bin', '/sbin', '/sys', '/proc',
-            'C:\\Windows', 'C:\\Program Files', '/var/lib', '/root',
-            'C:\\Windows\\System32', '/System', '/Library/System'
-        ]
+        if os.path.normcase(resolved).startswith(_FORBIDDEN_NORMCASED):
+            raise ValueError(
+                f"Cannot access system directory: {resolved}. "
+                "Please link to a user project directory."
+            )
 
-        for forbidden in forbidden_prefixes:
-            if resolved.startswith(forbidden):
-                raise ValueError(
-                    f"Cannot access system directory: {resolved}. "
-                    "Please link to a user project directory."
-                )
+        exists, readable, is_dir = _probe_path(resolved)
 
         # Check existence
-        if not os.path.exists(resolved):
+        if not exists:
             raise ValueError(f"Path does not exist: {resolved}")
 
         # Check read permission
-        if not os.access(resolved, os.R_OK):
+        if not readable:
             raise ValueError(f"No read permission for path: {resolved}")
 
         # Check if it's a directory
-        if not os.path.isdir(resolved):
+        if not is_dir:
             raise ValueError(f"Path is not a directory: {resolved}")
 
     async def get_projects_with_auto_sync(self) -> List[Dict]:
@@ -112,20 +178,58 @@ class ProjectServiceSyncMixin:
         Returns:
             List of project data with local_path configured
         """
-        result = await self.db.table('projects')\
-            .select('*')\
-            .eq('auto_sync_enabled', True)\
-            .not_.is_('local_path', 'null')\
-            .execute()
+        result = await asyncio.to_thread(
+            self.db.table('projects')
+            .select('*')
+            .eq('auto_sync_enabled', True)
+            .not_.is_('local_path', 'null')
+            .execute
+        )
 
         return result.data if result.data else []
 
+    async def run_auto_sync_for_all(
+        self,
+        worker: Callable[[Dict], Awaitable[None]],
+        concurrency: int = 8
+    ) -> List[Any]:
+        """
+        Run a sync worker for every auto-sync project, a bounded number at a time.
+
+        Args:
+            worker: Coroutine function called with each project's data
+            concurrency: Maximum number of workers running at once
+
+        Returns:
+            One entry per project, in order: the worker's result, or the
+            exception it raised (one failing project does not stop the others)
+        """
+        projects = await self.get_projects_with_auto_sync()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(project: Dict) -> Any:
+            async with semaphore:
+                return await worker(project)
+
+        results = await asyncio.gather(
+            *(run(project) for project in projects),
+            return_exceptions=True
+        )
+
+        for project, result in zip(projects, results, strict=True):
+            # BaseException so a cancelled worker isn't taken for a success
+            if isinstance(result, BaseException):
+                logger.error("Auto-sync failed for project %s: %s", project.get('id'), result)
+
+        return results
+
     async def update_project_sync_status(
         self,
         project_id: str,
         status: str,
         last_sync_at: Optional[datetime] = None,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        now_iso: Optional[str] = None
     ) -> None:
         """
         Update sync status after sync operation.
@@ -135,10 +239,11 @@ class ProjectServiceSyncMixin:
             status: 'synced', 'syncing', 'error', or 'never_synced'
             last_sync_at: Timestamp of sync completion
             error_message: Error details if status is 'error'
+            now_iso: UTC ISO timestamp for updated_at; the current time if omitted
         """
         update_data = {
             'sync_status': status,
-            'updated_at': datetime.now().isoformat()
+            'updated_at': now_iso or datetime.now(timezone.utc).isoformat()
         }
 
         if last_sync_at:
@@ -150,12 +255,45 @@ class ProjectServiceSyncMixin:
             # Clear error on successful sync
             update_data['last_sync_error'] = None
 
-        await self.db.table('projects')\
-            .update(update_data)\
-            .eq('id', project_id)\
-            .execute()
+        await asyncio.to_thread(
+            self.db.table('projects')
+            .update(update_data)
+            .eq('id', project_id)
+            .execute
+        )
 
-        logger.info(f"Updated sync status for project {project_id}: {status}")
+        logger.info("Updated sync status for project %s: %s", project_id, status)
+
+    async def bulk_update_sync_status(
+        self,
+        updates: List[Tuple[str, str, Optional[datetime], Optional[str]]]
+    ) -> None:
+        """
+        Update sync status for many projects in one database call.
+
+        Applies the same rules as update_project_sync_status to each entry.
+
+        Args:
+            updates: (project_id, status, last_sync_at, error_message) per project
+        """
+        if not updates:
+            return
+
+        payload = [
+            {
+                'id': project_id,
+                'status': status,
+                'last_sync_at': last_sync_at.isoformat() if last_sync_at else None,
+                'error': error_message
+            }
+            for project_id, status, last_sync_at, error_message in updates
+        ]
+
+        await asyncio.to_thread(
+            self.db.rpc('sync_status_bulk_update', {'p': payload}).execute
+        )
+
+        logger.info("Updated sync status for %d projects", len(updates))
 
     async def get_project_by_path(self, file_path: str) -> Optional[Dict]:
         """
@@ -167,19 +305,44 @@ class ProjectServiceSyncMixin:
         Returns:
             Project data if found, None otherwise
         """
-        # Get all projects with local paths
-        result = await self.db.table('projects')\
-            .select('*')\
-            .not_.is_('local_path', 'null')\
-            .execute()
+        roots = await self._get_project_roots()
 
-        if not result.data:
-            return None
-
-        # Check if file_path is within any project's local_path
-        for project in result.data:
-            project_path = project.get('local_path')
-            if project_path and file_path.startswith(project_path):
-                return project
+        # Ancestors come deepest first, so nested projects resolve to the innermost root
+        for prefix in _path_prefixes(file_path):
+            project = roots.get(prefix)
+            if project is not None:
+                return dict(project)
 
         return None
+
+    async def _get_project_roots(self) -> Dict[str, Dict]:
+        """
+        Get the local_path -> project map, reloading it when stale.
+
+        Returns:
+            Mapping of each project's local_path to its project row
+        """
+        global _project_roots, _project_roots_loaded_at
+
+        if _project_roots is not None and time.monotonic() - _project_roots_loaded_at < PROJECT_ROOTS_TTL:
+            return _project_roots
+
+        result = await asyncio.to_thread(
+            self.db.table('projects')
+            .select('*')
+            .not_.is_('local_path', 'null')
+            .execute
+        )
+
+        _project_roots = {project['local_path']: project for project in result.data or []}
+        _project_roots_loaded_at = time.monotonic()
+        return _project_roots
+
+
+class SyncProjectService(ProjectServiceSyncMixin, ProjectService):
+    """ProjectService with the sync methods, as used by the sync API and IncrementalSyncService."""
+
+    def __init__(self, supabase_client=None):
+        super().__init__(supabase_client)
+        # The mixin talks to the database through self.db
+        self.db = self.supabase_client
@@ -9,9 +9,11 @@ Uses the rerank-english-v3.0 model by default.
 """
 
 import os
+from operator import itemgetter
 from typing import Any
 
 import httpx
+import orjson
 
 from ...config.logfire_config import get_logger, safe_span
 
@@ -23,6 +25,29 @@ DEFAULT_COHERE_MODEL = "rerank-english-v3.0"
 # Cohere API endpoint
 COHERE_RERANK_URL = "https://api.cohere.ai/v1/rerank"
 
+# One keep-alive HTTP/2 client per process: strategies are built per RAGService
+# (i.e. per search request), and concurrent reranks multiplex over one connection
+_shared_client: httpx.AsyncClient | None = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide Cohere HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide Cohere HTTP client, if one was opened."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
 
 class CohereRerankingStrategy:
     """Strategy class implementing result reranking using Cohere's Rerank API"""
@@ -44,7 +69,7 @@ class CohereRerankingStrategy:
         self.api_key = api_key or os.getenv("COHERE_API_KEY")
         self.model_name = model_name
         self.timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._client = _get_shared_client()
 
     def is_available(self) -> bool:
         """Check if reranking is available (API key is set)."""
@@ -64,18 +89,21 @@ class CohereRerankingStrategy:
         Returns:
             Tuple of (document texts, valid indices)
         """
-        texts = []
-        valid_indices = []
+        pairs = [
+            (i, content)
+            for i, result in enumerate(results)
+            if (content := result.get(content_key)) and type(content) is str
+        ]
 
-        for i, result in enumerate(results):
-            content = result.get(content_key, "")
-            if content and isinstance(content, str):
-                texts.append(content)
-                valid_indices.append(i)
-            else:
-                logger.warning(f"Result {i} has no valid content for reranking")
+        skipped = len(results) - len(pairs)
+        if skipped:
+            logger.warning("%d of %d results have no valid content for reranking", skipped, len(results))
 
-        return texts, valid_indices
+        if not pairs:
+            return [], []
+
+        valid_indices, texts = zip(*pairs, strict=True)
+        return list(texts), list(valid_indices)
 
     def apply_rerank_scores(
         self,
@@ -96,21 +124,14 @@ class CohereRerankingStrategy:
         Returns:
             Reranked and sorted list of results
         """
-        # Create a mapping of original index to rerank score
-        index_to_score = {}
+        # Results Cohere didn't score (no content, or beyond top_n) sort last
+        for result in results:
+            result["rerank_score"] = -1.0
         for rerank_item in rerank_results:
-            original_idx = valid_indices[rerank_item["index"]]
-            index_to_score[original_idx] = rerank_item["relevance_score"]
-
-        # Add rerank scores to results
-        for i, result in enumerate(results):
-            if i in index_to_score:
-                result["rerank_score"] = index_to_score[i]
-            else:
-                result["rerank_score"] = -1.0
+            results[valid_indices[rerank_item["index"]]]["rerank_score"] = rerank_item["relevance_score"]
 
         # Sort results by rerank score (descending - highest relevance first)
-        reranked_results = sorted(results, key=lambda x: x.get("rerank_score", -1.0), reverse=True)
+        reranked_results = sorted(results, key=itemgetter("rerank_score"), reverse=True)
 
         # Apply top_k limit if specified
         if top_k is not None and top_k > 0:
@@ -144,6 +165,13 @@ class CohereRerankingStrategy:
         with safe_span(
             "cohere_rerank_results", result_count=len(results), model_name=self.model_name
         ) as span:
+            # A single result has no order to change; don't spend an API call on it.
+            # Larger lists are sent even when len(results) <= top_k, since the
+            # rerank still reorders them.
+            if len(results) == 1:
+                span.set_attribute("rerank_skipped", True)
+                return results
+
             try:
                 # Build document list
                 documents, valid_indices = self.build_query_document_pairs(
@@ -175,11 +203,12 @@ class CohereRerankingStrategy:
                 with safe_span("cohere_api_request"):
                     response = await self._client.post(
                         COHERE_RERANK_URL,
-                        json=request_data,
+                        content=orjson.dumps(request_data),
                         headers=headers,
+                        timeout=self.timeout,
                     )
                     response.raise_for_status()
-                    data = response.json()
+                    data = orjson.loads(response.content)
 
                 # Extract reranking results
                 rerank_results = data.get("results", [])
@@ -199,23 +228,23 @@ class CohereRerankingStrategy:
                 if scores:
                     span.set_attribute("score_range", f"{min(scores):.3f}-{max(scores):.3f}")
                     logger.debug(
-                        f"Reranked {len(documents)} results with Cohere, score range: {min(scores):.3f}-{max(scores):.3f}"
+                        "Reranked %d results with Cohere, score range: %.3f-%.3f",
+                        len(documents), min(scores), max(scores)
                     )
 
                 return reranked_results
 
             except httpx.HTTPStatusError as e:
-                logger.error(f"Cohere API error: {e.response.status_code} - {e.response.text}")
+                logger.error("Cohere API error: %s - %s", e.response.status_code, e.response.text)
                 span.set_attribute("error", f"HTTP {e.response.status_code}")
                 return results
             except Exception as e:
-                logger.error(f"Error during Cohere reranking: {e}")
+                logger.error("Error during Cohere reranking: %s", e)
                 span.set_attribute("error", str(e))
                 return results
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """No-op: the HTTP client is shared and closed by close_shared_client() at shutdown."""
 
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the Cohere reranking configuration."""
@@ -253,7 +282,7 @@ class CohereRerankingConfig:
                 "top_k": top_k if top_k > 0 else None,
             }
         except Exception as e:
-            logger.error(f"Error loading Cohere reranking config: {e}")
+            logger.error("Error loading Cohere reranking config: %s", e)
             return {
                 "enabled": False,
                 "api_key": None,
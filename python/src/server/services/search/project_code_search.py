@@ -5,7 +5,7 @@ Phase 5, Task 5.3
 Service for project-scoped semantic code search with filtering capabilities.
 """
 
-import fnmatch
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
@@ -15,6 +15,26 @@ from src.server.services.knowledge.codebase_source_service import CodebaseSource
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
+def glob_to_sql_pattern(glob_pattern: str) -> str:
+    """
+    Convert glob pattern to SQL LIKE pattern
+
+    Results are memoized since clients resend the same few filters.
+
+    Args:
+        glob_pattern: Glob pattern (e.g., '*.py', 'src/**/*.ts')
+
+    Returns:
+        SQL LIKE pattern
+    """
+    # Convert glob wildcards to SQL wildcards
+    # * -> %
+    # ? -> _
+    # Simplified conversion (full implementation would handle more cases)
+    return glob_pattern.replace("*", "%").replace("?", "_")
+
+
 class ProjectCodeSearchService:
     """Service for searching code within specific projects"""
 
@@ -68,44 +88,38 @@ class ProjectCodeSearchService:
             # In production, would use: embedding = await self.embedding_service.embed_text(query)
             # For now, using placeholder
             embedding = await self._generate_embedding(query)
+            # A zero vector has no direction to rank by, so fall back to
+            # filter-only search until real embeddings are wired in
+            query_embedding = embedding if any(embedding) else None
 
-            # Build query with filters
-            query_builder = (
-                self.db.table("knowledge_chunks")
-                .select(
-                    "id, file_path, chunk_index, content, start_line, end_line, language, updated_at"
-                )
-                .eq("source_id", source_id)
-            )
-
-            # Apply file filter (convert glob pattern to SQL LIKE)
-            if file_filter:
-                sql_pattern = self._glob_to_sql_pattern(file_filter)
-                query_builder = query_builder.like("file_path", sql_pattern)
-
-            # Apply language filter
-            if language_filter:
-                query_builder = query_builder.eq("language", language_filter)
-
-            # Apply recency filter
+            cutoff_date = None
             if recency_days:
                 cutoff_date = datetime.now() - timedelta(days=recency_days)
-                query_builder = query_builder.gte("updated_at", cutoff_date.isoformat())
 
-            # Execute search
-            # Note: Actual vector similarity search would use RPC function
-            # For now, using basic query
-            response = await query_builder.limit(match_count).execute()
+            # Filters and vector ranking run in one server-side query; see
+            # migrations/add_project_code_search_function.sql
+            response = self.db.rpc(
+                "project_code_search",
+                {
+                    "src_id": source_id,
+                    "query_embedding": query_embedding,
+                    "file_like": self._glob_to_sql_pattern(file_filter) if file_filter else None,
+                    "lang": language_filter,
+                    "since": cutoff_date.isoformat() if cutoff_date else None,
+                    "match_limit": match_count,
+                },
+            ).execute()
 
             results = response.data
 
-            # In production, would calculate similarity scores using pgvector
-            # For now, adding placeholder similarity
-            for result in results:
-                result["similarity"] = 0.85  # Placeholder
+            # Ranked searches get similarity from pgvector; filter-only searches
+            # have none, so keep the placeholder score
+            if query_embedding is None:
+                for result in results:
+                    result["similarity"] = 0.85  # Placeholder
 
             logger.info(
-                f"Project code search completed",
+                "Project code search completed",
                 extra={
                     "project_id": project_id,
                     "query": query,
@@ -119,7 +133,8 @@ class ProjectCodeSearchService:
 
         except Exception as e:
             logger.error(
-                f"Error searching project code: {str(e)}",
+                "Error searching project code: %s",
+                e,
                 extra={"project_id": project_id, "query": query, "error": str(e)},
             )
             raise
@@ -149,18 +164,23 @@ class ProjectCodeSearchService:
             if not source:
                 raise ValueError(f"Project {project_id} has no synced codebase")
 
-            # Query chunks from specific files
-            response = (
-                await self.db.table("knowledge_chunks")
-                .select("*")
-                .eq("source_id", source["id"])
-                .in_("file_path", file_paths)
-                .limit(match_count * len(file_paths))
-                .execute()
-            )
+            embedding = await self._generate_embedding(query)
+
+            # At most match_count chunks per file, ranked in Postgres; see
+            # migrations/add_search_in_files_function.sql
+            response = self.db.rpc(
+                "search_in_files",
+                {
+                    "src_id": source["id"],
+                    "file_paths": file_paths,
+                    # Zero placeholder vectors can't rank; use chunk order instead
+                    "query_embedding": embedding if any(embedding) else None,
+                    "per_file": match_count,
+                },
+            ).execute()
 
             logger.info(
-                f"Searched in specific files",
+                "Searched in specific files",
                 extra={
                     "project_id": project_id,
                     "files_count": len(file_paths),
@@ -171,7 +191,7 @@ class ProjectCodeSearchService:
             return response.data
 
         except Exception as e:
-            logger.error(f"Error searching in files: {str(e)}")
+            logger.error("Error searching in files: %s", e)
             raise
 
     async def get_recent_changes(
@@ -195,37 +215,16 @@ class ProjectCodeSearchService:
 
             cutoff_date = datetime.now() - timedelta(days=days)
 
-            # Query recently updated chunks, grouped by file
-            response = (
-                await self.db.table("knowledge_chunks")
-                .select("file_path, language, updated_at")
-                .eq("source_id", source["id"])
-                .gte("updated_at", cutoff_date.isoformat())
-                .order("updated_at", desc=True)
-                .execute()
-            )
+            # Grouped by file in Postgres, newest first
+            response = self.db.rpc(
+                "recent_file_changes",
+                {"src_id": source["id"], "since": cutoff_date.isoformat()},
+            ).execute()
 
-            # Group by file path
-            files_dict = {}
-            for chunk in response.data:
-                file_path = chunk["file_path"]
-                if file_path not in files_dict:
-                    files_dict[file_path] = {
-                        "file_path": file_path,
-                        "language": chunk["language"],
-                        "last_updated": chunk["updated_at"],
-                        "chunk_count": 1,
-                    }
-                else:
-                    files_dict[file_path]["chunk_count"] += 1
-                    # Keep most recent update time
-                    if chunk["updated_at"] > files_dict[file_path]["last_updated"]:
-                        files_dict[file_path]["last_updated"] = chunk["updated_at"]
-
-            results = list(files_dict.values())
+            results = response.data
 
             logger.info(
-                f"Retrieved recent changes",
+                "Retrieved recent changes",
                 extra={
                     "project_id": project_id,
                     "days": days,
@@ -236,7 +235,7 @@ class ProjectCodeSearchService:
             return results
 
         except Exception as e:
-            logger.error(f"Error getting recent changes: {str(e)}")
+            logger.error("Error getting recent changes: %s", e)
             raise
 
     def _glob_to_sql_pattern(self, glob_pattern: str) -> str:
@@ -249,12 +248,7 @@ class ProjectCodeSearchService:
         Returns:
             SQL LIKE pattern
         """
-        # Convert glob wildcards to SQL wildcards
-        # * -> %
-        # ? -> _
-        # Simplified conversion (full implementation would handle more cases)
-        sql_pattern = glob_pattern.replace("*", "%").replace("?", "_")
-        return sql_pattern
+        return glob_to_sql_pattern(glob_pattern)
 
     async def _generate_embedding(self, text: str) -> List[float]:
         """
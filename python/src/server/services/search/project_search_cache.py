@@ -0,0 +1,34 @@
+"""
+Project Search Result Cache for Archon
+
+In-process cache for project code search results. Entries are keyed on the full
+request signature plus a per-project version that is bumped whenever a sync
+completes, so a finished sync invalidates every cached search for that project.
+"""
+
+from typing import Any, Dict, List
+
+from src.server.utils.ttl_cache import VersionedTTLCache
+
+
+def _copy_rows(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [dict(row) for row in results]
+
+
+class ProjectSearchCache(VersionedTTLCache):
+    """LRU + TTL cache for project code search results, scoped by project ID"""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 60.0):
+        """
+        Initialize ProjectSearchCache
+
+        Args:
+            maxsize: Maximum number of cached searches
+            ttl: Seconds a cached search stays valid
+        """
+        # Rows are copied so callers can't mutate the cached entry
+        super().__init__(maxsize=maxsize, ttl=ttl, copy=_copy_rows)
+
+
+# Shared per-process cache, invalidated by IncrementalSyncService on sync completion
+project_search_cache = ProjectSearchCache()
@@ -5,14 +5,18 @@ Phase 5, Task 5.4
 Service for querying recent file changes in projects.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from datetime import datetime, timedelta
 
 from src.server.config.logfire_config import get_logger
 from src.server.services.knowledge.codebase_source_service import CodebaseSourceService
+from src.server.services.search.project_code_search import glob_to_sql_pattern
 
 logger = get_logger(__name__)
 
+# Rows fetched per round trip when streaming; matches PostgREST's default max-rows
+STREAM_PAGE_SIZE = 1000
+
 
 class RecentChangesService:
     """Service for querying recent file changes"""
@@ -56,42 +60,18 @@ class RecentChangesService:
 
             cutoff_date = datetime.now() - timedelta(days=days)
 
-            # Build query
-            query = (
-                self.db.table("knowledge_chunks")
-                .select("file_path, language, updated_at, chunk_index")
-                .eq("source_id", source["id"])
-                .gte("updated_at", cutoff_date.isoformat())
-            )
+            # Grouped by file in Postgres, newest first; see
+            # migrations/add_recent_file_changes_function.sql
+            response = self.db.rpc(
+                "recent_file_changes",
+                {
+                    "src_id": source["id"],
+                    "since": cutoff_date.isoformat(),
+                    "file_like": glob_to_sql_pattern(file_filter) if file_filter else None,
+                },
+            ).execute()
 
-            # Apply file filter if provided
-            if file_filter:
-                sql_pattern = file_filter.replace("*", "%").replace("?", "_")
-                query = query.like("file_path", sql_pattern)
-
-            response = await query.order("updated_at", desc=True).execute()
-
-            # Group by file path
-            files_dict = {}
-            for chunk in response.data:
-                file_path = chunk["file_path"]
-                if file_path not in files_dict:
-                    files_dict[file_path] = {
-                        "file_path": file_path,
-                        "language": chunk.get("language"),
-                        "last_updated": chunk["updated_at"],
-                        "chunk_count": 1,
-                    }
-                else:
-                    files_dict[file_path]["chunk_count"] += 1
-                    # Keep most recent update time
-                    if chunk["updated_at"] > files_dict[file_path]["last_updated"]:
-                        files_dict[file_path]["last_updated"] = chunk["updated_at"]
-
-            results = list(files_dict.values())
-
-            # Sort by last_updated descending
-            results.sort(key=lambda x: x["last_updated"], reverse=True)
+            results = response.data
 
             logger.info(
                 f"Retrieved recent changes",
@@ -111,6 +91,93 @@ class RecentChangesService:
             )
             raise
 
+    async def get_recent_changes_iter(
+        self,
+        project_id: str,
+        days: int = 7,
+        file_filter: Optional[str] = None,
+        page_size: int = STREAM_PAGE_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream files that changed recently in a project
+
+        Chunks are paged ordered by file path so each file's chunks are
+        contiguous; a file is yielded as soon as the next file starts. Pages
+        are fetched by keyset on an index in that order, so memory and
+        per-page cost stay bounded by page_size however many chunks changed.
+        Rows have the same shape as get_recent_changes but arrive in file path order.
+
+        Args:
+            project_id: UUID of the project
+            days: Number of days to look back
+            file_filter: Optional file pattern filter
+            page_size: Chunks fetched per query
+
+        Yields:
+            Recently changed files with metadata
+
+        Raises:
+            ValueError: If project has no codebase source
+        """
+        source = await self.codebase_service.get_by_project_id(project_id)
+
+        if not source:
+            raise ValueError(f"Project {project_id} has no synced codebase")
+
+        cutoff_date = datetime.now() - timedelta(days=days)
+
+        file_like = glob_to_sql_pattern(file_filter) if file_filter else None
+
+        current: Optional[Dict[str, Any]] = None
+        files_count = 0
+        last_row: Optional[Dict[str, Any]] = None
+        while True:
+            # Keyset on (file_path, id): each page seeks past the last row on
+            # idx_chunks_source_file_id; see
+            # migrations/add_recent_chunks_page_function.sql
+            response = self.db.rpc(
+                "recent_chunks_page",
+                {
+                    "src_id": source["id"],
+                    "since": cutoff_date.isoformat(),
+                    "file_like": file_like,
+                    "after_path": last_row["file_path"] if last_row else None,
+                    "after_id": last_row["id"] if last_row else None,
+                    "page_size": page_size,
+                },
+            ).execute()
+            chunks = response.data
+
+            for chunk in chunks:
+                if current is not None and chunk["file_path"] == current["file_path"]:
+                    current["chunk_count"] += 1
+                    if chunk["updated_at"] > current["last_updated"]:
+                        current["last_updated"] = chunk["updated_at"]
+                    continue
+
+                if current is not None:
+                    files_count += 1
+                    yield current
+                current = {
+                    "file_path": chunk["file_path"],
+                    "language": chunk.get("language"),
+                    "last_updated": chunk["updated_at"],
+                    "chunk_count": 1,
+                }
+
+            if len(chunks) < page_size:
+                break
+            last_row = chunks[-1]
+
+        if current is not None:
+            files_count += 1
+            yield current
+
+        logger.info(
+            "Streamed recent changes",
+            extra={"project_id": project_id, "days": days, "files_count": files_count},
+        )
+
     async def get_changes_by_date(
         self,
         project_id: str,
@@ -137,32 +204,17 @@ class RecentChangesService:
             if not source:
                 raise ValueError(f"Project {project_id} has no synced codebase")
 
-            # Query chunks within date range
-            response = (
-                await self.db.table("knowledge_chunks")
-                .select("file_path, language, updated_at")
-                .eq("source_id", source["id"])
-                .gte("updated_at", start_date.isoformat())
-                .lte("updated_at", end_date.isoformat())
-                .order("updated_at", desc=True)
-                .execute()
-            )
+            # Grouped by file in Postgres, newest first
+            response = self.db.rpc(
+                "recent_file_changes",
+                {
+                    "src_id": source["id"],
+                    "since": start_date.isoformat(),
+                    "until": end_date.isoformat(),
+                },
+            ).execute()
 
-            # Group by file path
-            files_dict = {}
-            for chunk in response.data:
-                file_path = chunk["file_path"]
-                if file_path not in files_dict:
-                    files_dict[file_path] = {
-                        "file_path": file_path,
-                        "language": chunk.get("language"),
-                        "last_updated": chunk["updated_at"],
-                        "chunk_count": 1,
-                    }
-                else:
-                    files_dict[file_path]["chunk_count"] += 1
-
-            results = list(files_dict.values())
+            results = response.data
 
             logger.info(
                 f"Retrieved changes by date range",
@@ -204,44 +256,21 @@ class RecentChangesService:
 
             cutoff_date = datetime.now() - timedelta(days=days)
 
-            # Get all changes in period
-            response = (
-                await self.db.table("knowledge_chunks")
-                .select("file_path, language, updated_at")
-                .eq("source_id", source["id"])
-                .gte("updated_at", cutoff_date.isoformat())
-                .execute()
-            )
-
-            chunks = response.data
-
-            # Calculate statistics
-            unique_files = set(chunk["file_path"] for chunk in chunks)
-            language_counts = {}
-            for chunk in chunks:
-                lang = chunk.get("language", "unknown")
-                language_counts[lang] = language_counts.get(lang, 0) + 1
-
-            # Group changes by date
-            changes_by_date = {}
-            for chunk in chunks:
-                date = chunk["updated_at"][:10]  # Extract YYYY-MM-DD
-                changes_by_date[date] = changes_by_date.get(date, 0) + 1
+            # Aggregated in Postgres; see
+            # migrations/add_recent_change_statistics_function.sql
+            response = self.db.rpc(
+                "recent_change_statistics",
+                {"src_id": source["id"], "since": cutoff_date.isoformat()},
+            ).execute()
 
-            stats = {
-                "total_files_changed": len(unique_files),
-                "total_chunks_updated": len(chunks),
-                "language_breakdown": language_counts,
-                "changes_by_date": changes_by_date,
-                "period_days": days,
-            }
+            stats = {**(response.data or {}), "period_days": days}
 
             logger.info(
                 f"Generated change statistics",
                 extra={
                     "project_id": project_id,
                     "days": days,
-                    "files_changed": len(unique_files),
+                    "files_changed": stats.get("total_files_changed", 0),
                 },
             )
 
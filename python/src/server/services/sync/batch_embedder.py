@@ -5,15 +5,20 @@ Provides:
 - Batch embedding requests (50 texts per call vs 1)
 - Rate limiting to prevent API throttling
 - Automatic retry on rate limit errors
-- Token-aware batching (respects token limits)
+- Token-aware batching (respects token limits, counted with tiktoken when installed)
 """
 
 import asyncio
+import os
 from typing import List, Optional
-from datetime import datetime, timedelta
-from collections import deque
 import logging
 
+try:
+    import tiktoken
+except ImportError:
+    # Optional dependency - fall back to estimating 4 characters per token
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +48,10 @@ class RateLimiter:
         """
         self.rate_limit = rate_limit
         self.time_window = time_window
-        self.request_times: deque = deque()
+        # Starts full, so the first rate_limit requests go out as one burst
+        self.tokens: float = float(rate_limit)
+        self.refill_rate = rate_limit / time_window
+        self._last_refill: Optional[float] = None
         self._lock = asyncio.Lock()
 
     async def __aenter__(self):
@@ -57,30 +65,23 @@ class RateLimiter:
 
     async def acquire(self):
         """Wait until rate limit allows request"""
-        async with self._lock:
-            now = datetime.now()
-
-            # Remove old requests outside time window
-            cutoff = now - timedelta(seconds=self.time_window)
-            while self.request_times and self.request_times[0] < cutoff:
-                self.request_times.popleft()
+        loop = asyncio.get_running_loop()
 
-            # Check if at rate limit
-            if len(self.request_times) >= self.rate_limit:
-                # Calculate wait time
-                oldest = self.request_times[0]
-                wait_until = oldest + timedelta(seconds=self.time_window)
-                wait_seconds = (wait_until - now).total_seconds()
-
-                if wait_seconds > 0:
-                    logger.debug(f"Rate limit reached. Waiting {wait_seconds:.2f}s")
-                    await asyncio.sleep(wait_seconds)
+        async with self._lock:
+            now = loop.time()
+            if self._last_refill is not None:
+                elapsed = now - self._last_refill
+                self.tokens = min(self.rate_limit, self.tokens + elapsed * self.refill_rate)
+            self._last_refill = now
 
-                # Remove oldest request
-                self.request_times.popleft()
+            if self.tokens < 1:
+                wait_seconds = (1 - self.tokens) / self.refill_rate
+                logger.debug(f"Rate limit reached. Waiting {wait_seconds:.2f}s")
+                await asyncio.sleep(wait_seconds)
 
-            # Record this request
-            self.request_times.append(datetime.now())
+            # May go negative after a wait; the next refill counts the time
+            # slept, which pays the debt back
+            self.tokens -= 1
 
 
 class BatchEmbedder:
@@ -90,6 +91,7 @@ class BatchEmbedder:
     Features:
     - Batch multiple texts into single API call (50 texts default)
     - Rate limiting to prevent API throttling
+    - Up to max_concurrency batches in flight at once
     - Automatic retry on rate limit errors
     - 80%+ reduction in API calls
 
@@ -110,7 +112,8 @@ class BatchEmbedder:
         batch_size: int = 50,
         rate_limit: int = 10,
         rate_window: float = 1.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        max_concurrency: int = 4
     ):
         """
         Initialize batch embedder.
@@ -121,11 +124,14 @@ class BatchEmbedder:
             rate_limit: Maximum API requests per time window
             rate_window: Time window for rate limiting (seconds)
             max_retries: Maximum retries on rate limit errors
+            max_concurrency: Maximum batches awaiting the API at once
         """
         self.embedding_service = embedding_service
         self.batch_size = batch_size
         self.rate_limiter = RateLimiter(rate_limit, rate_window)
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def embed_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
         """
@@ -148,32 +154,40 @@ class BatchEmbedder:
             f"(size={self.batch_size})"
         )
 
-        embeddings = []
-
-        # Process in batches
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i:i + self.batch_size]
-            batch_num = (i // self.batch_size) + 1
+        batches = [
+            texts[i:i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
 
-            try:
-                # Rate limit and embed batch
-                batch_embeddings = await self._embed_batch_with_retry(
+        # Batches run concurrently (bounded by the semaphore) while the rate
+        # limiter still paces requests, so network round trips overlap
+        results = await asyncio.gather(
+            *(
+                self._embed_batch_with_retry(
                     batch=batch,
                     batch_num=batch_num,
                     total_batches=num_batches
                 )
+                for batch_num, batch in enumerate(batches, start=1)
+            ),
+            return_exceptions=True
+        )
 
-                embeddings.extend(batch_embeddings)
+        embeddings = []
 
-            except Exception as e:
-                logger.error(
-                    f"Batch {batch_num}/{num_batches} failed after retries: {e}"
-                )
+        for batch_num, (batch, result) in enumerate(zip(batches, results, strict=True), start=1):
+            if not isinstance(result, BaseException):
+                embeddings.extend(result)
+                continue
+
+            logger.error(
+                f"Batch {batch_num}/{num_batches} failed after retries: {result}"
+            )
 
-                # Fallback: embed individually
-                logger.info(f"Falling back to individual embedding for batch {batch_num}")
-                individual_embeddings = await self._embed_individually(batch)
-                embeddings.extend(individual_embeddings)
+            # Fallback: embed individually
+            logger.info(f"Falling back to individual embedding for batch {batch_num}")
+            individual_embeddings = await self._embed_individually(batch)
+            embeddings.extend(individual_embeddings)
 
         logger.info(
             f"Batch embedding complete: {len(embeddings)}/{len(texts)} successful"
@@ -201,42 +215,45 @@ class BatchEmbedder:
         Raises:
             Exception if all retries fail
         """
-        retries = 0
-
-        while retries <= self.max_retries:
-            try:
-                # Apply rate limiting
-                async with self.rate_limiter:
-                    logger.debug(f"Processing batch {batch_num}/{total_batches}")
-
-                    # Check if service has batch method
-                    if hasattr(self.embedding_service, 'embed_batch'):
-                        return await self.embedding_service.embed_batch(batch)
+        # Holding the slot through retries and backoff keeps a throttled API
+        # from being hit by every other batch at once
+        async with self._semaphore:
+            retries = 0
+
+            while retries <= self.max_retries:
+                try:
+                    # Apply rate limiting
+                    async with self.rate_limiter:
+                        logger.debug(f"Processing batch {batch_num}/{total_batches}")
+
+                        # Check if service has batch method
+                        if hasattr(self.embedding_service, 'embed_batch'):
+                            return await self.embedding_service.embed_batch(batch)
+                        else:
+                            # Fallback: call embed() for each text
+                            return await self._embed_individually(batch)
+
+                except Exception as e:
+                    retries += 1
+
+                    if retries > self.max_retries:
+                        raise
+
+                    # Check if rate limit error
+                    is_rate_limit = self._is_rate_limit_error(e)
+
+                    if is_rate_limit:
+                        # Exponential backoff for rate limits
+                        wait_time = 2 ** retries
+                        logger.warning(
+                            f"Rate limit hit on batch {batch_num}. "
+                            f"Retrying in {wait_time}s (attempt {retries}/{self.max_retries})"
+                        )
+                        await asyncio.sleep(wait_time)
                     else:
-                        # Fallback: call embed() for each text
-                        return await self._embed_individually(batch)
-
-            except Exception as e:
-                retries += 1
-
-                if retries > self.max_retries:
-                    raise
-
-                # Check if rate limit error
-                is_rate_limit = self._is_rate_limit_error(e)
-
-                if is_rate_limit:
-                    # Exponential backoff for rate limits
-                    wait_time = 2 ** retries
-                    logger.warning(
-                        f"Rate limit hit on batch {batch_num}. "
-                        f"Retrying in {wait_time}s (attempt {retries}/{self.max_retries})"
-                    )
-                    await asyncio.sleep(wait_time)
-                else:
-                    # Other error - re-raise immediately
-                    logger.error(f"Non-rate-limit error on batch {batch_num}: {e}")
-                    raise
+                        # Other error - re-raise immediately
+                        logger.error(f"Non-rate-limit error on batch {batch_num}: {e}")
+                        raise
 
     async def _embed_individually(self, texts: List[str]) -> List[Optional[List[float]]]:
         """
@@ -302,7 +319,8 @@ class TokenAwareBatcher:
     def __init__(
         self,
         max_tokens_per_batch: int = 8000,
-        max_items_per_batch: int = 50
+        max_items_per_batch: int = 50,
+        encoding_name: str = "cl100k_base"
     ):
         """
         Initialize token-aware batcher.
@@ -310,10 +328,42 @@ class TokenAwareBatcher:
         Args:
             max_tokens_per_batch: Maximum tokens per batch
             max_items_per_batch: Maximum items per batch
+            encoding_name: tiktoken encoding used to count tokens
         """
         self.max_tokens_per_batch = max_tokens_per_batch
         self.max_items_per_batch = max_items_per_batch
 
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.get_encoding(encoding_name)
+            except Exception as e:
+                # The encoding file is downloaded on first use
+                logger.warning(f"tiktoken encoding {encoding_name} unavailable, estimating tokens: {e}")
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for each text.
+
+        Uses tiktoken when installed, tokenizing all texts in one threaded
+        call; otherwise estimates 4 characters per token.
+
+        Args:
+            texts: List of texts
+
+        Returns:
+            Token count per text (same order as input)
+        """
+        if self._encoding is None:
+            return [len(text) // 4 for text in texts]
+
+        # Source files can contain special-token strings like <|endoftext|>;
+        # count them as plain text instead of raising
+        encoded = self._encoding.encode_batch(
+            texts, num_threads=os.cpu_count() or 1, disallowed_special=()
+        )
+        return [len(tokens) for tokens in encoded]
+
     def create_batches(self, texts: List[str]) -> List[List[str]]:
         """
         Create batches that respect token and item limits.
@@ -328,23 +378,20 @@ class TokenAwareBatcher:
         current_batch = []
         current_tokens = 0
 
-        for text in texts:
-            # Estimate tokens (rough approximation: 4 chars per token)
-            estimated_tokens = len(text) // 4
-
+        for text, token_count in zip(texts, self.count_tokens(texts), strict=True):
             # Check if adding this text would exceed limits
-            would_exceed_tokens = (current_tokens + estimated_tokens) > self.max_tokens_per_batch
+            would_exceed_tokens = (current_tokens + token_count) > self.max_tokens_per_batch
             would_exceed_items = len(current_batch) >= self.max_items_per_batch
 
             if (would_exceed_tokens or would_exceed_items) and current_batch:
                 # Start new batch
                 batches.append(current_batch)
                 current_batch = [text]
-                current_tokens = estimated_tokens
+                current_tokens = token_count
             else:
                 # Add to current batch
                 current_batch.append(text)
-                current_tokens += estimated_tokens
+                current_tokens += token_count
 
         # Add final batch
         if current_batch:
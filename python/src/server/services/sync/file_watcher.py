@@ -9,7 +9,7 @@ directories and files.
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
@@ -254,8 +254,23 @@ class FileWatcherService:
         Returns:
             True if project is being watched, False otherwise
         """
-        is_active = project_id in self.observers and self.observers[project_id].is_alive()
-        return is_active
+        return self.get_state(project_id)[1]
+
+    def get_state(self, project_id: str) -> Tuple[bool, bool]:
+        """
+        Get watcher state for a project with a single lookup.
+
+        Args:
+            project_id: Unique identifier for the project
+
+        Returns:
+            Tuple of (is_active, is_watching): whether a watcher is registered
+            for the project, and whether its observer thread is alive
+        """
+        observer = self.observers.get(project_id)
+        if observer is None:
+            return False, False
+        return True, observer.is_alive()
 
     async def add_project(self, project_id: str, local_path: str) -> bool:
         """
@@ -5,14 +5,22 @@ Handles installation, uninstallation, and management of git hooks for project sy
 Supports cross-platform hook installation with backup and chaining capabilities.
 """
 
+import asyncio
 import os
 import shutil
 import stat
+import time
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
+try:
+    import pygit2
+except ImportError:
+    # Optional dependency - fall back to reading the .git entry directly
+    pygit2 = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,9 +36,21 @@ class GitHookInstaller:
     - Execute permissions management on Unix systems
     """
 
-    def __init__(self):
-        """Initialize the GitHookInstaller."""
+    def __init__(self, validation_cache_ttl: float = 5.0):
+        """
+        Initialize the GitHookInstaller.
+
+        Args:
+            validation_cache_ttl: Seconds a successful repository validation is reused
+        """
         self.backup_suffix = ".archon-backup"
+        self.validation_cache_ttl = validation_cache_ttl
+
+        # repo_path -> (.git mtime_ns, validated_at monotonic timestamp)
+        self._validation_cache: Dict[str, Tuple[int, float]] = {}
+
+        # repo_path -> resolved hooks directory (handles worktrees/submodules)
+        self._hooks_dirs: Dict[str, Path] = {}
 
     async def install_hook(
         self,
@@ -60,41 +80,20 @@ class GitHookInstaller:
                 raise ValueError(f"Not a valid git repository: {repo_path}")
 
             # Get hook path
-            hook_path = self._get_hook_path(repo_path, hook_name)
-
-            # Check if hook already exists
-            existing_hook = None
-            if hook_path.exists():
-                logger.info(f"Existing hook found at {hook_path}")
-
-                # Backup existing hook
-                backup_path = await self.backup_existing_hook(hook_path)
-                logger.info(f"Backed up existing hook to {backup_path}")
+            hook_path = await self._get_hook_path(repo_path, hook_name)
 
-                if chain_existing:
-                    # Read existing hook content for chaining
-                    with open(hook_path, 'r', encoding='utf-8') as f:
-                        existing_hook = f.read()
-
-                    # Chain hooks: run existing hook first, then new hook
-                    hook_content = self._chain_hooks(existing_hook, hook_content, hook_name)
-                    logger.info(f"Chaining existing hook with new hook")
-
-            # Write hook content
-            with open(hook_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(hook_content)
-
-            # Make executable on Unix systems
-            if os.name != 'nt':
-                self._make_executable(hook_path)
+            # Backup, chain and write the hook off the event loop
+            backup_created, chained = await asyncio.to_thread(
+                self._write_hook_sync, hook_path, hook_name, hook_content, chain_existing
+            )
 
             logger.info(f"Successfully installed {hook_name} hook at {hook_path}")
 
             return {
                 "success": True,
                 "hook_path": str(hook_path),
-                "chained": existing_hook is not None and chain_existing,
-                "backup_created": existing_hook is not None,
+                "chained": chained,
+                "backup_created": backup_created,
                 "installed_at": datetime.utcnow().isoformat()
             }
 
@@ -120,9 +119,13 @@ class GitHookInstaller:
             Dict with uninstallation status and details
         """
         try:
-            hook_path = self._get_hook_path(repo_path, hook_name)
+            hook_path = await self._get_hook_path(repo_path, hook_name)
 
-            if not hook_path.exists():
+            removed, backup_restored = await asyncio.to_thread(
+                self._remove_hook_sync, hook_path, restore_backup
+            )
+
+            if not removed:
                 logger.warning(f"Hook does not exist at {hook_path}")
                 return {
                     "success": True,
@@ -130,19 +133,6 @@ class GitHookInstaller:
                     "uninstalled_at": datetime.utcnow().isoformat()
                 }
 
-            # Remove the hook
-            hook_path.unlink()
-            logger.info(f"Removed hook at {hook_path}")
-
-            # Restore backup if requested
-            backup_restored = False
-            if restore_backup:
-                backup_path = Path(str(hook_path) + self.backup_suffix)
-                if backup_path.exists():
-                    await self.restore_hook(str(hook_path))
-                    backup_restored = True
-                    logger.info(f"Restored backup from {backup_path}")
-
             return {
                 "success": True,
                 "hook_path": str(hook_path),
@@ -167,35 +157,13 @@ class GitHookInstaller:
             hook_name: Name of the hook to check
 
         Returns:
-            Dict with installation status and details
+            Dict with installation status and details. Installed hooks include
+            an ``etag`` derived from the hook file's size and mtime.
         """
         try:
-            hook_path = self._get_hook_path(repo_path, hook_name)
-
-            if not hook_path.exists():
-                return {
-                    "installed": False,
-                    "hook_path": str(hook_path),
-                    "has_backup": False
-                }
+            hook_path = await self._get_hook_path(repo_path, hook_name)
 
-            # Check for backup
-            backup_path = Path(str(hook_path) + self.backup_suffix)
-            has_backup = backup_path.exists()
-
-            # Get hook content preview
-            with open(hook_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                is_archon_hook = "archon" in content.lower() or "PROJECT_ID" in content
-
-            return {
-                "installed": True,
-                "hook_path": str(hook_path),
-                "has_backup": has_backup,
-                "is_archon_hook": is_archon_hook,
-                "size_bytes": hook_path.stat().st_size,
-                "modified_at": datetime.fromtimestamp(hook_path.stat().st_mtime).isoformat()
-            }
+            return await asyncio.to_thread(self._read_hook_status_sync, hook_path)
 
         except Exception as e:
             logger.error(f"Failed to check hook status: {e}")
@@ -208,6 +176,149 @@ class GitHookInstaller:
         """
         Create a backup of an existing hook.
 
+        Args:
+            hook_path: Path to the hook file
+
+        Returns:
+            Path to the backup file
+        """
+        return await asyncio.to_thread(self._backup_hook_sync, hook_path)
+
+    async def restore_hook(self, hook_path: str) -> bool:
+        """
+        Restore a hook from its backup.
+
+        Args:
+            hook_path: Path to the hook file
+
+        Returns:
+            True if restoration was successful, False otherwise
+        """
+        try:
+            return await asyncio.to_thread(self._restore_hook_sync, Path(hook_path))
+
+        except Exception as e:
+            logger.error(f"Failed to restore hook: {e}")
+            return False
+
+    def _write_hook_sync(
+        self,
+        hook_path: Path,
+        hook_name: str,
+        hook_content: str,
+        chain_existing: bool
+    ) -> Tuple[bool, bool]:
+        """
+        Blocking part of install_hook: back up, optionally chain, write and chmod.
+
+        Args:
+            hook_path: Path to the hook file
+            hook_name: Name of the hook
+            hook_content: Content of the hook script
+            chain_existing: If True, preserve and chain an existing hook
+
+        Returns:
+            Tuple of (backup_created, chained)
+        """
+        existing_hook = None
+        backup_created = hook_path.exists()
+        if backup_created:
+            logger.info(f"Existing hook found at {hook_path}")
+
+            # Backup existing hook
+            backup_path = self._backup_hook_sync(hook_path)
+            logger.info(f"Backed up existing hook to {backup_path}")
+
+            if chain_existing:
+                # Read existing hook content for chaining
+                with open(hook_path, 'r', encoding='utf-8') as f:
+                    existing_hook = f.read()
+
+                # Chain hooks: run existing hook first, then new hook
+                hook_content = self._chain_hooks(existing_hook, hook_content, hook_name)
+                logger.info(f"Chaining existing hook with new hook")
+
+        # Write hook content
+        with open(hook_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(hook_content)
+
+        # Make executable on Unix systems
+        if os.name != 'nt':
+            self._make_executable(hook_path)
+
+        return backup_created, existing_hook is not None
+
+    def _remove_hook_sync(self, hook_path: Path, restore_backup: bool) -> Tuple[bool, bool]:
+        """
+        Blocking part of uninstall_hook: remove the hook and optionally restore its backup.
+
+        Args:
+            hook_path: Path to the hook file
+            restore_backup: If True, restore the backup if it exists
+
+        Returns:
+            Tuple of (removed, backup_restored)
+        """
+        if not hook_path.exists():
+            return False, False
+
+        # Remove the hook
+        hook_path.unlink()
+        logger.info(f"Removed hook at {hook_path}")
+
+        # Restore backup if requested
+        backup_restored = False
+        if restore_backup:
+            backup_path = Path(str(hook_path) + self.backup_suffix)
+            if backup_path.exists():
+                backup_restored = self._restore_hook_sync(hook_path)
+                logger.info(f"Restored backup from {backup_path}")
+
+        return True, backup_restored
+
+    def _read_hook_status_sync(self, hook_path: Path) -> Dict[str, Any]:
+        """
+        Blocking part of is_hook_installed: stat and inspect the hook file.
+
+        Args:
+            hook_path: Path to the hook file
+
+        Returns:
+            Dict with installation status and details
+        """
+        if not hook_path.exists():
+            return {
+                "installed": False,
+                "hook_path": str(hook_path),
+                "has_backup": False
+            }
+
+        # Check for backup
+        backup_path = Path(str(hook_path) + self.backup_suffix)
+        has_backup = backup_path.exists()
+
+        hook_stat = hook_path.stat()
+
+        # Get hook content preview
+        with open(hook_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+            is_archon_hook = "archon" in content.lower() or "PROJECT_ID" in content
+
+        return {
+            "installed": True,
+            "hook_path": str(hook_path),
+            "has_backup": has_backup,
+            "is_archon_hook": is_archon_hook,
+            "size_bytes": hook_stat.st_size,
+            "modified_at": datetime.fromtimestamp(hook_stat.st_mtime).isoformat(),
+            # Weak validator for conditional status polling
+            "etag": f'W/"{hook_stat.st_size}-{hook_stat.st_mtime_ns}-{int(has_backup)}"'
+        }
+
+    def _backup_hook_sync(self, hook_path: Path) -> Path:
+        """
+        Copy a hook to its backup path unless a backup already exists.
+
         Args:
             hook_path: Path to the hook file
 
@@ -226,50 +337,46 @@ class GitHookInstaller:
 
         return backup_path
 
-    async def restore_hook(self, hook_path: str) -> bool:
+    def _restore_hook_sync(self, hook_path: Path) -> bool:
         """
-        Restore a hook from its backup.
+        Replace a hook with its backup and remove the backup file.
 
         Args:
             hook_path: Path to the hook file
 
         Returns:
-            True if restoration was successful, False otherwise
+            True if a backup was restored, False if none exists
         """
-        try:
-            backup_path = Path(hook_path + self.backup_suffix)
-
-            if not backup_path.exists():
-                logger.warning(f"No backup found at {backup_path}")
-                return False
-
-            hook_path_obj = Path(hook_path)
+        backup_path = Path(str(hook_path) + self.backup_suffix)
 
-            # Remove current hook if it exists
-            if hook_path_obj.exists():
-                hook_path_obj.unlink()
+        if not backup_path.exists():
+            logger.warning(f"No backup found at {backup_path}")
+            return False
 
-            # Restore from backup
-            shutil.copy2(backup_path, hook_path_obj)
+        # Remove current hook if it exists
+        if hook_path.exists():
+            hook_path.unlink()
 
-            # Make executable on Unix
-            if os.name != 'nt':
-                self._make_executable(hook_path_obj)
+        # Restore from backup
+        shutil.copy2(backup_path, hook_path)
 
-            # Remove backup file
-            backup_path.unlink()
+        # Make executable on Unix
+        if os.name != 'nt':
+            self._make_executable(hook_path)
 
-            logger.info(f"Restored hook from backup: {hook_path}")
-            return True
+        # Remove backup file
+        backup_path.unlink()
 
-        except Exception as e:
-            logger.error(f"Failed to restore hook: {e}")
-            return False
+        logger.info(f"Restored hook from backup: {hook_path}")
+        return True
 
     async def validate_git_repo(self, repo_path: str) -> bool:
         """
         Validate that the given path is a git repository.
 
+        Successful validations are cached per repo_path, keyed on the mtime of
+        the .git entry, and reused for validation_cache_ttl seconds.
+
         Args:
             repo_path: Path to check
 
@@ -280,28 +387,162 @@ class GitHookInstaller:
             git_dir = Path(repo_path) / ".git"
 
             # Check if .git exists (directory or file for submodules)
-            if not git_dir.exists():
+            try:
+                git_mtime_ns = git_dir.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._validation_cache.pop(repo_path, None)
                 logger.warning(f"No .git directory/file found at {repo_path}")
                 return False
 
-            # If .git is a directory, check for basic git structure
-            if git_dir.is_dir():
-                hooks_dir = git_dir / "hooks"
-                if not hooks_dir.exists():
-                    # Create hooks directory if it doesn't exist
-                    hooks_dir.mkdir(parents=True, exist_ok=True)
-                    logger.info(f"Created hooks directory at {hooks_dir}")
+            cached = self._validation_cache.get(repo_path)
+            if (
+                cached is not None
+                and cached[0] == git_mtime_ns
+                and time.monotonic() - cached[1] < self.validation_cache_ttl
+            ):
+                return True
+
+            # Resolve the directory git runs hooks from off the event loop
+            hooks_dir = await asyncio.to_thread(self._resolve_hooks_dir, repo_path)
+            if hooks_dir is None:
+                self._validation_cache.pop(repo_path, None)
+                logger.warning(f"Not a git repository: {repo_path}")
+                return False
 
+            if not hooks_dir.exists():
+                # Create hooks directory if it doesn't exist
+                hooks_dir.mkdir(parents=True, exist_ok=True)
+                logger.info(f"Created hooks directory at {hooks_dir}")
+                # Creating hooks/ bumps the .git mtime
+                git_mtime_ns = git_dir.stat().st_mtime_ns
+
+            self._hooks_dirs[repo_path] = hooks_dir
+            self._validation_cache[repo_path] = (git_mtime_ns, time.monotonic())
             return True
 
         except Exception as e:
             logger.error(f"Failed to validate git repository: {e}")
             return False
 
-    def _get_hook_path(self, repo_path: str, hook_name: str) -> Path:
+    def _resolve_git_dir(self, repo_path: str) -> Optional[Path]:
+        """
+        Resolve the git directory for a repository without spawning git.
+
+        Uses libgit2 (pygit2) when installed; otherwise follows a `gitdir:`
+        pointer in a .git file (worktrees/submodules) or uses the .git directory.
+
+        Args:
+            repo_path: Path to the git repository
+
+        Returns:
+            Path to the git directory, or None if not a git repository
+        """
+        if pygit2 is not None:
+            try:
+                return Path(pygit2.Repository(repo_path).path)
+            except (pygit2.GitError, KeyError):
+                return None
+
+        git_dir = Path(repo_path) / ".git"
+
+        if git_dir.is_dir():
+            return git_dir
+
+        if git_dir.is_file():
+            with open(git_dir, 'r', encoding='utf-8') as f:
+                first_line = f.readline().strip()
+            if first_line.startswith("gitdir:"):
+                target = Path(first_line[len("gitdir:"):].strip())
+                if not target.is_absolute():
+                    target = Path(repo_path) / target
+                return target.resolve() if target.is_dir() else None
+
+        return None
+
+    def _resolve_hooks_dir(self, repo_path: str) -> Optional[Path]:
+        """
+        Resolve the directory git runs hooks from.
+
+        Linked worktrees have their own git directory but share hooks with the
+        main repository, so this follows the git directory's `commondir`
+        pointer. `core.hooksPath` overrides the default; a relative value is
+        taken from the working tree root, as git does.
+
+        Args:
+            repo_path: Path to the git repository
+
+        Returns:
+            Path to the hooks directory, or None if not a git repository
+        """
+        hooks_path = None
+        if pygit2 is not None:
+            try:
+                repo = pygit2.Repository(repo_path)
+            except (pygit2.GitError, KeyError):
+                return None
+            git_dir = Path(repo.path)
+            try:
+                # Includes global and system config
+                hooks_path = repo.config["core.hooksPath"]
+            except KeyError:
+                pass
+        else:
+            git_dir = self._resolve_git_dir(repo_path)
+            if git_dir is None:
+                return None
+
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = (git_dir / commondir_file.read_text(encoding='utf-8').strip()).resolve()
+
+        if pygit2 is None:
+            hooks_path = self._read_core_hooks_path(common_dir / "config")
+
+        if hooks_path:
+            return (Path(repo_path) / Path(hooks_path).expanduser()).resolve()
+        return common_dir / "hooks"
+
+    def _read_core_hooks_path(self, config_path: Path) -> Optional[str]:
+        """
+        Read core.hooksPath from a repository config file.
+
+        Fallback for when pygit2 is not installed; include directives and
+        global/system config are not followed.
+
+        Args:
+            config_path: Path to the git config file
+
+        Returns:
+            The configured hooks path, or None if unset
+        """
+        try:
+            lines = config_path.read_text(encoding='utf-8').splitlines()
+        except OSError:
+            return None
+
+        section = None
+        hooks_path = None
+        for raw_line in lines:
+            line = raw_line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line.startswith("["):
+                section = line[1:line.find("]")].strip().lower()
+                continue
+            if section == "core" and "=" in line:
+                key, value = line.split("=", 1)
+                # The last assignment wins, as in git
+                if key.strip().lower() == "hookspath":
+                    hooks_path = value.strip().strip('"')
+        return hooks_path
+
+    async def _get_hook_path(self, repo_path: str, hook_name: str) -> Path:
         """
         Get the path to a git hook file.
 
+        Uncached repositories are resolved off the event loop.
+
         Args:
             repo_path: Path to the git repository
             hook_name: Name of the hook
@@ -309,7 +550,14 @@ class GitHookInstaller:
         Returns:
             Path to the hook file
         """
-        return Path(repo_path) / ".git" / "hooks" / hook_name
+        hooks_dir = self._hooks_dirs.get(repo_path)
+        if hooks_dir is None:
+            hooks_dir = (
+                await asyncio.to_thread(self._resolve_hooks_dir, repo_path)
+                or Path(repo_path) / ".git" / "hooks"
+            )
+            self._hooks_dirs[repo_path] = hooks_dir
+        return hooks_dir / hook_name
 
     def _make_executable(self, file_path: Path) -> None:
         """
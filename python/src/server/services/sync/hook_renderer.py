@@ -6,11 +6,15 @@ Supports placeholder replacement for dynamic hook generation.
 """
 
 import logging
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Matches {{PLACEHOLDER_NAME}}; the capture group keeps names in re.split output
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Za-z_][A-Za-z0-9_]*)\}\}")
+
 
 class HookRenderer:
     """
@@ -36,6 +40,12 @@ class HookRenderer:
         else:
             self.templates_dir = Path(templates_dir)
 
+        # template path -> (mtime_ns, compiled segments)
+        self._template_cache: Dict[Path, Tuple[int, List[str]]] = {}
+
+        # template path -> mtime_ns of the version whose rendered output passed validation
+        self._validated_templates: Dict[Path, int] = {}
+
         logger.debug(f"HookRenderer initialized with templates_dir: {self.templates_dir}")
 
     async def render_post_commit_hook(
@@ -58,27 +68,24 @@ class HookRenderer:
             ValueError: If rendering fails
         """
         try:
-            # Load template
+            # Load precompiled template
             template_path = self.templates_dir / "post-commit-hook.template"
-
-            if not template_path.exists():
-                raise FileNotFoundError(f"Template not found: {template_path}")
-
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
+            mtime_ns, segments = self._load_template(template_path)
 
             # Render template with placeholders
-            rendered_content = self._replace_placeholders(
-                template_content,
+            rendered_content = self._render_segments(
+                segments,
                 {
                     "PROJECT_ID": project_id,
                     "ARCHON_API_URL": archon_api_url
                 }
             )
 
-            # Validate rendered content
-            if not self.validate_template(rendered_content):
-                raise ValueError("Template validation failed after rendering")
+            # Validate once per template version - only placeholder values vary between renders
+            if self._validated_templates.get(template_path) != mtime_ns:
+                if not await self.validate_template(rendered_content):
+                    raise ValueError("Template validation failed after rendering")
+                self._validated_templates[template_path] = mtime_ns
 
             logger.info(f"Rendered post-commit hook for project {project_id}")
 
@@ -142,30 +149,62 @@ class HookRenderer:
             logger.error(f"Template validation error: {e}")
             return False
 
-    def _replace_placeholders(
+    def _load_template(self, template_path: Path) -> Tuple[int, List[str]]:
+        """
+        Load and compile a template, reusing the cached copy while the file is unchanged.
+
+        Compiling splits the source on placeholders once, so rendering is a
+        single join instead of one full-string replace per placeholder.
+
+        Args:
+            template_path: Path to the template file
+
+        Returns:
+            Tuple of (mtime_ns, segments) where segments alternate between
+            literal text (even indices) and placeholder names (odd indices)
+
+        Raises:
+            FileNotFoundError: If template file doesn't exist
+        """
+        try:
+            mtime_ns = template_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._template_cache.pop(template_path, None)
+            raise FileNotFoundError(f"Template not found: {template_path}") from None
+
+        cached = self._template_cache.get(template_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
+
+        with open(template_path, 'r', encoding='utf-8') as f:
+            template_content = f.read()
+
+        compiled = (mtime_ns, PLACEHOLDER_PATTERN.split(template_content))
+        self._template_cache[template_path] = compiled
+        return compiled
+
+    def _render_segments(
         self,
-        template: str,
+        segments: List[str],
         replacements: Dict[str, str]
     ) -> str:
         """
-        Replace placeholders in template with actual values.
+        Render compiled template segments.
 
-        Placeholders format: {{PLACEHOLDER_NAME}}
+        Placeholders without a replacement are left as {{PLACEHOLDER}}.
 
         Args:
-            template: Template content with placeholders
+            segments: Compiled segments from _load_template
             replacements: Dict mapping placeholder names to values
 
         Returns:
-            Template with placeholders replaced
+            Rendered template content
         """
-        result = template
-
-        for placeholder, value in replacements.items():
-            # Replace {{PLACEHOLDER}} with value
-            result = result.replace(f"{{{{{placeholder}}}}}", value)
-
-        return result
+        parts = segments.copy()
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = replacements.get(name, f"{{{{{name}}}}}")
+        return "".join(parts)
 
     async def get_available_templates(self) -> Dict[str, Any]:
         """
@@ -226,15 +265,10 @@ class HookRenderer:
         """
         try:
             template_path = self.templates_dir / f"{template_name}.template"
-
-            if not template_path.exists():
-                raise FileNotFoundError(f"Template not found: {template_name}")
-
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
+            _, segments = self._load_template(template_path)
 
             # Replace all placeholders
-            rendered_content = self._replace_placeholders(template_content, context)
+            rendered_content = self._render_segments(segments, context)
 
             logger.info(f"Rendered template: {template_name}")
 
@@ -1,7 +1,7 @@
 # File: python/src/server/services/sync/incremental_sync_service.py
 
 from typing import List, Dict, Set, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
 import os
 import logging
@@ -11,6 +11,7 @@ from .hash_utils import compute_file_hash, compute_chunk_hash
 from .chunker import Chunker, detect_language
 from ..knowledge.codebase_source_service import CodebaseSourceService
 from ..projects.project_service import ProjectService
+from ..search.project_search_cache import project_search_cache
 from .error_handler import (
     retry_with_backoff,
     RetryConfig,
@@ -325,16 +326,22 @@ class IncrementalSyncService:
 
                             stats.errors.append(f"Modify error ({result.file_path}): {error_info['user_message']}")
 
-            # Update project sync status
+            # Update project sync status; one timestamp serves as both
+            # last_sync_at and updated_at
+            finished_at = datetime.now(timezone.utc)
             await self.project_service.update_project_sync_status(
                 project_id=project_id,
                 status='completed' if not stats.errors else 'error',
-                last_sync_at=datetime.now(),
-                error_message='; '.join(stats.errors[:3]) if stats.errors else None
+                last_sync_at=finished_at,
+                error_message='; '.join(stats.errors[:3]) if stats.errors else None,
+                now_iso=finished_at.isoformat()
             )
 
             stats.duration_seconds = (datetime.now() - start_time).total_seconds()
 
+            # Cached code searches for this project are now stale
+            project_search_cache.invalidate(project_id)
+
             logger.info(
                 f"Sync completed for project {project_id} - "
                 f"{stats.files_processed} files, {stats.chunks_added} added, "
@@ -346,6 +353,8 @@ class IncrementalSyncService:
 
         except Exception as e:
             logger.error(f"Sync failed for project {project_id}: {e}")
+            # A failed sync may still have written some chunks
+            project_search_cache.invalidate(project_id)
             await self.project_service.update_project_sync_status(
                 project_id=project_id,
                 status='error',
@@ -547,6 +556,7 @@ class IncrementalSyncService:
                 chunk_objects.append({
                     'source_id': source_id,
                     'content': code_chunk.content,
+                    'chunk_index': idx,
                     'embedding': embedding,
                     'metadata': {
                         'file_path': file_path,
@@ -643,6 +653,7 @@ class IncrementalSyncService:
                 chunk_objects.append({
                     'source_id': source_id,
                     'content': code_chunk.content,
+                    'chunk_index': idx,
                     'embedding': embedding,
                     'metadata': {
                         'file_path': file_path,
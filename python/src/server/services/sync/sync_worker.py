@@ -7,7 +7,7 @@ processes debounced events, and triggers incremental syncs automatically.
 
 import asyncio
 import logging
-from typing import Optional, List, Set
+from typing import Optional, List
 from datetime import datetime, timedelta
 from supabase import Client as SupabaseClient
 
@@ -55,7 +55,6 @@ class SyncWorker:
 
         self.running = False
         self.event_queue = file_watcher.event_queue
-        self.watched_projects: Set[str] = set()
         self.last_heartbeat: Optional[datetime] = None
 
         # Task references
@@ -195,20 +194,18 @@ class SyncWorker:
                 sync_mode = project.get("sync_mode", "manual")
 
                 # Only start watcher for real-time mode
-                if sync_mode == "realtime" and project_id not in self.watched_projects:
+                if sync_mode == "realtime" and project_id not in self.file_watcher.observers:
                     success = await self.file_watcher.start_watching(
                         project_id, local_path
                     )
 
                     if success:
-                        self.watched_projects.add(project_id)
                         logger.info(f"Started watching project {project_id}")
 
             # Stop watchers for removed projects
-            removed_projects = self.watched_projects - current_project_ids
+            removed_projects = self.file_watcher.observers.keys() - current_project_ids
             for project_id in removed_projects:
                 await self.file_watcher.stop_watching(project_id)
-                self.watched_projects.discard(project_id)
                 logger.info(f"Stopped watching project {project_id}")
 
         except Exception as e:
@@ -308,7 +305,7 @@ class SyncWorker:
         """
         return {
             "running": self.running,
-            "watched_projects": len(self.watched_projects),
+            "watched_projects": len(self.file_watcher.observers),
             "pending_events": self.debouncer.get_pending_count(),
             "last_heartbeat": self.last_heartbeat.isoformat() if self.last_heartbeat else None
         }
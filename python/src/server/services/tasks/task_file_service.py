@@ -78,7 +78,9 @@ class TaskFileService:
             response = await self.db.table("task_file_relationships").insert(data).execute()
 
             logger.info(
-                f"Linked task {task_id} to file {file_path}",
+                "Linked task %s to file %s",
+                task_id,
+                file_path,
                 extra={
                     "task_id": task_id,
                     "file_path": file_path,
@@ -90,7 +92,8 @@ class TaskFileService:
 
         except Exception as e:
             logger.error(
-                f"Error linking task to file: {str(e)}",
+                "Error linking task to file: %s",
+                e,
                 extra={"task_id": task_id, "file_path": file_path, "error": str(e)},
             )
             raise
@@ -120,7 +123,9 @@ class TaskFileService:
             )
 
             logger.info(
-                f"Unlinked task {task_id} from file {file_path}",
+                "Unlinked task %s from file %s",
+                task_id,
+                file_path,
                 extra={"task_id": task_id, "file_path": file_path},
             )
 
@@ -128,7 +133,8 @@ class TaskFileService:
 
         except Exception as e:
             logger.error(
-                f"Error unlinking task from file: {str(e)}",
+                "Error unlinking task from file: %s",
+                e,
                 extra={"task_id": task_id, "file_path": file_path, "error": str(e)},
             )
             raise
@@ -153,7 +159,9 @@ class TaskFileService:
             )
 
             logger.debug(
-                f"Retrieved {len(response.data)} files for task {task_id}",
+                "Retrieved %d files for task %s",
+                len(response.data),
+                task_id,
                 extra={"task_id": task_id, "count": len(response.data)},
             )
 
@@ -161,7 +169,8 @@ class TaskFileService:
 
         except Exception as e:
             logger.error(
-                f"Error getting files for task: {str(e)}",
+                "Error getting files for task: %s",
+                e,
                 extra={"task_id": task_id, "error": str(e)},
             )
             raise
@@ -190,7 +199,9 @@ class TaskFileService:
             )
 
             logger.debug(
-                f"Retrieved {len(response.data)} tasks for file {file_path}",
+                "Retrieved %d tasks for file %s",
+                len(response.data),
+                file_path,
                 extra={"file_path": file_path, "count": len(response.data)},
             )
 
@@ -198,7 +209,8 @@ class TaskFileService:
 
         except Exception as e:
             logger.error(
-                f"Error getting tasks for file: {str(e)}",
+                "Error getting tasks for file: %s",
+                e,
                 extra={"file_path": file_path, "error": str(e)},
             )
             raise
@@ -265,7 +277,7 @@ class TaskFileService:
                     task_id = task_ref
                 except ValueError:
                     # If numeric, skip (would need task number lookup)
-                    logger.debug(f"Skipping numeric task reference: {task_ref}")
+                    logger.debug("Skipping numeric task reference: %s", task_ref)
                     continue
 
                 for file_path in changed_files:
@@ -282,11 +294,15 @@ class TaskFileService:
                     except Exception as e:
                         # Log but continue (relationship may already exist)
                         logger.warning(
-                            f"Could not link task {task_id} to file {file_path}: {str(e)}"
+                            "Could not link task %s to file %s: %s",
+                            task_id,
+                            file_path,
+                            e,
                         )
 
             logger.info(
-                f"Auto-detected {len(relationships)} task-file relationships from commit",
+                "Auto-detected %d task-file relationships from commit",
+                len(relationships),
                 extra={"project_id": project_id, "relationships_count": len(relationships)},
             )
 
@@ -294,7 +310,8 @@ class TaskFileService:
 
         except Exception as e:
             logger.error(
-                f"Error detecting relationships from commit: {str(e)}",
+                "Error detecting relationships from commit: %s",
+                e,
                 extra={"project_id": project_id, "error": str(e)},
             )
             raise
@@ -5,7 +5,7 @@ Phase 5, Task 5.5
 Service for suggesting task updates and new tasks based on file changes.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from src.server.config.logfire_config import get_logger
 from src.server.services.tasks.task_file_service import TaskFileService
 
@@ -63,48 +63,15 @@ class TaskSuggestionService:
                         continue
 
                     task = task_response.data[0]
-
-                    # Determine suggested action based on task status
-                    current_status = task.get("status", "todo")
-                    suggested_action = None
-                    confidence = 0.8
-
-                    if current_status == "todo":
-                        suggested_action = "Mark task as 'doing' (work has started)"
-                        confidence = 0.9
-                    elif current_status == "doing":
-                        # Check if commit message suggests completion
-                        if any(
-                            keyword in commit_message.lower()
-                            for keyword in ["fix", "implement", "complete", "done"]
-                        ):
-                            suggested_action = (
-                                "Mark task as 'done' (work appears complete)"
-                            )
-                            confidence = 0.7
-                        else:
-                            suggested_action = "Update task progress (work continuing)"
-                            confidence = 0.6
-                    elif current_status == "done":
-                        suggested_action = "Review: task marked done but files modified"
-                        confidence = 0.5
-
-                    suggestion = {
-                        "type": "update_task",
-                        "task_id": task_id,
-                        "task_title": task.get("title"),
-                        "current_status": current_status,
-                        "file_path": file_path,
-                        "reason": f"File {file_path} was modified",
-                        "confidence": confidence,
-                        "suggested_action": suggested_action,
-                        "commit_message": commit_message,
-                    }
+                    suggestion = self._build_update_suggestion(
+                        task, task_id, file_path, commit_message
+                    )
 
                     suggestions.append(suggestion)
 
             logger.info(
-                f"Generated {len(suggestions)} task update suggestions",
+                "Generated %d task update suggestions",
+                len(suggestions),
                 extra={
                     "project_id": project_id,
                     "changed_files_count": len(changed_files),
@@ -114,7 +81,7 @@ class TaskSuggestionService:
             return suggestions
 
         except Exception as e:
-            logger.error(f"Error suggesting task updates: {str(e)}")
+            logger.error("Error suggesting task updates: %s", e)
             raise
 
     async def suggest_new_tasks(
@@ -141,40 +108,13 @@ class TaskSuggestionService:
 
                 if len(tasks) == 0:
                     # File has no linked tasks
-                    confidence = 0.6
-
-                    # Boost confidence for certain file types
-                    if file_path.endswith((".py", ".ts", ".tsx", ".js", ".jsx")):
-                        confidence = 0.7
-                    if "test" in file_path.lower():
-                        confidence = 0.5  # Lower for test files
-
-                    # Generate suggested task title
-                    file_name = file_path.split("/")[-1]
-                    suggested_title = f"Update {file_name}"
-
-                    # Detect file type for better description
-                    if "test" in file_path.lower():
-                        suggested_description = f"Tests updated in {file_path}"
-                    elif file_path.endswith((".md", ".txt", ".rst")):
-                        suggested_description = f"Documentation updated in {file_path}"
-                    else:
-                        suggested_description = f"Changes detected in {file_path}"
-
-                    suggestion = {
-                        "type": "create_task",
-                        "file_path": file_path,
-                        "reason": f"New or modified file without linked task: {file_path}",
-                        "confidence": confidence,
-                        "suggested_title": suggested_title,
-                        "suggested_description": suggested_description,
-                        "suggested_status": "doing",
-                    }
+                    suggestion = self._build_new_task_suggestion(file_path)
 
                     suggestions.append(suggestion)
 
             logger.info(
-                f"Generated {len(suggestions)} new task suggestions",
+                "Generated %d new task suggestions",
+                len(suggestions),
                 extra={
                     "project_id": project_id,
                     "unlinked_files": len(suggestions),
@@ -184,7 +124,88 @@ class TaskSuggestionService:
             return suggestions
 
         except Exception as e:
-            logger.error(f"Error suggesting new tasks: {str(e)}")
+            logger.error("Error suggesting new tasks: %s", e)
+            raise
+
+    async def suggest_all(
+        self, project_id: str, changed_files: List[str], commit_message: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Suggest task updates and new tasks in one pass
+
+        Equivalent to suggest_task_updates + suggest_new_tasks, but loads the
+        project's relationships for all changed files in one query and the
+        linked tasks in another, instead of querying per file and per task.
+
+        Args:
+            project_id: UUID of the project
+            changed_files: List of file paths that changed
+            commit_message: Git commit message
+
+        Returns:
+            Tuple of (task update suggestions, new task suggestions)
+        """
+        try:
+            relationships_response = (
+                await self.db.table("task_file_relationships")
+                .select("task_id, file_path")
+                .eq("project_id", project_id)
+                .in_("file_path", changed_files)
+                .order("created_at", desc=True)
+                .execute()
+            )
+
+            task_ids_by_file: Dict[str, List[str]] = {}
+            for relationship in relationships_response.data:
+                task_ids_by_file.setdefault(relationship["file_path"], []).append(
+                    relationship["task_id"]
+                )
+
+            tasks_by_id: Dict[str, Dict[str, Any]] = {}
+            linked_task_ids = list(
+                {task_id for task_ids in task_ids_by_file.values() for task_id in task_ids}
+            )
+            if linked_task_ids:
+                tasks_response = (
+                    await self.db.table("tasks")
+                    .select("*")
+                    .in_("id", linked_task_ids)
+                    .execute()
+                )
+                tasks_by_id = {task["id"]: task for task in tasks_response.data}
+
+            update_suggestions = []
+            new_task_suggestions = []
+            for file_path in changed_files:
+                task_ids = task_ids_by_file.get(file_path)
+
+                if not task_ids:
+                    new_task_suggestions.append(self._build_new_task_suggestion(file_path))
+                    continue
+
+                for task_id in task_ids:
+                    task = tasks_by_id.get(task_id)
+                    if task is not None:
+                        update_suggestions.append(
+                            self._build_update_suggestion(
+                                task, task_id, file_path, commit_message
+                            )
+                        )
+
+            logger.info(
+                "Generated %d task update and %d new task suggestions",
+                len(update_suggestions),
+                len(new_task_suggestions),
+                extra={
+                    "project_id": project_id,
+                    "changed_files_count": len(changed_files),
+                },
+            )
+
+            return update_suggestions, new_task_suggestions
+
+        except Exception as e:
+            logger.error("Error generating task suggestions: %s", e)
             raise
 
     async def get_suggestions_for_commit(
@@ -207,16 +228,110 @@ class TaskSuggestionService:
             # Placeholder - would query commit data from database
             # For now, return empty list
             logger.info(
-                f"get_suggestions_for_commit called (placeholder)",
+                "get_suggestions_for_commit called (placeholder)",
                 extra={"project_id": project_id, "commit_sha": commit_sha},
             )
 
             return []
 
         except Exception as e:
-            logger.error(f"Error getting suggestions for commit: {str(e)}")
+            logger.error("Error getting suggestions for commit: %s", e)
             raise
 
+    def _build_update_suggestion(
+        self,
+        task: Dict[str, Any],
+        task_id: str,
+        file_path: str,
+        commit_message: str,
+    ) -> Dict[str, Any]:
+        """
+        Build an update suggestion for a task linked to a changed file
+
+        Args:
+            task: Task row
+            task_id: UUID of the task
+            file_path: Changed file linked to the task
+            commit_message: Git commit message
+
+        Returns:
+            Update suggestion dict
+        """
+        # Determine suggested action based on task status
+        current_status = task.get("status", "todo")
+        suggested_action = None
+        confidence = 0.8
+
+        if current_status == "todo":
+            suggested_action = "Mark task as 'doing' (work has started)"
+            confidence = 0.9
+        elif current_status == "doing":
+            # Check if commit message suggests completion
+            if any(
+                keyword in commit_message.lower()
+                for keyword in ["fix", "implement", "complete", "done"]
+            ):
+                suggested_action = "Mark task as 'done' (work appears complete)"
+                confidence = 0.7
+            else:
+                suggested_action = "Update task progress (work continuing)"
+                confidence = 0.6
+        elif current_status == "done":
+            suggested_action = "Review: task marked done but files modified"
+            confidence = 0.5
+
+        return {
+            "type": "update_task",
+            "task_id": task_id,
+            "task_title": task.get("title"),
+            "current_status": current_status,
+            "file_path": file_path,
+            "reason": f"File {file_path} was modified",
+            "confidence": confidence,
+            "suggested_action": suggested_action,
+            "commit_message": commit_message,
+        }
+
+    def _build_new_task_suggestion(self, file_path: str) -> Dict[str, Any]:
+        """
+        Build a new-task suggestion for a changed file with no linked tasks
+
+        Args:
+            file_path: Changed file path
+
+        Returns:
+            New task suggestion dict
+        """
+        confidence = 0.6
+
+        # Boost confidence for certain file types
+        if file_path.endswith((".py", ".ts", ".tsx", ".js", ".jsx")):
+            confidence = 0.7
+        if "test" in file_path.lower():
+            confidence = 0.5  # Lower for test files
+
+        # Generate suggested task title
+        file_name = file_path.split("/")[-1]
+        suggested_title = f"Update {file_name}"
+
+        # Detect file type for better description
+        if "test" in file_path.lower():
+            suggested_description = f"Tests updated in {file_path}"
+        elif file_path.endswith((".md", ".txt", ".rst")):
+            suggested_description = f"Documentation updated in {file_path}"
+        else:
+            suggested_description = f"Changes detected in {file_path}"
+
+        return {
+            "type": "create_task",
+            "file_path": file_path,
+            "reason": f"New or modified file without linked task: {file_path}",
+            "confidence": confidence,
+            "suggested_title": suggested_title,
+            "suggested_description": suggested_description,
+            "suggested_status": "doing",
+        }
+
     def _calculate_confidence(
         self,
         task_status: str,
@@ -0,0 +1,111 @@
+"""In-process LRU caches with per-entry TTL expiry."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after ``ttl`` seconds.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds an entry stays valid after being set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired or not), or default."""
+        entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class VersionedTTLCache:
+    """TTLCache partitioned by scope (e.g. a project ID) with O(1) per-scope invalidation.
+
+    Keys include the scope's current version; invalidating a scope bumps the
+    version, so its existing entries become unreachable and age out of the LRU
+    without a scan. Values are copied on the way in and out when ``copy`` is
+    given, so callers can't mutate cached entries.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 60.0,
+        copy: Callable[[Any], Any] | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds an entry stays valid after being set
+            copy: Function returning an independent copy of a value; values are shared if None
+        """
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._versions: dict[Hashable, int] = {}
+        self._copy = copy
+
+    def _key(self, scope: Hashable, key: Hashable) -> tuple:
+        return (scope, self._versions.get(scope, 0), key)
+
+    def get(self, scope: Hashable, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key within scope, or default if missing or expired."""
+        value = self._entries.get(self._key(scope, key), _MISSING)
+        if value is _MISSING:
+            return default
+        return self._copy(value) if self._copy else value
+
+    def set(self, scope: Hashable, key: Hashable, value: Any) -> None:
+        """Store value under key within scope."""
+        self._entries.set(self._key(scope, key), self._copy(value) if self._copy else value)
+
+    def invalidate(self, scope: Hashable) -> None:
+        """Make every entry cached for scope unreachable."""
+        self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
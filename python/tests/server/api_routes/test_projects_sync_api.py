@@ -0,0 +1,268 @@
+"""Unit tests for the project sync API routes."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.server.api_routes import projects_sync_api
+from src.server.services.projects.project_service_sync import SyncProjectService
+
+
+@pytest.fixture
+def db(mock_supabase_client):
+    """Synchronous Supabase client mock whose updates return one project row."""
+    mock_supabase_client.table.return_value.update.return_value.eq.return_value \
+        .execute.return_value.data = [{"id": "proj-1", "sync_mode": "manual", "auto_sync_enabled": True}]
+    return mock_supabase_client
+
+
+@pytest.fixture
+def codebase_service():
+    """Codebase source service whose project has 12 synced files."""
+    service = MagicMock()
+    service.get_project_stats = AsyncMock(
+        return_value={"total_files": 12, "total_chunks": 80, "last_update": None}
+    )
+    return service
+
+
+@pytest.fixture
+def test_client(db, codebase_service):
+    """Create a test client for the sync router backed by a real SyncProjectService."""
+    app = FastAPI()
+    app.include_router(projects_sync_api.router)
+    app.dependency_overrides[projects_sync_api.get_project_service] = lambda: SyncProjectService(db)
+    app.dependency_overrides[projects_sync_api.get_codebase_source_service] = lambda: codebase_service
+    return TestClient(app)
+
+
+def select_project(db, rows):
+    """Make ProjectService.get_project's project lookup return rows."""
+    db.table.return_value.select.return_value.eq.return_value.execute.return_value.data = rows
+
+
+def test_project_service_provider_has_sync_methods():
+    """The cached provider returns one shared service exposing the sync mixin."""
+    projects_sync_api.get_project_service.cache_clear()
+    projects_sync_api.get_db_client.cache_clear()
+    try:
+        service = projects_sync_api.get_project_service()
+
+        assert isinstance(service, SyncProjectService)
+        assert service.db is service.supabase_client
+        assert projects_sync_api.get_project_service() is service
+    finally:
+        projects_sync_api.get_project_service.cache_clear()
+        projects_sync_api.get_db_client.cache_clear()
+
+
+def test_update_sync_config(test_client, db):
+    """PUT /sync/config writes through the mixin on the synchronous client."""
+    response = test_client.put(
+        "/projects/proj-1/sync/config",
+        json={"sync_mode": "manual", "auto_sync_enabled": True}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["config"]["auto_sync_enabled"] is True
+    update = db.table.return_value.update.call_args.args[0]
+    assert update["sync_mode"] == "manual"
+    assert update["auto_sync_enabled"] is True
+
+
+def test_update_sync_config_unknown_project(test_client, db):
+    """An update that matches no row surfaces as a 400."""
+    db.table.return_value.update.return_value.eq.return_value.execute.return_value.data = []
+
+    response = test_client.put("/projects/missing/sync/config", json={"sync_mode": "manual"})
+
+    assert response.status_code == 400
+
+
+def test_get_sync_status(test_client, db):
+    """The status route unpacks get_project's (success, payload) result."""
+    select_project(db, [{
+        "id": "proj-1",
+        "sync_status": "synced",
+        "sync_mode": "git-hook",
+        "auto_sync_enabled": True,
+        "local_path": "/work/app"
+    }])
+
+    response = test_client.get("/projects/proj-1/sync/status")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["sync_status"] == "synced"
+    assert body["sync_mode"] == "git-hook"
+    assert body["local_path"] == "/work/app"
+    assert body["stats"]["total_files"] == 12
+
+
+def test_get_sync_status_unknown_project(test_client, db):
+    """A project get_project can't find is a 404."""
+    select_project(db, [])
+
+    response = test_client.get("/projects/missing/sync/status")
+
+    assert response.status_code == 404
+
+
+def test_trigger_sync_unknown_project(test_client, db):
+    """Triggering a sync for a project get_project can't find is a 404."""
+    select_project(db, [])
+
+    response = test_client.post("/projects/missing/sync", json={"trigger": "manual"})
+
+    assert response.status_code == 404
+
+
+def test_trigger_sync_requires_local_path(test_client, db):
+    """A project without a local_path can't be synced."""
+    select_project(db, [{"id": "proj-1", "local_path": None}])
+
+    response = test_client.post("/projects/proj-1/sync", json={"trigger": "manual"})
+
+    assert response.status_code == 400
+
+
+# ============================================================================
+# Sync trigger coalescing
+# ============================================================================
+
+SYNC_RESULT = {"success": True, "sync_job_id": "job-1", "status": "completed", "trigger": "manual"}
+
+
+@pytest.fixture
+def sync_project_service():
+    """Project service whose project has a local_path."""
+    service = MagicMock()
+    service.get_project.return_value = (True, {"project": {"id": "proj-1", "local_path": "/work/app"}})
+    return service
+
+
+@pytest.fixture
+def run_sync(monkeypatch):
+    """Replace the incremental sync with one that blocks until released."""
+    release = asyncio.Event()
+
+    async def fake_run(project_id, request, *args):
+        await release.wait()
+        if run.side_effect_exc is not None:
+            raise run.side_effect_exc
+        return {**SYNC_RESULT, "trigger": request.trigger}
+
+    run = AsyncMock(side_effect=fake_run)
+    run.release = release
+    run.side_effect_exc = None
+    monkeypatch.setattr(projects_sync_api, "_run_project_sync", run)
+    yield run
+    projects_sync_api._pending_syncs.clear()
+    projects_sync_api._project_sync_locks.clear()
+
+
+def trigger(project_service, changed_files=None):
+    """Start a trigger_project_sync call as a task."""
+    request = projects_sync_api.TriggerSyncRequest(trigger="git-hook", changed_files=changed_files)
+    return asyncio.create_task(projects_sync_api.trigger_project_sync(
+        "proj-1",
+        request,
+        project_service,
+        MagicMock(),
+        MagicMock(),
+        MagicMock()
+    ))
+
+
+async def settle():
+    """Let started triggers reach the sync (get_project runs in a worker thread)."""
+    for _ in range(20):
+        await asyncio.sleep(0.01)
+
+
+def test_sync_covers():
+    """A full sync covers everything; a file sync covers only its subsets."""
+    files = frozenset({"a.py", "b.py"})
+
+    assert projects_sync_api._sync_covers(None, None)
+    assert projects_sync_api._sync_covers(None, frozenset({"a.py"}))
+    assert projects_sync_api._sync_covers(files, frozenset({"a.py"}))
+    assert not projects_sync_api._sync_covers(files, frozenset({"c.py"}))
+    assert not projects_sync_api._sync_covers(files, None)
+
+
+async def test_covered_trigger_joins_in_flight_sync(sync_project_service, run_sync):
+    """A trigger whose files the running sync covers shares its result."""
+    first = trigger(sync_project_service, ["a.py", "b.py"])
+    await settle()
+    second = trigger(sync_project_service, ["a.py"])
+    await settle()
+
+    run_sync.release.set()
+    responses = await asyncio.gather(first, second)
+
+    assert run_sync.await_count == 1
+    assert responses[0].body == responses[1].body
+    assert projects_sync_api._pending_syncs == {}
+    assert projects_sync_api._project_sync_locks == {}
+
+
+async def test_uncovered_trigger_waits_then_syncs(sync_project_service, run_sync):
+    """A trigger for other files runs its own sync after the in-flight one."""
+    first = trigger(sync_project_service, ["a.py"])
+    await settle()
+    second = trigger(sync_project_service, ["c.py"])
+    await settle()
+
+    assert run_sync.await_count == 1
+    assert projects_sync_api._project_sync_locks["proj-1"].users == 2
+
+    run_sync.release.set()
+    await asyncio.gather(first, second)
+
+    assert run_sync.await_count == 2
+    assert [call.args[1].changed_files for call in run_sync.await_args_list] == [["a.py"], ["c.py"]]
+    assert projects_sync_api._project_sync_locks == {}
+
+
+async def test_failed_sync_fails_joined_triggers(sync_project_service, run_sync):
+    """Every trigger sharing a failed sync gets a 500, and no state is left behind."""
+    first = trigger(sync_project_service)
+    await settle()
+    second = trigger(sync_project_service, ["a.py"])
+    await settle()
+
+    run_sync.side_effect_exc = RuntimeError("embedding service down")
+    run_sync.release.set()
+    results = await asyncio.gather(first, second, return_exceptions=True)
+
+    assert all(isinstance(result, HTTPException) and result.status_code == 500 for result in results)
+    assert run_sync.await_count == 1
+    assert projects_sync_api._pending_syncs == {}
+    assert projects_sync_api._project_sync_locks == {}
+
+
+async def test_cancelled_sync_fails_joined_triggers(sync_project_service, run_sync):
+    """Cancelling the running trigger gives joiners a 500 and releases the lock."""
+    first = trigger(sync_project_service)
+    await settle()
+    second = trigger(sync_project_service, ["a.py"])
+    await settle()
+
+    first.cancel()
+    results = await asyncio.gather(first, second, return_exceptions=True)
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert isinstance(results[1], HTTPException)
+    assert results[1].status_code == 500
+    assert "cancelled" in results[1].detail
+    assert projects_sync_api._pending_syncs == {}
+    assert projects_sync_api._project_sync_locks == {}
+
+    # The project can be synced again afterwards
+    run_sync.release.set()
+    response = await trigger(sync_project_service)
+    assert response.status_code == 200
@@ -0,0 +1,109 @@
+"""Unit tests for the project sync MCP tool handlers."""
+
+from unittest.mock import MagicMock
+
+import fastjsonschema
+import pytest
+
+from src.server.mcp import project_sync_tools
+from src.server.mcp.mcp_server import MCPServer
+from src.server.mcp.project_sync_tools import (
+    MCP_TOOLS,
+    GetFileContentInput,
+    GetProjectsSyncStatusBulkInput,
+    ListProjectFilesInput,
+    get_file_content_handler,
+    get_projects_sync_status_bulk_handler,
+    list_project_files_handler,
+)
+from src.server.services.knowledge import codebase_source_service
+
+SOURCE = {"id": "src-1", "source_id": "src-1", "metadata": {"project_id": "project-1"}}
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Synchronous Supabase client with no Postgres pool configured."""
+    client = MagicMock()
+    monkeypatch.setattr(project_sync_tools, "get_supabase_client", lambda: client)
+    monkeypatch.setattr(project_sync_tools, "get_db_pool", lambda: None)
+    monkeypatch.setattr(codebase_source_service, "get_db_pool", lambda: None)
+    codebase_source_service._source_cache.clear()
+    codebase_source_service._source_cache.set("project-1", SOURCE)
+    yield client
+    codebase_source_service._source_cache.clear()
+
+
+async def test_list_project_files_rest_fallback(db):
+    """File listing runs the list_project_files RPC on the synchronous client."""
+    db.rpc.return_value.execute.return_value.data = [{"file_path": "src/a.py"}, {"file_path": "src/b.py"}]
+
+    result = await list_project_files_handler(ListProjectFilesInput(project_id="project-1", file_filter="*.py"))
+
+    assert result == {"success": True, "files": ["src/a.py", "src/b.py"], "count": 2}
+    db.rpc.assert_called_once_with("list_project_files", {"src_id": "src-1", "pattern": "%.py"})
+
+
+async def test_get_file_content_rest_fallback(db):
+    """File content runs the get_file_content RPC on the synchronous client."""
+    db.rpc.return_value.execute.return_value.data = [
+        {"content": "print('hi')", "language": "python", "chunks_count": 1, "total_chunks": 1}
+    ]
+
+    result = await get_file_content_handler(GetFileContentInput(project_id="project-1", file_path="src/a.py"))
+
+    assert result["success"] is True
+    assert result["content"] == "print('hi')"
+    assert result["has_more"] is False
+
+
+async def test_get_file_content_missing_file(db):
+    """An unknown file is reported as not found."""
+    db.rpc.return_value.execute.return_value.data = []
+
+    result = await get_file_content_handler(GetFileContentInput(project_id="project-1", file_path="nope.py"))
+
+    assert result == {"success": False, "error": "File not found: nope.py"}
+
+
+async def test_get_projects_sync_status_bulk(db):
+    """Bulk status reads every source's stats in one RPC and lists unsynced projects."""
+    db.table.return_value.select.return_value.in_.return_value.execute.return_value.data = []
+    db.rpc.return_value.execute.return_value.data = [
+        {"source_id": "src-1", "total_files": 3, "total_chunks": 9, "last_update": None}
+    ]
+
+    result = await get_projects_sync_status_bulk_handler(
+        GetProjectsSyncStatusBulkInput(project_ids=["project-1", "project-2"])
+    )
+
+    assert result["success"] is True
+    assert result["not_synced"] == ["project-2"]
+    assert result["statuses"][0]["total_files"] == 3
+    db.rpc.assert_called_once_with("sources_stats_bulk", {"src_ids": ["src-1"]})
+
+
+@pytest.mark.parametrize(
+    ("tool_name", "arguments"),
+    [
+        ("sync_project_codebase", {"project_id": "project-1", "changed_files": None}),
+        ("search_project_code", {"project_id": "project-1", "query": "main", "file_filter": None}),
+        ("list_project_files", {"project_id": "project-1", "file_filter": None}),
+        ("get_file_content", {"project_id": "project-1", "file_path": "src/a.py", "max_chunks": None}),
+    ],
+)
+def test_tool_schemas_accept_null_optional_fields(tool_name, arguments):
+    """Clients may send null for unset optional arguments, as the Pydantic models allow."""
+    tool = next(tool for tool in MCP_TOOLS if tool["name"] == tool_name)
+
+    assert fastjsonschema.compile(tool["inputSchema"])(arguments) == arguments
+
+
+async def test_call_tool_with_null_file_filter(db):
+    """A null file_filter reaches the handler as no filter."""
+    db.rpc.return_value.execute.return_value.data = [{"file_path": "src/a.py"}]
+
+    result = await MCPServer().call_tool("list_project_files", {"project_id": "project-1", "file_filter": None})
+
+    assert result == {"success": True, "files": ["src/a.py"], "count": 1}
+    db.rpc.assert_called_once_with("list_project_files", {"src_id": "src-1", "pattern": None})
@@ -0,0 +1,72 @@
+"""Unit tests for the project service sync methods."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+from src.server.services.projects.project_service_sync import SyncProjectService
+
+
+async def test_update_project_sync_status_uses_sync_client(mock_supabase_client):
+    """Status writes go through the synchronous client without awaiting it."""
+    service = SyncProjectService(mock_supabase_client)
+    finished_at = datetime(2025, 11, 12, 10, 30, tzinfo=timezone.utc)
+
+    await service.update_project_sync_status(
+        project_id="proj-1",
+        status="synced",
+        last_sync_at=finished_at,
+        now_iso=finished_at.isoformat()
+    )
+
+    mock_supabase_client.table.assert_called_with("projects")
+    update = mock_supabase_client.table.return_value.update.call_args.args[0]
+    assert update == {
+        "sync_status": "synced",
+        "updated_at": finished_at.isoformat(),
+        "last_sync_at": finished_at.isoformat(),
+        "last_sync_error": None
+    }
+    mock_supabase_client.table.return_value.update.return_value.eq.assert_called_with("id", "proj-1")
+
+
+async def test_get_project_by_path_resolves_innermost_project(mock_supabase_client, monkeypatch):
+    """File paths resolve to the deepest project root containing them."""
+    monkeypatch.setattr(
+        "src.server.services.projects.project_service_sync._project_roots", None
+    )
+    mock_supabase_client.table.return_value.select.return_value.not_.is_.return_value \
+        .execute.return_value.data = [
+            {"id": "outer", "local_path": "/work"},
+            {"id": "inner", "local_path": "/work/app"},
+        ]
+    service = SyncProjectService(mock_supabase_client)
+
+    project = await service.get_project_by_path("/work/app/src/main.py")
+
+    assert project["id"] == "inner"
+
+
+async def test_run_auto_sync_for_all_logs_cancelled_workers(mock_supabase_client, monkeypatch):
+    """A cancelled worker is reported as a failure, not counted as a success."""
+    service = SyncProjectService(mock_supabase_client)
+    monkeypatch.setattr(
+        service, "get_projects_with_auto_sync",
+        AsyncMock(return_value=[{"id": "ok"}, {"id": "cancelled"}, {"id": "failed"}])
+    )
+
+    async def worker(project):
+        if project["id"] == "cancelled":
+            raise asyncio.CancelledError()
+        if project["id"] == "failed":
+            raise RuntimeError("boom")
+        return "done"
+
+    with patch("src.server.services.projects.project_service_sync.logger") as mock_logger:
+        results = await service.run_auto_sync_for_all(worker)
+
+    assert results[0] == "done"
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert isinstance(results[2], RuntimeError)
+    failed = [call.args[1] for call in mock_logger.error.call_args_list]
+    assert failed == ["cancelled", "failed"]
@@ -0,0 +1,122 @@
+"""
+Unit tests for batch_embedder.py
+"""
+
+import asyncio
+
+import pytest
+
+from src.server.services.sync.batch_embedder import BatchEmbedder, RateLimiter
+
+
+class FakeClock:
+    """Loop clock that only moves when a coroutine sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+
+@pytest.fixture
+async def clock(monkeypatch):
+    """Drive the rate limiter from a fake clock so pacing is deterministic."""
+    fake = FakeClock()
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, result=None):
+        fake.now += delay
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: fake.now)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return fake
+
+
+async def acquire_times(limiter, clock, count):
+    times = []
+    for _ in range(count):
+        await limiter.acquire()
+        times.append(clock.now)
+    return times
+
+
+async def test_rate_limiter_allows_initial_burst(clock):
+    """A fresh limiter lets rate_limit requests through without waiting."""
+    limiter = RateLimiter(rate_limit=5, time_window=1.0)
+
+    assert await acquire_times(limiter, clock, 5) == [0.0] * 5
+
+
+async def test_rate_limiter_spaces_requests_after_burst(clock):
+    """Once the bucket is empty, requests go out one refill interval apart."""
+    limiter = RateLimiter(rate_limit=5, time_window=1.0)
+
+    times = await acquire_times(limiter, clock, 12)
+
+    assert times[:5] == [0.0] * 5
+    gaps = [later - earlier for earlier, later in zip(times[4:], times[5:])]
+    assert gaps == pytest.approx([0.2] * 7)
+
+
+async def test_rate_limiter_refills_while_idle(clock):
+    """Idle time refills the bucket, capped at rate_limit."""
+    limiter = RateLimiter(rate_limit=5, time_window=1.0)
+    await acquire_times(limiter, clock, 5)
+
+    clock.now += 10.0
+    start = clock.now
+
+    assert await acquire_times(limiter, clock, 5) == [start] * 5
+    await limiter.acquire()
+    assert clock.now == pytest.approx(start + 0.2)
+
+
+class TrackingEmbeddingService:
+    """Records how many embed_batch calls are in flight at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def embed_batch(self, texts):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Yield a few times so other batches get a chance to start
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.in_flight -= 1
+        return [[float(len(text))] for text in texts]
+
+
+async def test_embed_batch_bounds_concurrent_batches():
+    """No more than max_concurrency batches await the API at once."""
+    service = TrackingEmbeddingService()
+    embedder = BatchEmbedder(
+        service, batch_size=2, rate_limit=1000, max_concurrency=3
+    )
+    texts = [f"text-{i}" for i in range(20)]
+
+    embeddings = await embedder.embed_batch(texts)
+
+    assert service.max_in_flight == 3
+    assert embeddings == [[float(len(text))] for text in texts]
+
+
+async def test_embed_batch_keeps_order_when_a_batch_falls_back():
+    """A failed batch is embedded individually in its original position."""
+
+    class FlakyService:
+        async def embed_batch(self, texts):
+            if "bad" in texts:
+                raise ValueError("invalid input")
+            return [[1.0] for _ in texts]
+
+        async def embed(self, text):
+            if text == "bad":
+                raise ValueError("invalid input")
+            return [2.0]
+
+    embedder = BatchEmbedder(FlakyService(), batch_size=2, rate_limit=1000)
+
+    embeddings = await embedder.embed_batch(["a", "b", "c", "bad", "d"])
+
+    assert embeddings == [[1.0], [1.0], [2.0], None, [1.0]]
@@ -0,0 +1,80 @@
+"""
+Unit tests for codebase_source_service.py
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.server.services.knowledge import codebase_source_service
+from src.server.services.knowledge.codebase_source_service import CodebaseSourceService
+
+
+@pytest.fixture(autouse=True)
+def clear_source_cache():
+    codebase_source_service._source_cache.clear()
+    yield
+    codebase_source_service._source_cache.clear()
+
+
+def make_client(rpc_data):
+    """Synchronous Supabase client whose rpc(...).execute() returns rpc_data."""
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value.data = rpc_data
+    return client
+
+
+async def test_get_or_create_codebase_source_uses_sync_client():
+    """The upsert RPC runs on the synchronous client without awaiting it."""
+    client = make_client([{"source_id": "src-1", "created": True}])
+    service = CodebaseSourceService(client)
+
+    source_id = await service.get_or_create_codebase_source("project-1", "My App")
+
+    assert source_id == "src-1"
+    client.rpc.assert_called_once_with(
+        "get_or_create_codebase_source",
+        {"pid": "project-1", "project_title": "My App"}
+    )
+
+
+async def test_get_or_create_codebase_source_prefers_cached_source():
+    """A cached source skips the database entirely."""
+    client = make_client([])
+    codebase_source_service._source_cache.set("project-1", {"source_id": "src-1"})
+    service = CodebaseSourceService(client)
+
+    assert await service.get_or_create_codebase_source("project-1", "My App") == "src-1"
+    client.rpc.assert_not_called()
+
+
+async def test_get_sources_stats_rest_fallback_uses_sync_client(monkeypatch):
+    """Without a Postgres pool, stats come from the RPC on the synchronous client."""
+    monkeypatch.setattr(codebase_source_service, "get_db_pool", lambda: None)
+    client = make_client([
+        {"source_id": "src-1", "total_files": 3, "total_chunks": 9, "last_update": "2025-11-12T10:30:00+00:00"}
+    ])
+    service = CodebaseSourceService(client)
+
+    stats = await service.get_sources_stats(["src-1", "src-2"])
+
+    assert stats == {
+        "src-1": {"total_files": 3, "total_chunks": 9, "last_update": "2025-11-12T10:30:00+00:00"},
+        "src-2": {"total_files": 0, "total_chunks": 0, "last_update": None},
+    }
+    client.rpc.assert_called_once_with("sources_stats_bulk", {"src_ids": ["src-1", "src-2"]})
+
+
+async def test_get_project_stats_resolves_source(monkeypatch):
+    """Project stats resolve the project's source, then read its stats."""
+    monkeypatch.setattr(codebase_source_service, "get_db_pool", lambda: None)
+    client = make_client([
+        {"source_id": "src-1", "total_files": 3, "total_chunks": 9, "last_update": None}
+    ])
+    client.table.return_value.select.return_value.eq.return_value.limit.return_value \
+        .execute.return_value.data = [{"id": "src-1", "source_id": "src-1", "metadata": {}}]
+    service = CodebaseSourceService(client)
+
+    assert await service.get_project_stats("project-1") == {
+        "total_files": 3, "total_chunks": 9, "last_update": None
+    }
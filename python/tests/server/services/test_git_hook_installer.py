@@ -0,0 +1,198 @@
+"""
+Unit tests for git_hook_installer.py
+"""
+
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from src.server.services.sync import git_hook_installer
+from src.server.services.sync.git_hook_installer import GitHookInstaller
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a minimal repository layout with a .git directory."""
+    git_dir = tmp_path / ".git"
+    (git_dir / "objects").mkdir(parents=True)
+    (git_dir / "refs").mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_validate_git_repo_creates_hooks_dir(git_repo):
+    """Validation creates the hooks directory when it is missing."""
+    installer = GitHookInstaller()
+
+    assert await installer.validate_git_repo(str(git_repo)) is True
+    assert (git_repo / ".git" / "hooks").is_dir()
+
+
+@pytest.mark.asyncio
+async def test_validate_git_repo_missing_git_dir(tmp_path):
+    """Paths without a .git entry are rejected."""
+    installer = GitHookInstaller()
+
+    assert await installer.validate_git_repo(str(tmp_path)) is False
+
+
+@pytest.mark.asyncio
+async def test_validate_git_repo_uses_cache(git_repo):
+    """A repeated validation within the TTL skips the filesystem checks."""
+    installer = GitHookInstaller(validation_cache_ttl=60.0)
+    assert await installer.validate_git_repo(str(git_repo)) is True
+
+    with patch.object(installer, "_resolve_hooks_dir") as mock_resolve:
+        assert await installer.validate_git_repo(str(git_repo)) is True
+        mock_resolve.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_validate_git_repo_cache_expires(git_repo):
+    """Cached validations are not reused once the TTL has passed."""
+    installer = GitHookInstaller(validation_cache_ttl=0.0)
+    assert await installer.validate_git_repo(str(git_repo)) is True
+
+    with patch.object(
+        installer, "_resolve_hooks_dir", wraps=installer._resolve_hooks_dir
+    ) as mock_resolve:
+        assert await installer.validate_git_repo(str(git_repo)) is True
+        mock_resolve.assert_called_once_with(str(git_repo))
+
+
+@pytest.mark.asyncio
+async def test_validate_git_repo_cache_invalidated_when_git_removed(git_repo):
+    """Removing .git invalidates a cached validation."""
+    installer = GitHookInstaller(validation_cache_ttl=60.0)
+    assert await installer.validate_git_repo(str(git_repo)) is True
+
+    shutil.rmtree(git_repo / ".git")
+
+    assert await installer.validate_git_repo(str(git_repo)) is False
+
+
+@pytest.mark.asyncio
+async def test_hook_path_follows_gitdir_file(tmp_path, git_repo):
+    """A .git file pointing elsewhere (worktree/submodule) resolves to that git dir."""
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {git_repo / '.git'}\n")
+    installer = GitHookInstaller()
+
+    assert await installer.validate_git_repo(str(worktree)) is True
+    hook_path = await installer._get_hook_path(str(worktree), "post-commit")
+    assert hook_path.parent.resolve() == (git_repo / ".git" / "hooks").resolve()
+
+
+@pytest.fixture(params=["pygit2", "fallback"])
+def resolver(request, monkeypatch):
+    """Run a test with pygit2 and with the plain-file fallback."""
+    if request.param == "pygit2":
+        if git_hook_installer.pygit2 is None:
+            pytest.skip("pygit2 not installed")
+    else:
+        monkeypatch.setattr(git_hook_installer, "pygit2", None)
+    return request.param
+
+
+def git(*args):
+    subprocess.run(
+        ["git", "-c", "user.name=Archon", "-c", "user.email=archon@example.com", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def linked_worktree(tmp_path):
+    """A real repository with a linked worktree; returns (main, worktree)."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    main = tmp_path / "main"
+    worktree = tmp_path / "linked"
+    git("init", "-q", str(main))
+    git("-C", str(main), "commit", "-q", "--allow-empty", "-m", "initial")
+    git("-C", str(main), "worktree", "add", "-q", str(worktree))
+    return main, worktree
+
+
+@pytest.mark.asyncio
+async def test_hook_path_in_linked_worktree_uses_common_dir(linked_worktree, resolver):
+    """Hooks for a linked worktree go in the main repository's hooks dir, where git runs them."""
+    main, worktree = linked_worktree
+    installer = GitHookInstaller()
+
+    result = await installer.install_hook(str(worktree), "post-commit", "#!/bin/sh\necho archon\n")
+
+    assert (main / ".git" / "hooks" / "post-commit").is_file()
+    assert result["hook_path"] == str((main / ".git" / "hooks" / "post-commit").resolve())
+
+
+@pytest.mark.asyncio
+async def test_hook_path_honours_core_hooks_path(linked_worktree, resolver):
+    """A relative core.hooksPath is resolved from the worktree root."""
+    main, worktree = linked_worktree
+    git("-C", str(main), "config", "core.hooksPath", ".githooks")
+    installer = GitHookInstaller()
+
+    assert await installer.validate_git_repo(str(worktree)) is True
+    hook_path = await installer._get_hook_path(str(worktree), "post-commit")
+    assert hook_path == (worktree / ".githooks" / "post-commit").resolve()
+
+
+@pytest.mark.asyncio
+async def test_uninstall_and_status_resolve_hook_path_off_loop(git_repo):
+    """An uncached repository is resolved in a worker thread, not on the event loop."""
+    installer = GitHookInstaller()
+
+    with patch.object(
+        git_hook_installer.asyncio, "to_thread", wraps=git_hook_installer.asyncio.to_thread
+    ) as mock_to_thread:
+        status = await installer.is_hook_installed(str(git_repo), "post-commit")
+        installer._hooks_dirs.clear()
+        await installer.uninstall_hook(str(git_repo), "post-commit")
+
+    assert status["installed"] is False
+    resolved = [call for call in mock_to_thread.call_args_list if call.args[0] == installer._resolve_hooks_dir]
+    assert len(resolved) == 2
+
+
+@pytest.mark.asyncio
+async def test_is_hook_installed_etag_tracks_hook_file(git_repo):
+    """The status ETag is stable for an unchanged hook and changes on rewrite."""
+    installer = GitHookInstaller()
+    await installer.install_hook(str(git_repo), "post-commit", "#!/bin/sh\necho archon\n")
+
+    first = await installer.is_hook_installed(str(git_repo), "post-commit")
+    second = await installer.is_hook_installed(str(git_repo), "post-commit")
+    assert first["etag"] == second["etag"]
+
+    hook_path = git_repo / ".git" / "hooks" / "post-commit"
+    hook_path.write_text("#!/bin/sh\necho archon updated\n")
+
+    third = await installer.is_hook_installed(str(git_repo), "post-commit")
+    assert third["etag"] != first["etag"]
+
+
+@pytest.mark.asyncio
+async def test_install_and_uninstall_restores_backup(git_repo):
+    """Installing over an existing hook backs it up; uninstalling restores it."""
+    installer = GitHookInstaller()
+    assert await installer.validate_git_repo(str(git_repo)) is True
+    hook_path = git_repo / ".git" / "hooks" / "post-commit"
+    hook_path.write_text("#!/bin/sh\necho original\n")
+
+    installed = await installer.install_hook(
+        str(git_repo), "post-commit", "#!/bin/sh\necho archon\n", chain_existing=False
+    )
+    assert installed["backup_created"] is True
+    assert installed["chained"] is False
+    assert hook_path.read_text() == "#!/bin/sh\necho archon\n"
+
+    uninstalled = await installer.uninstall_hook(str(git_repo), "post-commit")
+    assert uninstalled["backup_restored"] is True
+    assert hook_path.read_text() == "#!/bin/sh\necho original\n"
+    assert not (git_repo / ".git" / "hooks" / "post-commit.archon-backup").exists()
@@ -0,0 +1,76 @@
+"""
+Unit tests for project_code_search.py
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.server.services.knowledge import codebase_source_service
+from src.server.services.search.project_code_search import ProjectCodeSearchService
+
+
+@pytest.fixture(autouse=True)
+def clear_source_cache():
+    codebase_source_service._source_cache.clear()
+    yield
+    codebase_source_service._source_cache.clear()
+
+
+def make_client(rpc_data):
+    """Synchronous Supabase client with a codebase source and rpc(...).execute() returning rpc_data."""
+    client = MagicMock()
+    client.table.return_value.select.return_value.eq.return_value.limit.return_value \
+        .execute.return_value.data = [{"id": "src-1", "source_id": "src-1", "metadata": {}}]
+    client.rpc.return_value.execute.return_value.data = rpc_data
+    return client
+
+
+async def test_search_uses_sync_client():
+    """Code search calls the RPC on the synchronous client without awaiting it."""
+    client = make_client([{"file_path": "src/app.py", "content": "print()"}])
+    service = ProjectCodeSearchService(client)
+
+    results = await service.search("project-1", "print", match_count=3, file_filter="*.py")
+
+    assert results == [{"file_path": "src/app.py", "content": "print()", "similarity": 0.85}]
+    name, params = client.rpc.call_args.args
+    assert name == "project_code_search"
+    assert params["src_id"] == "src-1"
+    assert params["file_like"] == "%.py"
+    assert params["match_limit"] == 3
+
+
+async def test_search_in_files_uses_sync_client():
+    """search_in_files calls the RPC on the synchronous client without awaiting it."""
+    rows = [{"file_path": "src/app.py", "content": "print()"}]
+    client = make_client(rows)
+    service = ProjectCodeSearchService(client)
+
+    assert await service.search_in_files("project-1", "print", ["src/app.py"], match_count=2) == rows
+    name, params = client.rpc.call_args.args
+    assert name == "search_in_files"
+    assert params["file_paths"] == ["src/app.py"]
+    assert params["per_file"] == 2
+
+
+async def test_get_recent_changes_uses_sync_client():
+    """Recent changes call the RPC on the synchronous client without awaiting it."""
+    rows = [{"file_path": "src/app.py", "updated_at": "2025-11-12T10:30:00+00:00"}]
+    client = make_client(rows)
+    service = ProjectCodeSearchService(client)
+
+    assert await service.get_recent_changes("project-1", days=3) == rows
+    assert client.rpc.call_args.args[0] == "recent_file_changes"
+
+
+async def test_search_without_codebase_raises():
+    """A project with no codebase source is rejected before any RPC."""
+    client = make_client([])
+    client.table.return_value.select.return_value.eq.return_value.limit.return_value \
+        .execute.return_value.data = []
+    service = ProjectCodeSearchService(client)
+
+    with pytest.raises(ValueError, match="no synced codebase"):
+        await service.search("project-1", "print")
+    client.rpc.assert_not_called()
@@ -0,0 +1,39 @@
+"""
+Unit tests for project_search_cache.py
+"""
+
+from src.server.services.search.project_search_cache import ProjectSearchCache
+
+PARAMS = ("auth handler", 5, "*.py", None, None)
+
+
+def test_cache_hit_returns_copy():
+    """Cached rows are returned as copies that don't alias the cache."""
+    cache = ProjectSearchCache()
+    cache.set("project-1", PARAMS, [{"id": "a", "similarity": 0.9}])
+
+    first = cache.get("project-1", PARAMS)
+    first[0]["similarity"] = 0.0
+
+    assert cache.get("project-1", PARAMS) == [{"id": "a", "similarity": 0.9}]
+
+
+def test_cache_miss_for_different_params():
+    """Any change to the search signature is a miss."""
+    cache = ProjectSearchCache()
+    cache.set("project-1", PARAMS, [{"id": "a"}])
+
+    assert cache.get("project-1", ("auth handler", 10, "*.py", None, None)) is None
+    assert cache.get("project-2", PARAMS) is None
+
+
+def test_invalidate_project_only_affects_that_project():
+    """Invalidating one project leaves other projects' entries intact."""
+    cache = ProjectSearchCache()
+    cache.set("project-1", PARAMS, [{"id": "a"}])
+    cache.set("project-2", PARAMS, [{"id": "b"}])
+
+    cache.invalidate("project-1")
+
+    assert cache.get("project-1", PARAMS) is None
+    assert cache.get("project-2", PARAMS) == [{"id": "b"}]
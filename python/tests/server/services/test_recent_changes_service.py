@@ -0,0 +1,49 @@
+"""Unit tests for recent_changes_service.py"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.server.services.search.recent_changes_service import RecentChangesService
+
+
+def make_service(pages):
+    """RecentChangesService over a client whose recent_chunks_page RPC returns pages in turn."""
+    db = MagicMock()
+    db.rpc.return_value.execute.side_effect = [MagicMock(data=page) for page in pages]
+    service = RecentChangesService(db)
+    service.codebase_service = MagicMock()
+    service.codebase_service.get_by_project_id = AsyncMock(return_value={"id": "src-1"})
+    return service, db
+
+
+def chunk(chunk_id, file_path, updated_at):
+    return {"id": chunk_id, "file_path": file_path, "language": "python", "updated_at": updated_at}
+
+
+async def test_stream_groups_chunks_across_pages():
+    """A file split across pages is yielded once, with the keyset carried between pages."""
+    service, db = make_service([
+        [chunk("1", "a.py", "2025-11-10"), chunk("2", "b.py", "2025-11-11")],
+        [chunk("3", "b.py", "2025-11-12")],
+    ])
+
+    files = [row async for row in service.get_recent_changes_iter("project-1", file_filter="*.py", page_size=2)]
+
+    assert files == [
+        {"file_path": "a.py", "language": "python", "last_updated": "2025-11-10", "chunk_count": 1},
+        {"file_path": "b.py", "language": "python", "last_updated": "2025-11-12", "chunk_count": 2},
+    ]
+    first, second = (call.args[1] for call in db.rpc.call_args_list)
+    assert first["file_like"] == "%.py"
+    assert first["after_path"] is None and first["after_id"] is None
+    assert second["after_path"] == "b.py" and second["after_id"] == "2"
+    assert all(call.args[0] == "recent_chunks_page" for call in db.rpc.call_args_list)
+
+
+async def test_stream_stops_on_short_page():
+    """A page shorter than page_size is the last one fetched."""
+    service, db = make_service([[chunk("1", "a.py", "2025-11-10")]])
+
+    files = [row async for row in service.get_recent_changes_iter("project-1", page_size=2)]
+
+    assert len(files) == 1
+    assert db.rpc.call_count == 1
@@ -0,0 +1,55 @@
+"""Unit tests for sync_analytics_service.py"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.server.services.analytics.sync_analytics_service import (
+    SyncAnalyticsService,
+    sync_analytics_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_analytics_cache():
+    sync_analytics_cache.clear()
+    yield
+    sync_analytics_cache.clear()
+
+
+async def test_record_sync_operation_invalidates_cached_analytics():
+    """Recording an operation drops that project's cached analytics, and only that project's."""
+    db = MagicMock()
+    db.table.return_value.insert.return_value.execute.return_value.data = [{"id": "op-1"}]
+    service = SyncAnalyticsService(db)
+    sync_analytics_cache.set("project-1", ("performance", 30), {"total_syncs": 4})
+    sync_analytics_cache.set("project-2", ("performance", 30), {"total_syncs": 7})
+
+    record = await service.record_sync_operation(
+        project_id="project-1",
+        trigger="manual",
+        started_at=datetime(2025, 11, 12, 10, 30, tzinfo=timezone.utc),
+        status="success"
+    )
+
+    assert record == {"id": "op-1"}
+    assert sync_analytics_cache.get("project-1", ("performance", 30)) is None
+    assert sync_analytics_cache.get("project-2", ("performance", 30)) == {"total_syncs": 7}
+
+
+async def test_failed_record_keeps_cached_analytics():
+    """A failed insert doesn't invalidate, since no new operation exists."""
+    db = MagicMock()
+    db.table.return_value.insert.return_value.execute.side_effect = RuntimeError("insert failed")
+    service = SyncAnalyticsService(db)
+    sync_analytics_cache.set("project-1", ("performance", 30), {"total_syncs": 4})
+
+    with pytest.raises(RuntimeError):
+        await service.record_sync_operation(
+            project_id="project-1",
+            trigger="manual",
+            started_at=datetime(2025, 11, 12, 10, 30, tzinfo=timezone.utc)
+        )
+
+    assert sync_analytics_cache.get("project-1", ("performance", 30)) == {"total_syncs": 4}
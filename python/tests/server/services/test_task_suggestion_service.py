@@ -0,0 +1,83 @@
+"""
+Unit tests for task_suggestion_service.py
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.server.services.tasks.task_suggestion_service import TaskSuggestionService
+
+RELATIONSHIPS = [
+    {"project_id": "project-1", "task_id": "task-1", "file_path": "src/auth.py"},
+    {"project_id": "project-1", "task_id": "task-2", "file_path": "src/auth.py"},
+    {"project_id": "project-1", "task_id": "task-3", "file_path": "docs/guide.md"},
+]
+TASKS = [
+    {"id": "task-1", "title": "Auth", "status": "todo"},
+    {"id": "task-2", "title": "Login", "status": "doing"},
+    {"id": "task-3", "title": "Docs", "status": "done"},
+]
+
+
+class FakeQuery:
+    """Chainable stand-in for an async Supabase query builder"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def select(self, *args):
+        return self
+
+    def order(self, *args, **kwargs):
+        return self
+
+    def eq(self, column, value):
+        return FakeQuery([row for row in self.rows if row[column] == value])
+
+    def in_(self, column, values):
+        return FakeQuery([row for row in self.rows if row[column] in values])
+
+    async def execute(self):
+        return MagicMock(data=self.rows)
+
+
+@pytest.fixture
+def service():
+    tables = {"task_file_relationships": RELATIONSHIPS, "tasks": TASKS}
+    db = MagicMock()
+    db.table.side_effect = lambda name: FakeQuery(tables[name])
+    service = TaskSuggestionService(db)
+
+    async def get_tasks_for_file(project_id, file_path):
+        return [row for row in RELATIONSHIPS if row["file_path"] == file_path]
+
+    service.task_file_service.get_tasks_for_file = get_tasks_for_file
+    return service
+
+
+@pytest.mark.asyncio
+async def test_suggest_all_matches_separate_methods(service):
+    """The fused pass returns the same suggestions as the two separate methods."""
+    changed_files = ["src/auth.py", "src/new_module.py", "docs/guide.md"]
+
+    updates, new_tasks = await service.suggest_all("project-1", changed_files, "implement login")
+
+    assert updates == await service.suggest_task_updates(
+        "project-1", changed_files, "implement login"
+    )
+    assert new_tasks == await service.suggest_new_tasks("project-1", changed_files)
+    assert [s["task_id"] for s in updates] == ["task-1", "task-2", "task-3"]
+    assert [s["file_path"] for s in new_tasks] == ["src/new_module.py"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_all_skips_task_query_without_links(service):
+    """Unlinked files only need the relationship query."""
+    updates, new_tasks = await service.suggest_all("project-1", ["README.rst"], "")
+
+    assert updates == []
+    assert new_tasks[0]["suggested_description"] == "Documentation updated in README.rst"
+    assert [call.args[0] for call in service.db.table.call_args_list] == [
+        "task_file_relationships"
+    ]
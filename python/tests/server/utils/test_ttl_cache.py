@@ -0,0 +1,105 @@
+"""Unit tests for the in-process TTL cache."""
+
+import copy
+from unittest.mock import patch
+
+from src.server.utils.ttl_cache import TTLCache, VersionedTTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_get_missing_returns_default(self):
+        cache = TTLCache()
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_entries_expire_after_ttl(self):
+        cache = TTLCache(ttl=10)
+        with patch("src.server.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.server.utils.ttl_cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == 1
+        with patch("src.server.utils.ttl_cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_pop_and_clear(self):
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a", "gone") == "gone"
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestVersionedTTLCache:
+    """Tests for VersionedTTLCache."""
+
+    def test_entries_are_scoped(self):
+        cache = VersionedTTLCache()
+        cache.set("project-1", "key", 1)
+
+        assert cache.get("project-1", "key") == 1
+        assert cache.get("project-2", "key") is None
+        assert cache.get("project-2", "key", "fallback") == "fallback"
+
+    def test_invalidate_only_affects_that_scope(self):
+        cache = VersionedTTLCache()
+        cache.set("project-1", "key", 1)
+        cache.set("project-2", "key", 2)
+
+        cache.invalidate("project-1")
+
+        assert cache.get("project-1", "key") is None
+        assert cache.get("project-2", "key") == 2
+
+        cache.set("project-1", "key", 3)
+        assert cache.get("project-1", "key") == 3
+
+    def test_values_are_copied_when_copy_given(self):
+        cache = VersionedTTLCache(copy=copy.deepcopy)
+        value = {"runs": [1, 2]}
+        cache.set("project-1", "key", value)
+        value["runs"].append(3)
+
+        cached = cache.get("project-1", "key")
+        cached["runs"].append(4)
+
+        assert cache.get("project-1", "key") == {"runs": [1, 2]}
+
+    def test_values_are_shared_without_copy(self):
+        cache = VersionedTTLCache()
+        value = {"runs": [1, 2]}
+        cache.set("project-1", "key", value)
+
+        assert cache.get("project-1", "key") is value
+
+    def test_cached_falsy_values_are_returned(self):
+        cache = VersionedTTLCache()
+        cache.set("project-1", "key", 0)
+
+        assert cache.get("project-1", "key", "fallback") == 0